@@ -0,0 +1,96 @@
+"""Synthetic provider graphs: every service is a fresh class built by a generator."""
+from __future__ import annotations
+
+import inspect
+import random
+from typing import Callable, Iterator, List, Sequence
+
+from snake_di import Provider
+
+ShapeDependencies = Callable[[int], List[List[int]]]
+
+
+def chain(size: int) -> list[list[int]]:
+    return [[index - 1] if index else [] for index in range(size)]
+
+
+def fan(size: int) -> list[list[int]]:
+    return [[0] if index else [] for index in range(size)]
+
+
+def diamonds(size: int) -> list[list[int]]:
+    # 0 -> (1, 2) -> 3 -> (4, 5) -> 6 ...
+    dependencies: list[list[int]] = []
+    for index in range(size):
+        if index == 0:
+            dependencies.append([])
+        elif index % 3 == 0:
+            dependencies.append([index - 2, index - 1])
+        elif index % 3 == 1:
+            dependencies.append([index - 1])
+        else:
+            dependencies.append([index - 2])
+    return dependencies
+
+
+def random_dag(size: int, max_dependencies: int = 3, seed: int = 0) -> list[list[int]]:
+    generator = random.Random(seed)
+    return [
+        generator.sample(range(index), min(index, max_dependencies))
+        for index in range(size)
+    ]
+
+
+SHAPES: dict[str, ShapeDependencies] = {
+    "chain": chain,
+    "fan": fan,
+    "diamonds": diamonds,
+    "random_dag": random_dag,
+}
+
+
+def make_service_types(size: int) -> list[type]:
+    return [type(f"Service{index}", (), {}) for index in range(size)]
+
+
+def make_factory(service_type: type, dependencies: Sequence[type]) -> Callable:
+    def factory(*_: object) -> Iterator[object]:
+        yield service_type()
+
+    factory.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [
+            inspect.Parameter(
+                f"dependency{index}",
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=dependency,
+            )
+            for index, dependency in enumerate(dependencies)
+        ]
+    )
+    return factory
+
+
+def make_factories(shape: str, size: int) -> list[tuple[Callable, type]]:
+    service_types = make_service_types(size)
+    return [
+        (
+            make_factory(service_type, [service_types[dep] for dep in dependencies]),
+            service_type,
+        )
+        for service_type, dependencies in zip(service_types, SHAPES[shape](size))
+    ]
+
+
+def make_provider(shape: str, size: int) -> Provider:
+    provider = Provider()
+    for factory, service_type in make_factories(shape, size):
+        provider.include_factory(factory, service_type=service_type)
+    return provider
+
+
+def make_providers(shape: str, size: int) -> list[Provider]:
+    """One single-factory provider per service, to be merged with ``|``."""
+    return [
+        Provider.from_factory(factory, service_type=service_type)
+        for factory, service_type in make_factories(shape, size)
+    ]
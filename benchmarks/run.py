@@ -0,0 +1,188 @@
+"""Measure snake_di on synthetic provider graphs and write the results as JSON.
+
+Usage: python -m benchmarks.run [--sizes 10 100] [--shapes chain fan] [--output FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import functools
+import json
+import operator
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Optional, Sequence
+
+from benchmarks.graphs import SHAPES, make_provider, make_providers
+from snake_di import AsyncProvider, Provider, __version__
+from snake_di.pytest import pytest_provide
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000]
+LOOKUPS = 10_000
+
+
+def _timed(function: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def measure_plan(provider: Provider) -> dict[str, float]:
+    return {"plan_seconds": _timed(provider.build_plan)}
+
+
+def measure_build(provider: Provider, repeat: int) -> dict[str, float]:
+    builds, teardowns = [], []
+    for _ in range(repeat):
+        build = provider.build()
+        builds.append(_timed(build.__enter__))
+        teardowns.append(_timed(functools.partial(build.__exit__, None, None, None)))
+    return {"build_seconds": min(builds), "teardown_seconds": min(teardowns)}
+
+
+def measure_build_async(provider: AsyncProvider, repeat: int) -> dict[str, float]:
+    async def measure() -> dict[str, float]:
+        builds, teardowns = [], []
+        for _ in range(repeat):
+            build = provider.build_async()
+            start = time.perf_counter()
+            await build.__aenter__()
+            builds.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            await build.__aexit__(None, None, None)
+            teardowns.append(time.perf_counter() - start)
+        return {
+            "build_async_seconds": min(builds),
+            "teardown_async_seconds": min(teardowns),
+        }
+
+    return asyncio.run(measure())
+
+
+def measure_peak_memory(provider: Provider) -> dict[str, int]:
+    tracemalloc.start()
+    try:
+        with provider.build():
+            _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"build_peak_memory_bytes": peak}
+
+
+def measure_resolution(provider: Provider, repeat: int) -> dict[str, float]:
+    with provider.build() as container:
+        service_types = [
+            factory.service_type for factory in provider.build_plan().factories
+        ]
+        last = service_types[-1]
+        getitem = min(
+            timeit.repeat(lambda: container[last], number=LOOKUPS, repeat=repeat)
+        )
+        batch = (service_types[0], service_types[len(service_types) // 2], last)
+        resolve = min(
+            timeit.repeat(
+                lambda: container.resolve(*batch), number=LOOKUPS, repeat=repeat
+            )
+        )
+        injected = _injected_callable(service_types)
+        partial_solve = min(
+            timeit.repeat(
+                lambda: container.partial_solve(injected), number=LOOKUPS, repeat=repeat
+            )
+        )
+    return {
+        "getitem_seconds": getitem / LOOKUPS,
+        "resolve_seconds": resolve / LOOKUPS,
+        "partial_solve_seconds": partial_solve / LOOKUPS,
+    }
+
+
+def measure_pytest_provide(provider: Provider, repeat: int) -> dict[str, float]:
+    service_types = [
+        factory.service_type for factory in provider.build_plan().factories
+    ]
+    test = pytest_provide(provider)(_injected_callable(service_types))
+    return {"pytest_provide_seconds": min(_timed(test) for _ in range(repeat))}
+
+
+def measure_merge(shape: str, size: int) -> dict[str, float]:
+    providers = make_providers(shape, size)
+    return {
+        "merge_seconds": _timed(lambda: functools.reduce(operator.or_, providers)),
+        "merge_all_seconds": _timed(lambda: Provider.merge(*providers)),
+    }
+
+
+def _injected_callable(service_types: list[type]) -> Callable:
+    def injected(first, middle, last) -> None:
+        pass
+
+    injected.__annotations__ = {
+        "first": service_types[0],
+        "middle": service_types[len(service_types) // 2],
+        "last": service_types[-1],
+    }
+    return injected
+
+
+def run_case(shape: str, size: int, repeat: int, merge: bool) -> dict[str, Any]:
+    provider = make_provider(shape, size)
+    result: dict[str, Any] = {"shape": shape, "size": size}
+    result.update(measure_plan(provider))
+    result.update(measure_build(provider, repeat))
+    result.update(measure_build_async(AsyncProvider() | provider, repeat))
+    result.update(measure_peak_memory(provider))
+    result.update(measure_resolution(provider, repeat))
+    result.update(measure_pytest_provide(provider, repeat))
+    if merge:
+        result.update(measure_merge(shape, size))
+    return result
+
+
+def run(
+    sizes: Sequence[int],
+    shapes: Sequence[str],
+    repeat: int,
+    max_merge_size: Optional[int],
+) -> dict[str, Any]:
+    results = []
+    for shape in shapes:
+        for size in sizes:
+            merge = max_merge_size is None or size <= max_merge_size
+            results.append(run_case(shape, size, repeat, merge))
+            print(f"{shape} {size}: done", file=sys.stderr)
+    return {
+        "snake_di_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--max-merge-size",
+        type=int,
+        default=None,
+        help="skip chained `|` merges for larger graphs",
+    )
+    parser.add_argument("--output", default="benchmark-results.json")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.shapes, args.repeat, args.max_merge_size)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,39 @@
 """Simple yet powerful dependency injection framework!"""
 
+from snake_di._build_plan import BuildPlan
+from snake_di._cache import FactoryCache
+from snake_di._compiler import CompiledAsyncProvider, CompiledProvider
 from snake_di._container import Container
+from snake_di._critical_path import StartupAnalysis, factory_durations
+from snake_di._exceptions import DependencyGraphError, TeardownTimeoutError
+from snake_di._injector import Injector
+from snake_di._pool import Pool, PoolOptions, PoolStats
 from snake_di._provider import AsyncProvider, Provider
+from snake_di._tracing import ChromeTrace, TraceEvent, TraceEventKind
+from snake_di._types import Scope
+from snake_di._validation import GraphValidation
 
 __version__ = "0.0.3"
-__all__ = ["Provider", "AsyncProvider", "Container", "__version__"]
+__all__ = [
+    "Provider",
+    "AsyncProvider",
+    "Container",
+    "BuildPlan",
+    "TeardownTimeoutError",
+    "DependencyGraphError",
+    "GraphValidation",
+    "Scope",
+    "Injector",
+    "CompiledProvider",
+    "CompiledAsyncProvider",
+    "TraceEvent",
+    "TraceEventKind",
+    "ChromeTrace",
+    "StartupAnalysis",
+    "factory_durations",
+    "Pool",
+    "FactoryCache",
+    "PoolOptions",
+    "PoolStats",
+    "__version__",
+]
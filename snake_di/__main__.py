@@ -0,0 +1,60 @@
+"""Build a provider once and report its startup critical path.
+
+Usage: python -m snake_di package.module:provider [--trace trace.json]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+from typing import Optional, Sequence
+
+from snake_di._critical_path import factory_durations
+from snake_di._provider import AsyncProvider, Provider
+from snake_di._tracing import ChromeTrace
+
+
+def _import_provider(path: str) -> Provider | AsyncProvider:
+    module_name, _, attribute = path.partition(":")
+    provider = getattr(importlib.import_module(module_name), attribute or "provider")
+    if not isinstance(provider, (Provider, AsyncProvider)):
+        raise TypeError(f"{path} is not a Provider or AsyncProvider")
+    return provider
+
+
+def _trace_build(provider: Provider | AsyncProvider) -> ChromeTrace:
+    trace = ChromeTrace()
+    if isinstance(provider, Provider):
+        with provider.build(tracer=trace):
+            pass
+        return trace
+
+    async def build_async(async_provider: AsyncProvider):
+        async with async_provider.build_async(tracer=trace):
+            pass
+
+    asyncio.run(build_async(provider))
+    return trace
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m snake_di",
+        description="Build a provider once and report its startup critical path.",
+    )
+    parser.add_argument(
+        "provider", help="provider to build, as module:attribute (default: provider)"
+    )
+    parser.add_argument("--trace", help="also write Chrome trace JSON to this file")
+    args = parser.parse_args(argv)
+
+    provider = _import_provider(args.provider)
+    trace = _trace_build(provider)
+    print(provider.analyze_startup(factory_durations(trace.events)).report())
+    if args.trace is not None:
+        with open(args.trace, "w") as file:
+            trace.dump(file)
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
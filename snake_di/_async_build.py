@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import AsyncContextManager, Optional, Tuple, Union
+
+from snake_di._build_plan import BuildPlan
+from snake_di._container import _PrivateContainer
+from snake_di._factory import _AsyncFactory, _Offload
+from snake_di._teardown import _SlottedTeardown, _Teardown
+from snake_di._types import Service
+
+_Entered = Tuple[AsyncContextManager[Service], Service]
+
+
+async def _enter_factory(
+    container: _PrivateContainer, factory: _AsyncFactory, offload: _Offload
+) -> _Entered:
+    context_manager = container.solve_async_factory(factory, offload)
+    service = await type(context_manager).__aenter__(context_manager)
+    return context_manager, service
+
+
+async def solve_plan_serially(
+    teardown: Union[_Teardown, _SlottedTeardown],
+    container: _PrivateContainer,
+    plan: BuildPlan[_AsyncFactory],
+    offload: _Offload,
+):
+    for factory in plan.factories:
+        context_manager, service = await _enter_factory(container, factory, offload)
+        teardown.push_service_exit(factory.service_type, context_manager)
+        container.data[factory.service_type] = service
+
+
+async def solve_plan_concurrently(
+    teardown: Union[_Teardown, _SlottedTeardown],
+    container: _PrivateContainer,
+    plan: BuildPlan[_AsyncFactory],
+    offload: _Offload,
+    max_concurrency: Optional[int] = None,
+):
+    """Enter every factory of the plan as soon as its dependencies are built.
+
+    Entered services are pushed to the teardown in completion order, so a
+    serial teardown still exits them after everything that depends on them.
+    If any factory fails, factories still in flight are cancelled and the
+    error is raised, leaving the teardown to exit the built services.
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+
+    factories = {factory.service_type: factory for factory in plan.factories}
+    waiting_for = plan.count_planned_dependencies()
+    ready = deque(
+        factory for factory in plan.factories if not waiting_for[factory.service_type]
+    )
+    running: dict[asyncio.Task[_Entered], _AsyncFactory] = {}
+
+    def register(factory: _AsyncFactory, entered: _Entered):
+        context_manager, service = entered
+        teardown.push_service_exit(factory.service_type, context_manager)
+        container.data[factory.service_type] = service
+        for dependent in plan.dependents.get(factory.service_type, ()):
+            waiting_for[dependent] -= 1
+            if not waiting_for[dependent]:
+                ready.append(factories[dependent])
+
+    try:
+        while ready or running:
+            while ready and (max_concurrency is None or len(running) < max_concurrency):
+                factory = ready.popleft()
+                task = asyncio.ensure_future(
+                    _enter_factory(container, factory, offload)
+                )
+                running[task] = factory
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            error: Optional[BaseException] = None
+            for task in done:
+                factory = running.pop(task)
+                try:
+                    entered = task.result()
+                except BaseException as task_error:
+                    error = error or task_error
+                else:
+                    register(factory, entered)
+            if error is not None:
+                raise error
+    finally:
+        for task in running:
+            task.cancel()
+        results = await asyncio.gather(*running, return_exceptions=True)
+        for factory, result in zip(running.values(), results):
+            if not isinstance(result, BaseException):
+                teardown.push_service_exit(factory.service_type, result[0])
@@ -0,0 +1,77 @@
+"""Primitives of the async backend running the build: asyncio or trio.
+
+trio is imported only when the build runs under it, so it is not a
+dependency.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, TypeVar
+
+from typing_extensions import Protocol
+
+T = TypeVar("T")
+
+
+class _Event(Protocol):
+    def set(self) -> Any:
+        ...  # pragma: no cover
+
+    async def wait(self) -> Any:
+        ...  # pragma: no cover
+
+
+def is_asyncio_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def new_event() -> _Event:
+    if is_asyncio_running():
+        return asyncio.Event()
+    import trio  # type: ignore[import]
+
+    return trio.Event()
+
+
+async def run_sync_in_thread(
+    function: Callable[[], T],
+    executor: Optional[Executor],
+    on_cancel: Optional[Callable[[T], Any]] = None,
+) -> T:
+    """Run ``function`` in ``executor``, or in the default thread pool if ``None``.
+
+    Under trio only the default thread pool is supported. With ``on_cancel``
+    a cancelled call still runs ``function`` to completion: asyncio cancels
+    the task right away and passes the result to ``on_cancel`` in the thread
+    pool, while trio returns the result and cancels at the next checkpoint.
+    """
+    if is_asyncio_running():
+        future = asyncio.get_running_loop().run_in_executor(executor, function)
+        if on_cancel is None:
+            return await future
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(
+                functools.partial(_run_on_cancel, on_cancel, executor)
+            )
+            raise
+    if executor is not None:
+        raise RuntimeError("Offloading to an executor requires asyncio")
+    import trio  # type: ignore[import]
+
+    with trio.CancelScope(shield=on_cancel is not None):
+        return await trio.to_thread.run_sync(function)
+
+
+def _run_on_cancel(
+    on_cancel: Callable[[T], Any], executor: Optional[Executor], future: asyncio.Future
+):
+    if not future.cancelled() and future.exception() is None:
+        future.get_loop().run_in_executor(executor, on_cancel, future.result())
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Generic, Iterable, Mapping, Optional, Type
+
+from snake_di._container import _PrivateContainer
+from snake_di._exceptions import DependencyGraphError
+from snake_di._factory_group import _FactoryType
+from snake_di._types import Service
+from snake_di._validation import GraphValidation
+
+
+@dataclass(frozen=True)
+class BuildPlan(Generic[_FactoryType]):
+    factories: tuple[_FactoryType, ...]
+    dependents: dict[Type[Service], tuple[Type[Service], ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_factories(
+        cls,
+        factories: Mapping[Type[Service], _FactoryType],
+        container: _PrivateContainer,
+        only: Optional[Iterable[Type[Service]]] = None,
+    ) -> BuildPlan[_FactoryType]:
+        if only is not None:
+            factories = _select_factories(factories, container, only)
+
+        # Kahn's algorithm: a factory is ready once every dependency
+        # provided by another factory is already placed in the plan
+        waiting_for: dict[Type[Service], int] = {}
+        dependents: dict[Type[Service], list[Type[Service]]] = {}
+        unsolvable: set[Type[Service]] = set()
+        for service_type, factory in factories.items():
+            waiting_for[service_type] = 0
+            for dependency in factory.dependencies:
+                if dependency in factories:
+                    waiting_for[service_type] += 1
+                    dependents.setdefault(dependency, []).append(service_type)
+                elif dependency not in container.data:
+                    unsolvable.add(service_type)
+
+        ready = deque(
+            service_type
+            for service_type, count in waiting_for.items()
+            if count == 0 and service_type not in unsolvable
+        )
+        ordered: list[_FactoryType] = []
+        while ready:
+            service_type = ready.popleft()
+            ordered.append(factories[service_type])
+            for dependent in dependents.get(service_type, ()):
+                waiting_for[dependent] -= 1
+                if waiting_for[dependent] == 0 and dependent not in unsolvable:
+                    ready.append(dependent)
+
+        if len(ordered) != len(factories):
+            raise DependencyGraphError(
+                GraphValidation.from_factories(factories, container)
+            )
+        return cls(
+            tuple(ordered),
+            {
+                service_type: tuple(service_dependents)
+                for service_type, service_dependents in dependents.items()
+            },
+        )
+
+    def appended(self, factory: _FactoryType) -> BuildPlan[_FactoryType]:
+        """Plan with ``factory`` built last, all its dependencies must be solved."""
+        dependents = dict(self.dependents)
+        planned = {planned.service_type for planned in self.factories}
+        for dependency in factory.dependencies:
+            if dependency in planned:
+                dependents[dependency] = dependents.get(dependency, ()) + (
+                    factory.service_type,
+                )
+        return type(self)(self.factories + (factory,), dependents)
+
+    def __len__(self) -> int:
+        return len(self.factories)
+
+    def count_planned_dependencies(self) -> dict[Type[Service], int]:
+        counts = {factory.service_type: 0 for factory in self.factories}
+        for service_dependents in self.dependents.values():
+            for dependent in service_dependents:
+                counts[dependent] += 1
+        return counts
+
+
+def _external_dependencies(
+    factories: Mapping[Type[Service], _FactoryType]
+) -> set[Type[Service]]:
+    return {
+        dependency
+        for factory in factories.values()
+        for dependency in factory.dependencies
+        if dependency not in factories
+    }
+
+
+def _select_factories(
+    factories: Mapping[Type[Service], _FactoryType],
+    container: _PrivateContainer,
+    only: Iterable[Type[Service]],
+) -> dict[Type[Service], _FactoryType]:
+    if any(t not in factories and t not in container.data for t in only):
+        raise DependencyGraphError(
+            GraphValidation.from_factories(factories, container, only)
+        )
+
+    selected: set[Type[Service]] = set()
+    to_visit = list(only)
+    while to_visit:
+        service_type = to_visit.pop()
+        if (
+            service_type in selected
+            or service_type in container.data
+            or service_type not in factories
+        ):
+            continue
+        selected.add(service_type)
+        to_visit.extend(factories[service_type].dependencies)
+    return {
+        service_type: factory
+        for service_type, factory in factories.items()
+        if service_type in selected
+    }
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True, eq=False)
+class _ByIdentity:
+    value: Any
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ByIdentity) and other.value is self.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+@dataclass
+class _CacheEntry:
+    context_manager: ContextManager
+    value: Any
+    created_at: float
+
+
+def _dependencies_key(dependencies: Tuple[Any, ...]) -> Tuple[Hashable, ...]:
+    key = []
+    for dependency in dependencies:
+        try:
+            hash(dependency)
+        except TypeError:
+            dependency = _ByIdentity(dependency)
+        key.append(dependency)
+    return tuple(key)
+
+
+_CacheKey = Tuple[Callable, Tuple[Hashable, ...]]
+
+
+@dataclass
+class FactoryCache:
+    """Factory results kept across builds, keyed on the factory and its dependencies.
+
+    One cache can be shared by several factories. Hashable dependencies are
+    compared by equality, others by identity. A result is built outside of
+    the cache lock, so concurrent builds of other entries do not wait.
+    Entries are evicted least recently used first once there are more than
+    ``max_size`` of them, or ``ttl`` seconds after they were built. Evicting
+    an entry calls ``on_evict`` with its value and runs the factory teardown.
+    """
+
+    max_size: Optional[int] = 128
+    ttl: Optional[float] = None
+    on_evict: Optional[Callable[[Any], None]] = None
+    _entries: OrderedDict[_CacheKey, _CacheEntry] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _building: dict[_CacheKey, threading.Event] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        if self.max_size is not None and self.max_size < 1:
+            raise ValueError(f"max_size must be positive, got {self.max_size}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        factory: Callable,
+        build: Callable[..., ContextManager],
+        dependencies: Tuple[Any, ...],
+    ) -> Any:
+        key = (factory, _dependencies_key(dependencies))
+        evicted: list[_CacheEntry] = []
+        try:
+            while True:
+                with self._lock:
+                    entry = self._entries.get(key)
+                    if entry is not None and self._is_expired(entry, time.monotonic()):
+                        evicted.append(self._entries.pop(key))
+                        entry = None
+                    if entry is not None:
+                        self._entries.move_to_end(key)
+                        return entry.value
+                    building = self._building.get(key)
+                    if building is None:
+                        building = self._building[key] = threading.Event()
+                        break
+                # another thread builds the same entry, use its result
+                building.wait()
+            return self._build(key, build, dependencies, evicted)
+        finally:
+            self._evict(evicted)
+
+    def _build(
+        self,
+        key: _CacheKey,
+        build: Callable[..., ContextManager],
+        dependencies: Tuple[Any, ...],
+        evicted: list[_CacheEntry],
+    ) -> Any:
+        try:
+            context_manager = build(*dependencies)
+            entry = _CacheEntry(
+                context_manager, context_manager.__enter__(), time.monotonic()
+            )
+            with self._lock:
+                self._entries[key] = entry
+                while self.max_size is not None and len(self) > self.max_size:
+                    evicted.append(self._entries.popitem(last=False)[1])
+            return entry.value
+        finally:
+            with self._lock:
+                self._building.pop(key).set()
+
+    def invalidate(self, *dependencies: Any):
+        """Evict entries of every factory built from ``dependencies``."""
+        dependencies_key = _dependencies_key(dependencies)
+        with self._lock:
+            evicted = [
+                self._entries.pop(key)
+                for key in list(self._entries)
+                if key[1] == dependencies_key
+            ]
+        self._evict(evicted)
+
+    def evict_expired(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if self._is_expired(entry, now)
+            ]
+            evicted = [self._entries.pop(key) for key in expired]
+        self._evict(evicted)
+
+    def clear(self):
+        with self._lock:
+            evicted = list(self._entries.values())
+            self._entries.clear()
+        self._evict(evicted)
+
+    def _is_expired(self, entry: _CacheEntry, now: float) -> bool:
+        return self.ttl is not None and now - entry.created_at >= self.ttl
+
+    def _evict(self, entries: list[_CacheEntry]):
+        error: Optional[BaseException] = None
+        for entry in entries:
+            try:
+                if self.on_evict is not None:
+                    self.on_evict(entry.value)
+            except BaseException as evict_error:
+                error = error or evict_error
+            try:
+                entry.context_manager.__exit__(None, None, None)
+            except BaseException as teardown_error:
+                error = error or teardown_error
+        if error is not None:
+            raise error
+
+
+def cached_callable(
+    initial_callable: Callable,
+    build: Callable[..., ContextManager],
+    cache: FactoryCache,
+) -> Callable:
+    """Factory returning the cached result of ``initial_callable``."""
+
+    @functools.wraps(initial_callable)
+    def get_cached(*dependencies: Any) -> Any:
+        return cache.get(initial_callable, build, dependencies)
+
+    return get_cached
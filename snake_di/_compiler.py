@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import inspect
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Iterator, Type
+
+from snake_di._build_plan import BuildPlan
+from snake_di._container import Container, _PrivateContainer
+from snake_di._factory import _AsyncFactory, _BaseFactory, _SyncFactory
+from snake_di._scope import _AsyncScopeBuilder, _SyncScopeBuilder
+from snake_di._types import Service
+
+
+@dataclass
+class _SourceBuilder:
+    plan: BuildPlan
+    is_async: bool
+    lines: list[str] = field(default_factory=list)
+    namespace: dict[str, object] = field(default_factory=dict)
+    _variables: dict[Type[Service], str] = field(default_factory=dict)
+
+    def build(self) -> tuple[Callable, str]:
+        prefix = "async def" if self.is_async else "def"
+        self.lines.append(f"{prefix} compiled_build(data, stack):")
+        for factory in self.plan.factories:
+            for dependency in factory.dependencies:
+                self._variable_for(dependency)
+            self._add_factory(factory)
+        self.lines.append("    return data")
+        source = "\n".join(self.lines)
+        exec(compile(source, "<snake_di compiled build>", "exec"), self.namespace)
+        return self.namespace["compiled_build"], source  # type: ignore[return-value]
+
+    def _variable_for(self, service_type: Type[Service]) -> str:
+        variable = self._variables.get(service_type)
+        if variable is None:
+            variable = self._variables[service_type] = f"s{len(self._variables)}"
+            type_name = self._add_name("t", service_type)
+            self.lines.append(f"    {variable} = data[{type_name}]")
+        return variable
+
+    def _add_name(self, prefix: str, value: object) -> str:
+        name = f"{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def _add_factory(self, factory: _BaseFactory):
+        arguments = ", ".join(self._variables[dep] for dep in factory.dependencies)
+        call = self._factory_call(factory)
+        variable = self._variables[factory.service_type] = f"s{len(self._variables)}"
+        type_name = self._add_name("t", factory.service_type)
+        self.lines.append(f"    {variable} = {call.format(arguments)}")
+        self.lines.append(f"    data[{type_name}] = {variable}")
+
+    def _factory_call(self, factory: _BaseFactory) -> str:
+        callable_ = factory._inspector.initial_callable
+        if isinstance(factory, _SyncFactory):
+            if inspect.isgeneratorfunction(callable_):
+                build = self._add_name("b", factory.sync_build)
+                return f"stack.enter_context({build}({{}}))"
+            return f"{self._add_name('f', callable_)}({{}})"
+
+        assert isinstance(factory, _AsyncFactory)
+        if factory.blocking:
+            build = self._add_name("b", factory.offloaded_build)
+            return f"await stack.enter_async_context({build}(None, {{}}))"
+        if inspect.isasyncgenfunction(callable_):
+            build = self._add_name("b", factory.async_build)
+            return f"await stack.enter_async_context({build}({{}}))"
+        if inspect.isgeneratorfunction(callable_):
+            build = self._add_name(
+                "b", factory._inspector.wrap_to_sync_context_manager()
+            )
+            return f"stack.enter_context({build}({{}}))"
+        if inspect.iscoroutinefunction(callable_):
+            return f"await {self._add_name('f', callable_)}({{}})"
+        return f"{self._add_name('f', callable_)}({{}})"
+
+
+@dataclass
+class CompiledProvider:
+    """Provider build order turned into a single straight-line function.
+
+    Plain function factories are called directly and only generator
+    factories are entered on the exit stack.
+    """
+
+    compiled_build: Callable = field(repr=False)
+    source: str = field(repr=False)
+    initial_services: dict[Type[Service], Service] = field(repr=False)
+    scope_builder: _SyncScopeBuilder = field(repr=False)
+
+    @classmethod
+    def from_plan(
+        cls,
+        plan: BuildPlan[_SyncFactory],
+        initial_services: dict[Type[Service], Service],
+        scope_builder: _SyncScopeBuilder,
+    ) -> CompiledProvider:
+        compiled_build, source = _SourceBuilder(plan, is_async=False).build()
+        return cls(compiled_build, source, initial_services, scope_builder)
+
+    @contextmanager
+    def build(self) -> Iterator[Container]:
+        with ExitStack() as stack:
+            data = self.compiled_build(self.initial_services.copy(), stack)
+            yield Container(
+                _PrivateContainer.from_data(data), _scopes=self.scope_builder
+            )
+
+
+@dataclass
+class CompiledAsyncProvider:
+    """Async provider build order turned into a single straight-line coroutine."""
+
+    compiled_build: Callable = field(repr=False)
+    source: str = field(repr=False)
+    initial_services: dict[Type[Service], Service] = field(repr=False)
+    scope_builder: _AsyncScopeBuilder = field(repr=False)
+
+    @classmethod
+    def from_plan(
+        cls,
+        plan: BuildPlan[_AsyncFactory],
+        initial_services: dict[Type[Service], Service],
+        scope_builder: _AsyncScopeBuilder,
+    ) -> CompiledAsyncProvider:
+        compiled_build, source = _SourceBuilder(plan, is_async=True).build()
+        return cls(compiled_build, source, initial_services, scope_builder)
+
+    @asynccontextmanager
+    async def build_async(self) -> AsyncIterator[Container]:
+        async with AsyncExitStack() as stack:
+            data = await self.compiled_build(self.initial_services.copy(), stack)
+            yield Container(
+                _PrivateContainer.from_data(data), _scopes=self.scope_builder
+            )
@@ -2,63 +2,243 @@ from __future__ import annotations
 
 import functools
 import inspect
-from contextlib import asynccontextmanager, contextmanager
-from dataclasses import dataclass
-from typing import AsyncIterator, Callable, Iterator, Optional, Type
+from collections import ChainMap
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    MutableMapping,
+    Optional,
+    Type,
+    TypeVar,
+    overload,
+)
 
-from snake_di._factory import _AsyncFactory, _BaseFactory, _SyncFactory
+from snake_di._factory import _AsyncFactory, _Offload, _SyncFactory
+from snake_di._injector import Injector
 from snake_di._service_dict import ServiceDict
-from snake_di._types import Service, TService
+from snake_di._types import Service, TResult, TService, _Empty
 
+if TYPE_CHECKING:
+    from snake_di._lazy import _LazyResolver  # pragma: no cover
+    from snake_di._refresh import _Refresher  # pragma: no cover
+    from snake_di._scope import _ScopeBuilder  # pragma: no cover
+    from snake_di._threads import _ThreadLocalResolver  # pragma: no cover
 
-class _PrivateContainer(ServiceDict[Service]):
-    @asynccontextmanager
-    async def solve_async_factory(
-        self, factory: _AsyncFactory[TService]
-    ) -> AsyncIterator[TService]:
-        deps = [self.data[dep] for dep in factory.dependencies]
-        async with factory.async_build(*deps) as service:
-            yield service
+T1 = TypeVar("T1")
+T2 = TypeVar("T2")
+T3 = TypeVar("T3")
 
-    @contextmanager
-    def solve_sync_factory(self, factory: _SyncFactory[TService]) -> Iterator[TService]:
-        deps = [self.data[dep] for dep in factory.dependencies]
-        with factory.sync_build(*deps) as service:
-            yield service
 
-    def check_factory_solvable(self, factory: _BaseFactory[Service]) -> bool:
-        return all([dep in self.data for dep in factory.dependencies])
+class _PrivateContainer(ServiceDict[Service]):
+    def solve_async_factory(
+        self, factory: _AsyncFactory[TService], offload: _Offload = _Offload()
+    ) -> AsyncContextManager[TService]:
+        return offload.build_context(
+            factory, [self.data[dep] for dep in factory.dependencies]
+        )
 
-    def clone_and_include(
-        self, service_type: Type[Service], service: Service
-    ) -> "_PrivateContainer":
-        return self.merge(ServiceDict({service_type: service}))
+    def solve_sync_factory(
+        self, factory: _SyncFactory[TService]
+    ) -> ContextManager[TService]:
+        return factory.sync_build(*[self.data[dep] for dep in factory.dependencies])
+
+    def new_child(self) -> _PrivateContainer:
+        chained: ChainMap[Type[Service], Service] = ChainMap({}, self.data)
+        return _PrivateContainer.from_data(chained)
 
 
 @dataclass
 class Container:
+    """Services built by a provider.
+
+    ``container[T]`` and ``container.resolve(T1, T2)`` of built services are
+    plain dict lookups; only misses go through lazy and thread-local builds.
+    """
+
     _private: _PrivateContainer
+    _lazy: Optional[_LazyResolver] = None
+    _scopes: Optional[_ScopeBuilder] = None
+    _refresher: Optional[_Refresher] = None
+    _threads: Optional[_ThreadLocalResolver] = None
+    _services: MutableMapping[Type[Service], Service] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # refreshes and lazy builds update this mapping in place
+        self._services = self._private.data
 
     def get(self, service_type: Type[TService]) -> Optional[TService]:
-        return self._private.get(service_type)
+        return self._get(service_type, None)
+
+    def _get(self, service_type: Type[TService], default: Any) -> Any:
+        if self._threads is not None and service_type in self._threads.factories:
+            return self._threads.get(service_type, self)
+        if self._is_lazy_resolvable(service_type):
+            self._lazy.resolve(service_type)  # type: ignore[union-attr]
+        return self._services.get(service_type, default)
+
+    async def aget(self, service_type: Type[TService]) -> Optional[TService]:
+        if self._threads is not None and service_type in self._threads.factories:
+            return self._threads.get(service_type, self)
+        if self._is_lazy_resolvable(service_type):
+            await self._lazy.resolve_async(service_type)  # type: ignore[union-attr]
+        return self._services.get(service_type)
+
+    def _is_lazy_resolvable(self, service_type: Type[Service]) -> bool:
+        return (
+            self._lazy is not None
+            and service_type not in self._services
+            and self._lazy.can_resolve(service_type)
+        )
 
     def keys(self) -> set[Type[Service]]:
         return set(self._private.keys())
 
     def __getitem__(self, service_type: Type[TService]) -> TService:
-        service = self.get(service_type)
-        if service is None:
-            raise KeyError()  # ToDo: better errors
+        try:
+            return self._services[service_type]
+        except KeyError:
+            pass
+        service = self._get(service_type, _Empty.empty)
+        if service is _Empty.empty:
+            raise KeyError(service_type)
         return service
 
+    @overload
+    def resolve(self, t1: Type[T1], /) -> tuple[T1]:
+        ...
+
+    @overload
+    def resolve(self, t1: Type[T1], t2: Type[T2], /) -> tuple[T1, T2]:
+        ...
+
+    @overload
+    def resolve(self, t1: Type[T1], t2: Type[T2], t3: Type[T3], /) -> tuple[T1, T2, T3]:
+        ...
+
+    @overload
+    def resolve(self, *service_types: Type[Service]) -> tuple[Service, ...]:
+        ...
+
+    def resolve(self, *service_types: Type[Service]) -> tuple[Service, ...]:
+        """Get several services at once, ``KeyError`` if any is missing."""
+        if len(service_types) < 2:
+            return tuple(map(self.__getitem__, service_types))
+        try:
+            # a single C-level call, while itemgetter of one key is not a tuple
+            return itemgetter(*service_types)(self._services)
+        except KeyError:
+            return tuple(map(self.__getitem__, service_types))
+
+    def scope(self) -> ContextManager[Container]:
+        scopes = self._get_scope_builder()
+        if self._lazy is not None:
+            for service_type in scopes.external_dependencies:
+                self.get(service_type)
+        return scopes.scope(self)
+
+    @asynccontextmanager
+    async def scope_async(self) -> AsyncIterator[Container]:
+        scopes = self._get_scope_builder()
+        if self._lazy is not None:
+            for service_type in scopes.external_dependencies:
+                await self.aget(service_type)
+        async with scopes.scope_async(self) as container:
+            yield container
+
+    def _get_scope_builder(self) -> _ScopeBuilder:
+        if self._scopes is None:
+            raise RuntimeError(f"{self} can not open scopes")
+        return self._scopes
+
+    def refresh(
+        self,
+        service_type: Type[TService],
+        factory: Optional[Callable] = None,
+        value: TService | _Empty = _Empty.empty,
+    ):
+        """Tear down ``service_type`` and its dependents and build them again.
+
+        ``factory`` or ``value`` replace the service for this container,
+        other services are left untouched.
+        """
+        self._get_refresher().refresh(service_type, factory, value)
+
+    async def arefresh(
+        self,
+        service_type: Type[TService],
+        factory: Optional[Callable] = None,
+        value: TService | _Empty = _Empty.empty,
+    ):
+        await self._get_refresher().arefresh(service_type, factory, value)
+
+    def after_fork(self):
+        """Rebuild services of not ``fork_safe`` factories and their dependents.
+
+        Call it in a forked process: the parent copies are dropped without
+        teardown, since the parent still uses them, and fork safe services
+        stay shared with the parent.
+        """
+        self._get_refresher().after_fork()
+
+    async def aafter_fork(self):
+        await self._get_refresher().aafter_fork()
+
+    def _get_refresher(self) -> _Refresher:
+        if self._refresher is None:
+            raise RuntimeError(f"{self} can not refresh services")
+        return self._refresher
+
     def __repr__(self):
         return f"{type(self).__name__}({repr(self._private)})"
 
     def partial_solve(self, callable_: Callable) -> Callable:
-        sig = inspect.signature(callable_)
-        kwargs = {
-            p.name: self._private[p.annotation]
-            for p in sig.parameters.values()
-            if p.annotation in self._private
+        return functools.partial(
+            callable_, **Injector.from_callable(callable_).solve_kwargs(self)
+        )
+
+    def inject(self, callable_: Callable[..., TResult]) -> Callable[..., TResult]:
+        injector = Injector.from_callable(callable_).restricted(self._can_provide)
+
+        if inspect.iscoroutinefunction(callable_):
+
+            @functools.wraps(callable_)
+            async def injected_async(*args, **kwargs):
+                return await injector.call(self, *args, **kwargs)
+
+            return injected_async  # type: ignore[return-value]
+
+        @functools.wraps(callable_)
+        def injected(*args, **kwargs):
+            return injector.call(self, *args, **kwargs)
+
+        return injected
+
+    def _can_provide(self, service_type: Type[Service]) -> bool:
+        return (
+            service_type in self._services
+            or (self._lazy is not None and self._lazy.can_resolve(service_type))
+            or (self._threads is not None and service_type in self._threads.factories)
+        )
+
+    def _solve_kwargs(self, parameters: dict[str, Type[Service]]) -> dict[str, Service]:
+        if self._lazy is not None or self._threads is not None:
+            return {
+                name: self.get(service_type)
+                for name, service_type in parameters.items()
+                if self._can_provide(service_type)
+            }
+        data = self._services
+        return {
+            name: data[service_type]
+            for name, service_type in parameters.items()
+            if service_type in data
         }
-        return functools.partial(callable_, **kwargs)
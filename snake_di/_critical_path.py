@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Type
+
+from snake_di._build_plan import BuildPlan
+from snake_di._tracing import TraceEvent, TraceEventKind, _type_name
+from snake_di._types import Service
+
+
+def factory_durations(events: Iterable[TraceEvent]) -> dict[Type[Service], float]:
+    """Seconds every factory took to build, from its start and end trace events."""
+    started: dict[Type[Service], float] = {}
+    durations: dict[Type[Service], float] = {}
+    for event in events:
+        if event.kind is TraceEventKind.factory_start:
+            started[event.service_type] = event.timestamp
+        elif event.kind is TraceEventKind.factory_end:
+            start = started.pop(event.service_type)
+            durations[event.service_type] = event.timestamp - start
+    return durations
+
+
+@dataclass(frozen=True)
+class StartupAnalysis:
+    """Critical path of a build plan for the given factory durations.
+
+    ``earliest_start`` is when a factory could start with unlimited
+    concurrency, ``slack`` is how much it could be delayed without delaying
+    the whole startup. Factories on the critical path have no slack.
+    """
+
+    durations: dict[Type[Service], float]
+    earliest_start: dict[Type[Service], float]
+    slack: dict[Type[Service], float]
+    critical_path: tuple[Type[Service], ...]
+    minimum_startup: float
+    serial_startup: float
+
+    @classmethod
+    def from_plan(
+        cls, plan: BuildPlan, durations: Mapping[Type[Service], float]
+    ) -> StartupAnalysis:
+        missing = [
+            f.service_type for f in plan.factories if f.service_type not in durations
+        ]
+        if missing:
+            raise ValueError(f"Durations are missing for {missing}")
+
+        planned = {factory.service_type: factory for factory in plan.factories}
+        earliest_start: dict[Type[Service], float] = {}
+        earliest_finish: dict[Type[Service], float] = {}
+        for service_type, factory in planned.items():
+            earliest_start[service_type] = max(
+                (
+                    earliest_finish[dependency]
+                    for dependency in factory.dependencies
+                    if dependency in planned
+                ),
+                default=0.0,
+            )
+            earliest_finish[service_type] = (
+                earliest_start[service_type] + durations[service_type]
+            )
+        minimum_startup = max(earliest_finish.values(), default=0.0)
+
+        latest_finish: dict[Type[Service], float] = {}
+        for service_type in reversed(list(planned)):
+            latest_finish[service_type] = min(
+                (
+                    latest_finish[dependent] - durations[dependent]
+                    for dependent in plan.dependents.get(service_type, ())
+                ),
+                default=minimum_startup,
+            )
+        slack = {
+            service_type: latest_finish[service_type] - earliest_finish[service_type]
+            for service_type in planned
+        }
+
+        critical_path: list[Type[Service]] = []
+        if planned:
+            service_type = max(earliest_finish, key=earliest_finish.__getitem__)
+            while True:
+                critical_path.append(service_type)
+                dependencies = [
+                    dependency
+                    for dependency in planned[service_type].dependencies
+                    if dependency in planned
+                ]
+                if not dependencies:
+                    break
+                service_type = max(dependencies, key=earliest_finish.__getitem__)
+
+        return cls(
+            durations={
+                service_type: durations[service_type] for service_type in planned
+            },
+            earliest_start=earliest_start,
+            slack=slack,
+            critical_path=tuple(reversed(critical_path)),
+            minimum_startup=minimum_startup,
+            serial_startup=sum(durations[service_type] for service_type in planned),
+        )
+
+    def report(self) -> str:
+        names = {
+            service_type: _type_name(service_type) for service_type in self.durations
+        }
+        width = max([len("factory"), *map(len, names.values())])
+        lines = [
+            "Critical path: "
+            + " -> ".join(names[service_type] for service_type in self.critical_path),
+            f"Minimum startup: {_ms(self.minimum_startup)} (unlimited concurrency)",
+            f"Serial startup: {_ms(self.serial_startup)}",
+            "",
+            f"{'factory':<{width}}  {'duration':>11}  {'start':>11}  {'slack':>11}",
+        ]
+        for service_type, name in names.items():
+            lines.append(
+                f"{name:<{width}}"
+                f"  {_ms(self.durations[service_type]):>11}"
+                f"  {_ms(self.earliest_start[service_type]):>11}"
+                f"  {_ms(self.slack[service_type]):>11}"
+                + ("  *" if service_type in self.critical_path else "")
+            )
+        return "\n".join(lines)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.3f} ms"
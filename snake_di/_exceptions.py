@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+from snake_di._types import Service
+
+if TYPE_CHECKING:
+    from snake_di._validation import GraphValidation  # pragma: no cover
+
+
+class TeardownTimeoutError(TimeoutError):
+    def __init__(self, service_types: list[Type[Service]]):
+        super().__init__(f"Teardown timed out for {service_types}")
+        self.service_types = service_types
+
+
+class DependencyGraphError(RuntimeError):
+    """Missing services or dependency cycles, found before building anything."""
+
+    def __init__(self, validation: GraphValidation):
+        super().__init__(validation.report())
+        self.validation = validation
@@ -1,58 +1,185 @@
 from __future__ import annotations
 
+import importlib
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import AsyncContextManager, Callable, ContextManager, Generic, Type
+from functools import cached_property
+from typing import (
+    Any,
+    AsyncContextManager,
+    Callable,
+    ContextManager,
+    Generic,
+    Optional,
+    Type,
+)
 
+from snake_di._cache import FactoryCache, cached_callable
 from snake_di._inspector import _Inspector
-from snake_di._types import Service, TService, _Empty
+from snake_di._pool import Pool, PoolOptions, pooled_callable
+from snake_di._types import Scope, Service, TService, _Empty
 
 
 @dataclass
 class _BaseFactory(Generic[TService]):
-    initial_callable: Callable = field(repr=False)
+    """Factory of ``service_type``.
+
+    ``from_callable`` inspects the callable right away, so signature errors
+    surface when the factory is included. ``initial_callable`` of a lazily
+    included factory is an ``_ImportPath``, so its module is imported and
+    inspected only once the factory is planned or built.
+    Services of not ``fork_safe`` factories are rebuilt in forked processes.
+    """
+
+    initial_callable: Callable | _ImportPath = field(repr=False)
     service_type: Type[TService]
-    dependencies: list[Type[Service]]
-    _inspector: _Inspector = field(repr=False)
+    blocking: bool = False
+    scope: Scope = Scope.app
+    fork_safe: bool = True
+    _async_factory: Optional[_AsyncFactory[TService]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @cached_property
+    def _inspector(self) -> _Inspector:
+        initial_callable = (
+            self.initial_callable.load()
+            if isinstance(self.initial_callable, _ImportPath)
+            else self.initial_callable
+        )
+        inspector: _Inspector = _Inspector(initial_callable)
+        if self.blocking:
+            _check_not_async(inspector, initial_callable, "blocking")
+        return inspector
+
+    @cached_property
+    def dependencies(self) -> list[Type[Service]]:
+        return self._inspector.get_argument_annotations()
+
+    @property
+    def is_inspected(self) -> bool:
+        return "dependencies" in vars(self)
 
     @classmethod
     def from_callable(
         cls,
         initial_callable: Callable,
         service_type: Type[TService] | _Empty = _Empty.empty,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
     ):
         inspector: _Inspector = _Inspector(initial_callable)
+        if blocking:
+            _check_not_async(inspector, initial_callable, "blocking")
         guess_service_type: Type[TService] = (
             service_type
             if service_type is not _Empty.empty
             else inspector.get_return_annotation()
         )
-        return cls(
-            initial_callable=initial_callable,
-            dependencies=inspector.get_argument_annotations(),
-            service_type=guess_service_type,
-            _inspector=inspector,
-        )
+        if pool is not None:
+            _check_not_async(inspector, initial_callable, "pooled")
+            initial_callable = pooled_callable(
+                initial_callable, inspector.wrap_to_sync_context_manager(), pool
+            )
+            inspector = _Inspector(initial_callable)
+            pool_type: Any = Pool[guess_service_type]  # type: ignore[valid-type]
+            guess_service_type = pool_type
+        if cache is not None:
+            _check_not_async(inspector, initial_callable, "cached")
+            initial_callable = cached_callable(
+                initial_callable, inspector.wrap_to_sync_context_manager(), cache
+            )
+            inspector = _Inspector(initial_callable)
+        factory = cls(initial_callable, guess_service_type, blocking, scope, fork_safe)
+        factory._inspector = inspector
+        factory.dependencies = inspector.get_argument_annotations()
+        return factory
 
-    def to_async_factory(self) -> "_AsyncFactory":
-        return _AsyncFactory(
-            initial_callable=self.initial_callable,
-            dependencies=self.dependencies,
-            service_type=self.service_type,
-            _inspector=self._inspector,
-        )
+    def to_async_factory(self) -> _AsyncFactory[TService]:
+        if self._async_factory is None:
+            self._async_factory = _AsyncFactory(
+                self.initial_callable,
+                self.service_type,
+                self.blocking,
+                self.scope,
+                self.fork_safe,
+            )
+            if self.is_inspected:
+                self._async_factory._inspector = self._inspector
+                self._async_factory.dependencies = self.dependencies
+        return self._async_factory
+
+
+def _check_not_async(inspector: _Inspector, initial_callable: Callable, usage: str):
+    if inspector.is_async():
+        raise TypeError(f"{initial_callable.__name__} is async and can not be {usage}")
 
 
 @dataclass
 class _AsyncFactory(_BaseFactory[TService]):
-    async_build: Callable[..., AsyncContextManager[TService]] = field(init=False)
+    @cached_property
+    def async_build(self) -> Callable[..., AsyncContextManager[TService]]:
+        return self._inspector.wrap_to_async_context_manager()
 
-    def __post_init__(self):
-        self.async_build = self._inspector.wrap_to_async_context_manager()
+    @cached_property
+    def offloaded_build(self) -> Optional[Callable[..., AsyncContextManager[TService]]]:
+        if self._inspector.is_async():
+            return None
+        return self._inspector.wrap_to_offloaded_async_context_manager()
+
+
+@dataclass(frozen=True)
+class _Offload:
+    all_sync: bool = False
+    executor: Optional[Executor] = None
+
+    def build_context(
+        self, factory: _AsyncFactory[TService], deps: list[Service]
+    ) -> AsyncContextManager[TService]:
+        if factory.offloaded_build is not None and (factory.blocking or self.all_sync):
+            return factory.offloaded_build(self.executor, *deps)
+        return factory.async_build(*deps)
 
 
 @dataclass
 class _SyncFactory(_BaseFactory[TService]):
-    sync_build: Callable[..., ContextManager[TService]] = field(init=False)
+    @cached_property
+    def sync_build(self) -> Callable[..., ContextManager[TService]]:
+        return self._inspector.wrap_to_sync_context_manager()
+
+
+@dataclass(frozen=True)
+class _ImportPath:
+    """``"module:attribute"`` path, imported by ``load()``."""
+
+    path: str
 
     def __post_init__(self):
-        self.sync_build = self._inspector.wrap_to_sync_context_manager()
+        module, _, attribute = self.path.partition(":")
+        if not module or not attribute:
+            raise ValueError(f"{self.path!r} is not a 'module:attribute' path")
+
+    @property
+    def module(self) -> str:
+        return self.path.partition(":")[0]
+
+    def load(self) -> Any:
+        module, _, attribute = self.path.partition(":")
+        loaded = importlib.import_module(module)
+        for name in attribute.split("."):
+            loaded = getattr(loaded, name)
+        return loaded
+
+
+@dataclass(frozen=True)
+class _LazyFactory:
+    """Factory included by path, until the ``service_type`` path is imported."""
+
+    factory_path: _ImportPath
+    service_type: _ImportPath
+    blocking: bool = False
+    scope: Scope = Scope.app
+    fork_safe: bool = True
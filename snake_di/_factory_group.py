@@ -1,37 +1,60 @@
 from __future__ import annotations
 
-from typing import Callable, Type, TypeVar
+from typing import Callable, Optional, Type, TypeVar
 
-from typing_extensions import Self
-
-from snake_di._factory import _AsyncFactory, _BaseFactory, _SyncFactory
+from snake_di._cache import FactoryCache
+from snake_di._factory import _AsyncFactory, _BaseFactory, _ImportPath, _SyncFactory
+from snake_di._pool import PoolOptions
 from snake_di._service_dict import ServiceDict
-from snake_di._types import Service, _Empty
+from snake_di._types import Scope, Service, _Empty
 from snake_di._utils import get_generic_first_type
 
 _FactoryType = TypeVar("_FactoryType", bound=_BaseFactory)
 
 
 class _BaseFactoryGroup(ServiceDict[_FactoryType]):
-    def clone_and_remove(
-        self, service_type: Type[Service]
-    ) -> Self:  # type: ignore[valid-type]
-        return type(self)(self.copy_data_with_removed(service_type))
-
     def include_factory(
         self,
         initial_callable: Callable,
         service_type: Type[Service] | _Empty = _Empty.empty,
-    ):
-        factory_type: Type[_BaseFactory] = get_generic_first_type(self)
-        factory = factory_type.from_callable(initial_callable, service_type)
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
+    ) -> _FactoryType:
+        factory_type: Type[_FactoryType] = get_generic_first_type(self)
+        factory = factory_type.from_callable(
+            initial_callable, service_type, blocking, scope, pool, cache, fork_safe
+        )
         self.data[factory.service_type] = factory
+        return factory
+
+    def include_lazy(
+        self,
+        factory_path: _ImportPath,
+        service_type: Type[Service],
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        fork_safe: bool = True,
+    ) -> _FactoryType:
+        factory_type: Type[_FactoryType] = get_generic_first_type(self)
+        factory = factory_type(factory_path, service_type, blocking, scope, fork_safe)
+        self.data[service_type] = factory
+        return factory
+
+    def select_scope(self, scope: Scope) -> dict[Type[Service], _FactoryType]:
+        return {
+            service_type: factory
+            for service_type, factory in self.data.items()
+            if factory.scope is scope
+        }
 
     def to_async_factory_group(self) -> "_AsyncFactoryGroup":
-        return _AsyncFactoryGroup(
+        return _AsyncFactoryGroup.from_data(
             {
                 service_type: factory.to_async_factory()
-                for service_type, factory in self.items()
+                for service_type, factory in self.data.items()
             }
         )
 
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from snake_di._container import Container  # pragma: no cover
+
+_open_containers: WeakValueDictionary[int, Container] = WeakValueDictionary()
+_is_hook_registered = False
+
+
+def _after_fork_in_child():
+    for container in list(_open_containers.values()):
+        container.after_fork()
+
+
+@contextmanager
+def _rebuilt_after_fork(container: Container) -> Iterator[Container]:
+    """Call ``container.after_fork()`` in every process forked while it is open.
+
+    ``os.register_at_fork`` hooks can not be removed, so a single hook is
+    registered and rebuilds the containers open at the time of the fork.
+    """
+    global _is_hook_registered
+    if not _is_hook_registered:
+        os.register_at_fork(after_in_child=_after_fork_in_child)
+        _is_hook_registered = True
+    _open_containers[id(container)] = container
+    try:
+        yield container
+    finally:
+        _open_containers.pop(id(container), None)
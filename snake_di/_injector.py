@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Type
+from weakref import WeakKeyDictionary
+
+from snake_di._types import Service
+
+if TYPE_CHECKING:
+    from snake_di._container import Container  # pragma: no cover
+
+_INJECTABLE_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+_parameters_cache: WeakKeyDictionary[
+    Callable, dict[str, Type[Service]]
+] = WeakKeyDictionary()
+
+
+def _inspect_parameters(callable_: Callable) -> dict[str, Type[Service]]:
+    try:
+        return _parameters_cache[callable_]
+    except (KeyError, TypeError):
+        pass
+
+    parameters = {
+        parameter.name: parameter.annotation
+        for parameter in inspect.signature(callable_).parameters.values()
+        if parameter.kind in _INJECTABLE_KINDS
+        and parameter.annotation is not inspect.Parameter.empty
+    }
+    try:
+        _parameters_cache[callable_] = parameters
+    except TypeError:  # not weak referencable
+        pass
+    return parameters
+
+
+@dataclass(frozen=True)
+class Injector:
+    """Callable with its injectable parameters inspected once.
+
+    Services are looked up in the container on every call, so an injector
+    stays valid for any container and sees services built after it.
+    """
+
+    callable_: Callable
+    parameters: dict[str, Type[Service]]
+
+    @classmethod
+    def from_callable(cls, callable_: Callable) -> Injector:
+        return cls(callable_, _inspect_parameters(callable_))
+
+    def restricted(self, can_provide: Callable[[Type[Service]], bool]) -> Injector:
+        return type(self)(
+            self.callable_,
+            {
+                name: service_type
+                for name, service_type in self.parameters.items()
+                if can_provide(service_type)
+            },
+        )
+
+    def solve_kwargs(self, container: Container) -> dict[str, Service]:
+        return container._solve_kwargs(self.parameters)
+
+    def call(self, container: Container, *args: Any, **kwargs: Any) -> Any:
+        solved = container._solve_kwargs(self.parameters)
+        solved.update(kwargs)
+        return self.callable_(*args, **solved)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import inspect
+from concurrent.futures import Executor
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from typing import (
@@ -10,9 +11,11 @@ from typing import (
     Callable,
     ContextManager,
     Generic,
+    Optional,
     Type,
 )
 
+from snake_di._backend import run_sync_in_thread
 from snake_di._types import Service, TService
 
 
@@ -44,6 +47,11 @@ class _Inspector(Generic[TService]):
             )
         return self.signature.return_annotation
 
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(
+            self.initial_callable
+        ) or inspect.isasyncgenfunction(self.initial_callable)
+
     def wrap_to_async_context_manager(
         self,
     ) -> Callable[..., AsyncContextManager[TService]]:
@@ -75,6 +83,32 @@ class _Inspector(Generic[TService]):
 
         return _build
 
+    def wrap_to_offloaded_async_context_manager(
+        self,
+    ) -> Callable[..., AsyncContextManager[TService]]:
+        _sync_context_build = self.wrap_to_sync_context_manager()
+
+        @asynccontextmanager
+        @functools.wraps(self.initial_callable)
+        async def _build(
+            executor: Optional[Executor], *args: Service
+        ) -> AsyncIterator[TService]:
+            context_manager = _sync_context_build(*args)
+            result = await run_sync_in_thread(context_manager.__enter__, executor)
+            try:
+                yield result
+            except BaseException as error:
+                exit_ = functools.partial(
+                    context_manager.__exit__, type(error), error, error.__traceback__
+                )
+                if not await run_sync_in_thread(exit_, executor):
+                    raise
+            else:
+                exit_ = functools.partial(context_manager.__exit__, None, None, None)
+                await run_sync_in_thread(exit_, executor)
+
+        return _build
+
     def wrap_to_sync_context_manager(self) -> Callable[..., ContextManager[TService]]:
         if inspect.isgeneratorfunction(self.initial_callable):
             _build = contextmanager(self.initial_callable)
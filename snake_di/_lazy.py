@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Callable, ContextManager, Generic, Optional, Type, Union
+
+from snake_di._backend import _Event, new_event
+from snake_di._build_plan import BuildPlan
+from snake_di._container import _PrivateContainer
+from snake_di._factory import _AsyncFactory, _Offload, _SyncFactory
+from snake_di._factory_group import _FactoryType
+from snake_di._teardown import _SerialTeardown, _SyncSerialTeardown
+from snake_di._types import Service
+
+
+class _BaseLazyResolver(Generic[_FactoryType]):
+    factories: dict[Type[Service], _FactoryType]
+    imported_factories: Optional[Callable[[], dict[Type[Service], _FactoryType]]]
+
+    def can_resolve(self, service_type: Type[Service]) -> bool:
+        if service_type not in self.factories and self.imported_factories is not None:
+            self.factories = self.imported_factories()
+        return service_type in self.factories
+
+
+@dataclass
+class _SyncLazyResolver(_BaseLazyResolver[_SyncFactory]):
+    """Build services on first ``get``.
+
+    With a ``lock`` constructions are serialized, so threads racing for the
+    same service build it once, while built services are still read
+    without the lock. ``imported_factories`` updates ``factories`` with
+    lazily included factories whose modules were imported during the build.
+    """
+
+    factories: dict[Type[Service], _SyncFactory]
+    container: _PrivateContainer
+    teardown: _SyncSerialTeardown
+    lock: ContextManager = field(default_factory=nullcontext)
+    imported_factories: Optional[Callable[[], dict[Type[Service], _SyncFactory]]] = None
+
+    def resolve(self, service_type: Type[Service]):
+        with self.lock:
+            plan = BuildPlan.from_factories(
+                self.factories, self.container, only=[service_type]
+            )
+            for factory in plan.factories:
+                context_manager = self.container.solve_sync_factory(factory)
+                service = type(context_manager).__enter__(context_manager)
+                self.teardown.push_service_exit(factory.service_type, context_manager)
+                self.container.data[factory.service_type] = service
+
+    async def resolve_async(self, service_type: Type[Service]):
+        self.resolve(service_type)
+
+
+@dataclass
+class _AsyncLazyResolver(_BaseLazyResolver[_AsyncFactory]):
+    """Build services on first ``aget``, sharing constructions between tasks.
+
+    A task that needs a service already being built by another task waits
+    for it instead of building it again. If that construction fails, the
+    waiting task tries to build the service itself.
+    """
+
+    factories: dict[Type[Service], _AsyncFactory]
+    container: _PrivateContainer
+    teardown: _SerialTeardown
+    offload: _Offload = _Offload()
+    imported_factories: Optional[
+        Callable[[], dict[Type[Service], _AsyncFactory]]
+    ] = None
+    _pending: dict[Type[Service], _Event] = field(default_factory=dict, init=False)
+
+    def resolve(self, service_type: Type[Service]):
+        raise RuntimeError(
+            f"{service_type} is not built yet,"
+            f" use `await container.aget({service_type.__name__})`"
+        )
+
+    async def resolve_async(self, service_type: Type[Service]):
+        plan = BuildPlan.from_factories(
+            self.factories, self.container, only=[service_type]
+        )
+        for factory in plan.factories:
+            await self._solve_once(factory)
+
+    async def _solve_once(self, factory: _AsyncFactory):
+        while factory.service_type not in self.container.data:
+            pending = self._pending.get(factory.service_type)
+            if pending is not None:
+                await pending.wait()
+                continue
+
+            self._pending[factory.service_type] = event = new_event()
+            try:
+                context_manager = self.container.solve_async_factory(
+                    factory, self.offload
+                )
+                service = await type(context_manager).__aenter__(context_manager)
+                self.teardown.push_service_exit(factory.service_type, context_manager)
+                self.container.data[factory.service_type] = service
+            finally:
+                del self._pending[factory.service_type]
+                event.set()
+
+
+_LazyResolver = Union[_SyncLazyResolver, _AsyncLazyResolver]
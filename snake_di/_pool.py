@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Generic,
+    Iterator,
+    Optional,
+)
+
+from snake_di._backend import run_sync_in_thread
+from snake_di._types import TService
+
+
+@dataclass(frozen=True)
+class PoolOptions:
+    """How a pooled factory keeps its instances.
+
+    Idle instances older than ``idle_timeout``, instances living longer than
+    ``max_lifetime`` and instances failing ``health_check`` are closed
+    instead of being handed out again.
+    """
+
+    max_size: int
+    prewarm: int = 0
+    idle_timeout: Optional[float] = None
+    max_lifetime: Optional[float] = None
+    health_check: Optional[Callable[[Any], bool]] = None
+    checkout_timeout: Optional[float] = None
+
+    def __post_init__(self):
+        if self.max_size < 1:
+            raise ValueError(f"max_size must be positive, got {self.max_size}")
+        if not 0 <= self.prewarm <= self.max_size:
+            raise ValueError(f"prewarm must be in [0, max_size], got {self.prewarm}")
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    idle: int
+    in_use: int
+    waiters: int
+    created: int
+    closed: int
+    checkouts: int
+    wait_time: float
+    max_wait_time: float
+
+
+@dataclass
+class _Pooled(Generic[TService]):
+    context_manager: ContextManager[TService]
+    instance: TService
+    created_at: float
+    returned_at: float
+
+
+@dataclass
+class Pool(Generic[TService]):
+    """Up to ``options.max_size`` instances lent out with ``checkout()``.
+
+    Instances are created on demand and reused most recently returned
+    first, so rarely needed ones expire by ``idle_timeout``.
+    """
+
+    create: Callable[[], ContextManager[TService]] = field(repr=False)
+    options: PoolOptions
+    _idle: deque[_Pooled[TService]] = field(default_factory=deque, init=False)
+    _size: int = field(default=0, init=False)
+    _closed: bool = field(default=False, init=False)
+    _condition: threading.Condition = field(
+        default_factory=threading.Condition, init=False, repr=False
+    )
+    _waiters: int = field(default=0, init=False)
+    _created: int = field(default=0, init=False)
+    _closed_count: int = field(default=0, init=False)
+    _checkouts: int = field(default=0, init=False)
+    _wait_time: float = field(default=0.0, init=False)
+    _max_wait_time: float = field(default=0.0, init=False)
+
+    def __enter__(self) -> Pool[TService]:
+        try:
+            for _ in range(self.options.prewarm):
+                with self._condition:
+                    self._size += 1
+                self._idle.append(self._create_or_release_slot())
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[TService]:
+        pooled = self._acquire(self._timeout(timeout))
+        try:
+            yield pooled.instance
+        finally:
+            self._release(pooled)
+
+    @asynccontextmanager
+    async def acheckout(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[TService]:
+        """Like ``checkout()``, creating, checking and closing instances in a thread.
+
+        Every waiting task occupies a thread of the default thread pool. Under
+        asyncio an instance acquired after the waiting task was cancelled is
+        returned, under trio a cancelled task waits until its wait ends.
+        """
+        pooled = await run_sync_in_thread(
+            functools.partial(self._acquire, self._timeout(timeout)),
+            None,
+            on_cancel=self._release,
+        )
+        try:
+            yield pooled.instance
+        finally:
+            discard = self._return(pooled)
+            if discard:
+                await run_sync_in_thread(
+                    functools.partial(self._close_instances, discard),
+                    None,
+                    on_cancel=_ignore_result,
+                )
+
+    def evict_idle(self):
+        """Close idle instances which exceeded ``idle_timeout`` or ``max_lifetime``.
+
+        Expired idle instances are otherwise only closed once a checkout
+        finds them, so call it periodically to close them sooner.
+        """
+        now = time.monotonic()
+        with self._condition:
+            expired = [pooled for pooled in self._idle if self._is_expired(pooled, now)]
+            for pooled in expired:
+                self._idle.remove(pooled)
+            self._size -= len(expired)
+            self._condition.notify(len(expired))
+        self._close_instances(expired)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        self._close_instances(idle)
+
+    def stats(self) -> PoolStats:
+        with self._condition:
+            return PoolStats(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._size - len(self._idle),
+                waiters=self._waiters,
+                created=self._created,
+                closed=self._closed_count,
+                checkouts=self._checkouts,
+                wait_time=self._wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def _timeout(self, timeout: Optional[float]) -> Optional[float]:
+        return self.options.checkout_timeout if timeout is None else timeout
+
+    def _acquire(self, timeout: Optional[float]) -> _Pooled[TService]:
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        discarded: list[_Pooled[TService]] = []
+        pooled = None
+        with self._condition:
+            self._waiters += 1
+            try:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Pool is closed")
+                    pooled = self._pop_idle(discarded)
+                    if pooled is not None or self._size < self.options.max_size:
+                        break
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            f"No pooled instance available in {timeout} seconds"
+                        )
+                    self._condition.wait(remaining)
+                if pooled is None:
+                    self._size += 1
+                waited = time.monotonic() - started
+                self._checkouts += 1
+                self._wait_time += waited
+                self._max_wait_time = max(self._max_wait_time, waited)
+            finally:
+                self._waiters -= 1
+        self._close_instances(discarded)
+        return pooled if pooled is not None else self._create_or_release_slot()
+
+    def _pop_idle(
+        self, discarded: list[_Pooled[TService]]
+    ) -> Optional[_Pooled[TService]]:
+        now = time.monotonic()
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._is_expired(pooled, now) or not self._is_healthy(pooled):
+                self._size -= 1
+                discarded.append(pooled)
+                continue
+            return pooled
+        return None
+
+    def _release(self, pooled: _Pooled[TService]):
+        self._close_instances(self._return(pooled))
+
+    def _return(self, pooled: _Pooled[TService]) -> list[_Pooled[TService]]:
+        """Return ``pooled`` to the idle instances, or the instances to close."""
+        now = time.monotonic()
+        with self._condition:
+            if self._closed or self._is_expired(pooled, now, idle=False):
+                self._size -= 1
+                discard = [pooled]
+            else:
+                pooled.returned_at = now
+                self._idle.append(pooled)
+                discard = []
+            self._condition.notify()
+        return discard
+
+    def _create_or_release_slot(self) -> _Pooled[TService]:
+        try:
+            context_manager = self.create()
+            instance = context_manager.__enter__()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        now = time.monotonic()
+        with self._condition:
+            self._created += 1
+        return _Pooled(context_manager, instance, now, now)
+
+    def _is_expired(self, pooled: _Pooled[TService], now: float, idle=True) -> bool:
+        options = self.options
+        return (
+            options.max_lifetime is not None
+            and now - pooled.created_at >= options.max_lifetime
+        ) or (
+            idle
+            and options.idle_timeout is not None
+            and now - pooled.returned_at >= options.idle_timeout
+        )
+
+    def _is_healthy(self, pooled: _Pooled[TService]) -> bool:
+        health_check = self.options.health_check
+        return health_check is None or health_check(pooled.instance)
+
+    def _close_instances(self, instances: list[_Pooled[TService]]):
+        error: Optional[BaseException] = None
+        for pooled in instances:
+            try:
+                pooled.context_manager.__exit__(None, None, None)
+            except BaseException as close_error:
+                error = error or close_error
+        with self._condition:
+            self._closed_count += len(instances)
+        if error is not None:
+            raise error
+
+
+def _ignore_result(_: Any):
+    pass
+
+
+def pooled_callable(
+    initial_callable: Callable,
+    build_instance: Callable[..., ContextManager[TService]],
+    options: PoolOptions,
+) -> Callable[..., Iterator[Pool[TService]]]:
+    """Factory building a pool of ``initial_callable`` instances."""
+
+    def build_pool(*dependencies: Any) -> Iterator[Pool[TService]]:
+        create = functools.partial(build_instance, *dependencies)
+        with Pool(create, options) as pool:
+            yield pool
+
+    build_pool.__name__ = initial_callable.__name__
+    build_pool.__signature__ = inspect.signature(  # type: ignore[attr-defined]
+        initial_callable
+    )
+    return build_pool
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager, contextmanager
+import sys
+import threading
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from typing import (
+    Any,
     AsyncIterator,
     Callable,
+    ContextManager,
     Generic,
+    Iterable,
     Iterator,
+    Mapping,
+    Optional,
     Type,
     TypeVar,
     cast,
@@ -15,16 +23,49 @@ from typing import (
 
 from typing_extensions import Self
 
+from snake_di._async_build import solve_plan_concurrently, solve_plan_serially
+from snake_di._backend import is_asyncio_running
+from snake_di._build_plan import BuildPlan, _external_dependencies
+from snake_di._cache import FactoryCache
+from snake_di._compiler import CompiledAsyncProvider, CompiledProvider
 from snake_di._container import Container, _PrivateContainer
-from snake_di._factory import _AsyncFactory, _SyncFactory
+from snake_di._critical_path import StartupAnalysis
+from snake_di._factory import (
+    _AsyncFactory,
+    _BaseFactory,
+    _ImportPath,
+    _LazyFactory,
+    _Offload,
+    _SyncFactory,
+)
 from snake_di._factory_group import (
     _AsyncFactoryGroup,
     _BaseFactoryGroup,
     _FactoryType,
     _SyncFactoryGroup,
 )
-from snake_di._types import Service, _Empty
+from snake_di._fork import _rebuilt_after_fork
+from snake_di._injector import Injector
+from snake_di._lazy import _AsyncLazyResolver, _SyncLazyResolver
+from snake_di._pool import PoolOptions
+from snake_di._refresh import _AsyncRefresher, _SyncRefresher
+from snake_di._scope import _AsyncScopeBuilder, _SyncScopeBuilder
+from snake_di._sync_build import solve_sync_plan_in_threads, solve_sync_plan_serially
+from snake_di._teardown import (
+    _ConcurrentTeardown,
+    _ExitSlot,
+    _SerialTeardown,
+    _SlottedTeardown,
+    _SyncSerialTeardown,
+    _SyncTeardown,
+    _Teardown,
+    _ThreadedTeardown,
+)
+from snake_di._threads import _ThreadLocalResolver
+from snake_di._tracing import Tracer, _TracedContainer
+from snake_di._types import Scope, Service, _Empty
 from snake_di._utils import get_generic_first_type
+from snake_di._validation import GraphValidation
 
 _FactoryGroupType = TypeVar("_FactoryGroupType", bound=_BaseFactoryGroup)
 
@@ -33,6 +74,18 @@ _FactoryGroupType = TypeVar("_FactoryGroupType", bound=_BaseFactoryGroup)
 class _BaseProvider(Generic[_FactoryGroupType, _FactoryType]):
     _factories: _FactoryGroupType
     _container: _PrivateContainer = field(default_factory=_PrivateContainer)
+    _build_plans: dict[
+        Optional[frozenset[Type[Service]]], BuildPlan[_FactoryType]
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _injectors: dict[Callable, Injector] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _validation: Optional[GraphValidation] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lazy_factories: dict[str, _LazyFactory] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_container(cls, container: _PrivateContainer):
@@ -49,6 +102,11 @@ class _BaseProvider(Generic[_FactoryGroupType, _FactoryType]):
         cls,
         *,
         service_type: Type[Service] | _Empty = _Empty.empty,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
     ) -> Callable[..., Self]:
         ...
 
@@ -59,6 +117,11 @@ class _BaseProvider(Generic[_FactoryGroupType, _FactoryType]):
         initial_callable: Callable,
         *,
         service_type: Type[Service] | _Empty = _Empty.empty,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
     ) -> Self:
         ...
 
@@ -68,49 +131,202 @@ class _BaseProvider(Generic[_FactoryGroupType, _FactoryType]):
         initial_callable: Callable | _Empty = _Empty.empty,
         *,
         service_type: Type[Service] | _Empty = _Empty.empty,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
     ):
         def decorator(
             initial_callable_: Callable,
         ) -> _BaseProvider:
             return cls.from_dict({}).include_factory(
-                initial_callable_, service_type=service_type
+                initial_callable_,
+                service_type=service_type,
+                blocking=blocking,
+                scope=scope,
+                pool=pool,
+                cache=cache,
+                fork_safe=fork_safe,
             )
 
         if initial_callable is _Empty.empty:
             return decorator
         return decorator(initial_callable)
 
-    def _find_factory_to_solve(self) -> tuple[Type[Service], _FactoryType]:
-        for service_type, factory in self._factories.items():
-            if self._container.check_factory_solvable(factory):
-                return service_type, factory
-        else:
-            raise RuntimeError(
-                f"Can not solve any factory {self}"
-            )  # ToDo: better errors
-
-    def _clone_with_new_service(
-        self, service_type: Type[Service], service: Service
-    ) -> _BaseProvider:
-        next_factories = self._factories.clone_and_remove(service_type)
-        next_container = self._container.clone_and_include(service_type, service)
-        # noinspection PyArgumentList
-        return type(self)(next_factories, next_container)
+    def build_plan(
+        self, only: Optional[Iterable[Type[Service]]] = None
+    ) -> BuildPlan[_FactoryType]:
+        self._include_imported_lazy_factories(import_all=only is None)
+        key = None
+        if only is not None:
+            targets = set(only)
+            self._replace_scoped_targets(targets, Scope.thread)
+            key = frozenset(targets)
+        if key is None:
+            self.validate()
+        plan = self._build_plans.get(key)
+        if plan is None:
+            plan = BuildPlan.from_factories(
+                self._factories.select_scope(Scope.app), self._container, key
+            )
+            self._build_plans[key] = plan
+        return plan
+
+    def validate(self):
+        """Check the dependency graph of every scope without building anything.
+
+        Raises ``DependencyGraphError`` listing every missing service and
+        every dependency cycle. Full builds validate the provider first.
+        """
+        self._include_imported_lazy_factories(import_all=True)
+        if self._validation is None:
+            self._validation = GraphValidation.from_factories(
+                self._factories.data, self._container
+            )
+        self._validation.raise_if_invalid()
+
+    def _app_targets(
+        self, service_types: Iterable[Type[Service]]
+    ) -> tuple[frozenset[Type[Service]], bool]:
+        """App services to build for ``service_types`` and if a request scope is needed.
+
+        A request scope builds every request factory, so all their
+        dependencies are needed once any request service is. ``Scope.thread``
+        services are built on first access, so their app dependencies are
+        built instead of them.
+        """
+        self._include_imported_lazy_factories()
+        targets = set(service_types)
+        needs_scope = self._replace_scoped_targets(targets, Scope.request)
+        self._replace_scoped_targets(targets, Scope.thread)
+        return frozenset(targets), needs_scope
+
+    def _replace_scoped_targets(
+        self, targets: set[Type[Service]], scope: Scope
+    ) -> bool:
+        """Replace ``scope`` services in ``targets`` by the services they need."""
+        factories = self._factories.select_scope(scope)
+        if targets.isdisjoint(factories):
+            return False
+        targets.update(_external_dependencies(factories))
+        targets.difference_update(factories)
+        return True
+
+    def analyze_startup(
+        self,
+        durations: Mapping[Type[Service], float],
+        only: Optional[Iterable[Type[Service]]] = None,
+    ) -> StartupAnalysis:
+        return StartupAnalysis.from_plan(self.build_plan(only), durations)
 
-    def _merge_self(self, other: _BaseProvider) -> _BaseProvider:
-        # noinspection PyArgumentList
-        return type(self)(
-            _factories=cast(
-                _FactoryGroupType, self._factories.merge(other._factories)
-            ).remove_keys_from(other._container),
-            _container=cast(
-                _PrivateContainer, self._container.merge(other._container)
-            ).remove_keys_from(other._factories),
-        )
+    def _imported_app_factories(self) -> dict[Type[Service], _FactoryType]:
+        self._include_imported_lazy_factories()
+        return self._factories.select_scope(Scope.app)
+
+    def _imported_factories_getter(
+        self,
+    ) -> Optional[Callable[[], dict[Type[Service], _FactoryType]]]:
+        # lazy builds check for imported modules on misses only if needed
+        return self._imported_app_factories if self._lazy_factories else None
+
+    def _check_no_thread_scope(self, name: str):
+        if self._factories.select_scope(Scope.thread):
+            raise ValueError(f"{name} does not support Scope.thread services")
+
+    def _copy_container(self, tracer: Optional[Tracer]) -> _PrivateContainer:
+        container = self._container.copy()
+        if tracer is None:
+            return container
+        return _TracedContainer.traced(container, tracer)
+
+    @staticmethod
+    def _shared_dependents(
+        plan: BuildPlan[_FactoryType],
+    ) -> dict[Type[Service], tuple[Type[Service], ...]]:
+        # shared by the refresher and the teardown, so teardowns follow
+        # dependencies of replaced factories. Plans only link factories, so
+        # dependents of services provided by the container are added too.
+        dependents = dict(plan.dependents)
+        planned = {factory.service_type for factory in plan.factories}
+        for factory in plan.factories:
+            for dependency in factory.dependencies:
+                if dependency not in planned:
+                    dependents[dependency] = dependents.get(dependency, ()) + (
+                        factory.service_type,
+                    )
+        return dependents
+
+    @staticmethod
+    def _refresher_args(
+        plan: BuildPlan[_FactoryType],
+        container: _PrivateContainer,
+        dependents: dict[Type[Service], tuple[Type[Service], ...]],
+        slotted: _SlottedTeardown,
+    ) -> tuple[
+        dict[Type[Service], Any],
+        _PrivateContainer,
+        dict[Type[Service], tuple[Type[Service], ...]],
+        dict[Type[Service], _ExitSlot],
+    ]:
+        factories = {factory.service_type: factory for factory in plan.factories}
+        return factories, container, dependents, slotted.slots
+
+    def injector(self, callable_: Callable) -> Injector:
+        injector = self._injectors.get(callable_)
+        if injector is None:
+            injector = Injector.from_callable(callable_).restricted(self.__contains__)
+            self._injectors[callable_] = injector
+        return injector
+
+    @staticmethod
+    def _merge(*providers: _BaseProvider) -> _BaseProvider:
+        factories: dict[Type[Service], _BaseFactory] = {}
+        container: dict[Type[Service], Service] = {}
+        lazy_factories: dict[str, _LazyFactory] = {}
+        for provider in providers:
+            # Lazy factories left are of types nobody imported, so they do
+            # not override or get overridden by other services
+            provider._include_imported_lazy_factories()
+            lazy_factories.update(provider._lazy_factories)
+            for service_type in provider._container.data:
+                factories.pop(service_type, None)
+            container.update(provider._container.data)
+            for service_type in provider._factories.data:
+                container.pop(service_type, None)
+            factories.update(provider._factories.data)
+
+        merged: _BaseProvider
+        if any(isinstance(provider, AsyncProvider) for provider in providers):
+            merged = AsyncProvider(
+                _AsyncFactoryGroup.from_data(
+                    {
+                        service_type: factory
+                        if isinstance(factory, _AsyncFactory)
+                        else factory.to_async_factory()
+                        for service_type, factory in factories.items()
+                    }
+                ),
+                _PrivateContainer.from_data(container),
+            )
+        else:
+            merged = Provider(
+                _SyncFactoryGroup.from_data(factories),  # type: ignore[arg-type]
+                _PrivateContainer.from_data(container),
+            )
+        merged._lazy_factories = lazy_factories
+        return merged
 
     @overload
     def include_factory(
-        self, *, service_type: Type[Service] | _Empty = _Empty.empty
+        self,
+        *,
+        service_type: Type[Service] | _Empty = _Empty.empty,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
     ) -> Callable[[Callable], _BaseProvider]:  # Self
         ...
 
@@ -120,6 +336,11 @@ class _BaseProvider(Generic[_FactoryGroupType, _FactoryType]):
         initial_callable: Callable,
         *,
         service_type: Type[Service] | _Empty = _Empty.empty,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
     ) -> _BaseProvider:  # Self
         ...
 
@@ -128,16 +349,100 @@ class _BaseProvider(Generic[_FactoryGroupType, _FactoryType]):
         initial_callable: Callable | _Empty = _Empty.empty,
         *,
         service_type: Type[Service] | _Empty = _Empty.empty,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        pool: Optional[PoolOptions] = None,
+        cache: Optional[FactoryCache] = None,
+        fork_safe: bool = True,
     ):
         def decorator(initial_callable_: Callable) -> _BaseProvider:  # Self
-            self._factories.include_factory(initial_callable_, service_type)
-            self._container.pop(service_type, None)  # type: ignore[arg-type]
+            self._include_imported_lazy_factories()
+            size = len(self._factories)
+            factory = self._factories.include_factory(
+                initial_callable_,
+                service_type,
+                blocking,
+                scope,
+                pool,
+                cache,
+                fork_safe,
+            )
+            self._factory_included(factory, size)
             return self
 
         if initial_callable is _Empty.empty:
             return decorator
         return decorator(initial_callable)
 
+    def include_lazy(
+        self,
+        factory_path: str,
+        *,
+        service_type: Type[Service] | str,
+        blocking: bool = False,
+        scope: Scope = Scope.app,
+        fork_safe: bool = True,
+    ) -> Self:
+        """Include the ``"module:attribute"`` factory without importing its module.
+
+        The module is imported once the factory is planned or built. A
+        ``"module:attribute"`` service type is resolved once its module is
+        imported elsewhere, and by full builds.
+        """
+        lazy_factory = _LazyFactory(
+            _ImportPath(factory_path),
+            _ImportPath(service_type)
+            if isinstance(service_type, str)
+            else _ImportPath(f"{service_type.__module__}:{service_type.__qualname__}"),
+            blocking,
+            scope,
+            fork_safe,
+        )
+        self._lazy_factories[lazy_factory.service_type.path] = lazy_factory
+        self._include_imported_lazy_factories()
+        return self
+
+    def _include_imported_lazy_factories(self, import_all: bool = False):
+        for path, lazy_factory in list(self._lazy_factories.items()):
+            if import_all or lazy_factory.service_type.module in sys.modules:
+                del self._lazy_factories[path]
+                size = len(self._factories)
+                factory = self._factories.include_lazy(
+                    lazy_factory.factory_path,
+                    lazy_factory.service_type.load(),
+                    lazy_factory.blocking,
+                    lazy_factory.scope,
+                    lazy_factory.fork_safe,
+                )
+                self._factory_included(factory, size)
+
+    def _factory_included(self, factory: _FactoryType, size: int):
+        is_new = len(self._factories) > size and (
+            self._container.pop(factory.service_type, _Empty.empty) is _Empty.empty
+        )
+        self._update_build_plans(factory, is_new)
+        self._injectors.clear()
+        self._validation = None
+
+    def _update_build_plans(self, factory: _FactoryType, is_new: bool):
+        # A new service was not solvable before, so no cached plan depends on
+        # it: selective plans stay valid and the full plan only grows
+        if not is_new:
+            self._build_plans.clear()
+            return
+        if factory.scope is not Scope.app:
+            return
+        plan = self._build_plans.pop(None, None)
+        if (
+            plan is not None
+            and factory.is_inspected
+            and all(
+                dependency in self._container.data or dependency in self._factories
+                for dependency in factory.dependencies
+            )
+        ):
+            self._build_plans[None] = plan.appended(factory)
+
     def _to_async_provider(self) -> AsyncProvider:
         return AsyncProvider(
             _factories=self._factories.to_async_factory_group(),
@@ -145,11 +450,15 @@ class _BaseProvider(Generic[_FactoryGroupType, _FactoryType]):
         )
 
     def __contains__(self, service_type: Type[Service]) -> bool:
+        if self._lazy_factories:
+            self._include_imported_lazy_factories()
         return service_type in self._factories or service_type in self._container
 
     def copy(self) -> _BaseProvider:  # Self
         # noinspection PyArgumentList
-        return type(self)(self._factories.copy(), self._container.copy())
+        provider = type(self)(self._factories.copy(), self._container.copy())
+        provider._lazy_factories = self._lazy_factories.copy()
+        return provider
 
 
 @dataclass
@@ -157,30 +466,98 @@ class AsyncProvider(_BaseProvider[_AsyncFactoryGroup, _AsyncFactory]):
     _factories: _AsyncFactoryGroup = field(default_factory=_AsyncFactoryGroup)
 
     @asynccontextmanager
-    async def build_async(self) -> AsyncIterator[Container]:
-        if self._factories.is_empty():
-            yield Container(self._container)
+    async def build_async(
+        self,
+        *,
+        concurrent: bool = False,
+        max_concurrency: Optional[int] = None,
+        concurrent_teardown: bool = False,
+        teardown_timeout: Optional[float] = None,
+        factory_teardown_timeout: Optional[float] = None,
+        offload_sync: bool = False,
+        executor: Optional[Executor] = None,
+        only: Optional[Iterable[Type[Service]]] = None,
+        lazy: bool = False,
+        tracer: Optional[Tracer] = None,
+    ) -> AsyncIterator[Container]:
+        self._check_no_thread_scope("Async build")
+        offload = _Offload(offload_sync, executor)
+        if lazy:
+            if concurrent or concurrent_teardown or only is not None:
+                raise ValueError("Lazy build can not be concurrent or selective")
+            async with self._build_lazy_async(offload, tracer) as lazy_container:
+                yield lazy_container
             return
+        if concurrent and not is_asyncio_running():
+            raise RuntimeError("Concurrent build requires asyncio")
+        if concurrent_teardown and not is_asyncio_running():
+            raise RuntimeError("Concurrent teardown requires asyncio")
+
+        plan = self.build_plan(only)
+        container = self._copy_container(tracer)
+        dependents = self._shared_dependents(plan)
+        teardown: _Teardown
+        if concurrent_teardown:
+            teardown = _ConcurrentTeardown(
+                dependents, factory_teardown_timeout, teardown_timeout
+            )
+        elif teardown_timeout is not None or factory_teardown_timeout is not None:
+            raise ValueError("Teardown timeouts require concurrent_teardown=True")
+        else:
+            teardown = _SerialTeardown()
+
+        async with teardown:
+            slotted = _SlottedTeardown(teardown)
+            if concurrent:
+                await solve_plan_concurrently(
+                    slotted, container, plan, offload, max_concurrency
+                )
+            else:
+                await solve_plan_serially(slotted, container, plan, offload)
+            yield Container(
+                container,
+                _scopes=self._async_scope_builder(offload),
+                _refresher=_AsyncRefresher(
+                    *self._refresher_args(plan, container, dependents, slotted), offload
+                ),
+            )
+
+    def compile(self) -> CompiledAsyncProvider:
+        self._check_no_thread_scope("Compiled provider")
+        return CompiledAsyncProvider.from_plan(
+            self.build_plan(), self._container.data.copy(), self._async_scope_builder()
+        )
 
-        async with self._async_solve_factory() as next_provider:
-            async with next_provider.build_async() as result_container:
-                yield result_container
+    def _async_scope_builder(
+        self, offload: _Offload = _Offload()
+    ) -> _AsyncScopeBuilder:
+        return _AsyncScopeBuilder(self._factories.select_scope(Scope.request), offload)
 
     @asynccontextmanager
-    async def _async_solve_factory(
-        self,
-    ) -> AsyncIterator["AsyncProvider"]:
-        service_type, factory = self._find_factory_to_solve()
-        async with self._container.solve_async_factory(factory) as new_service:
-            yield cast(
-                AsyncProvider, self._clone_with_new_service(service_type, new_service)
+    async def _build_lazy_async(
+        self, offload: _Offload, tracer: Optional[Tracer]
+    ) -> AsyncIterator[Container]:
+        self._include_imported_lazy_factories()
+        container = self._copy_container(tracer)
+        async with _SerialTeardown() as teardown:
+            yield Container(
+                container,
+                _AsyncLazyResolver(
+                    self._factories.select_scope(Scope.app),
+                    container,
+                    teardown,
+                    offload,
+                    self._imported_factories_getter(),
+                ),
+                self._async_scope_builder(offload),
             )
 
-    def _to_async_provider(self) -> AsyncProvider:
-        return self
+    @classmethod
+    def merge(cls, *providers: Provider | AsyncProvider) -> AsyncProvider:
+        return cast(AsyncProvider, cls._merge(AsyncProvider(), *providers))
 
     def __or__(self, other: Provider | AsyncProvider) -> AsyncProvider:
-        return cast(AsyncProvider, self._merge_self(other._to_async_provider()))
+        return AsyncProvider.merge(self, other)
 
 
 @dataclass
@@ -188,21 +565,104 @@ class Provider(_BaseProvider[_SyncFactoryGroup, _SyncFactory]):
     _factories: _SyncFactoryGroup = field(default_factory=_SyncFactoryGroup)
 
     @contextmanager
-    def build(self) -> Iterator[Container]:
-        if self._factories.is_empty():
-            yield Container(self._container)
+    def build(
+        self,
+        *,
+        parallel: Optional[int] = None,
+        parallel_teardown: bool = False,
+        only: Optional[Iterable[Type[Service]]] = None,
+        lazy: bool = False,
+        tracer: Optional[Tracer] = None,
+        rebuild_after_fork: bool = False,
+        thread_safe: bool = False,
+    ) -> Iterator[Container]:
+        """Build app services, torn down once the context exits.
+
+        Built services are read without locks from any thread. A lazy build
+        is ``thread_safe`` if construction is serialized, so threads racing for
+        a service build it once. ``Scope.thread`` services are built once per
+        thread, on first access, and torn down with the container.
+        """
+        if parallel is not None and parallel < 1:
+            raise ValueError(f"parallel must be positive, got {parallel}")
+        if lazy:
+            if parallel is not None or parallel_teardown or only is not None:
+                raise ValueError("Lazy build can not be parallel or selective")
+            if rebuild_after_fork:
+                raise ValueError("Lazy build can not be rebuilt after fork")
+            with self._build_lazy(tracer, thread_safe) as lazy_container:
+                yield lazy_container
             return
 
-        with self._sync_solve_factory() as next_provider:
-            with next_provider.build() as result_container:
-                yield result_container
+        plan = self.build_plan(only)
+        container = self._copy_container(tracer)
+        dependents = self._shared_dependents(plan)
+        teardown: _SyncTeardown = (
+            _ThreadedTeardown(dependents, parallel)
+            if parallel_teardown
+            else _SyncSerialTeardown()
+        )
+        with teardown:
+            slotted = _SlottedTeardown(teardown)
+            if parallel is not None:
+                solve_sync_plan_in_threads(slotted, container, plan, parallel)
+            else:
+                solve_sync_plan_serially(slotted, container, plan)
+            with self._thread_local_resolver(container) as threads:
+                built = Container(
+                    container,
+                    _scopes=self._sync_scope_builder(),
+                    _refresher=_SyncRefresher(
+                        *self._refresher_args(plan, container, dependents, slotted),
+                        threads,
+                    ),
+                    _threads=threads,
+                )
+                with _rebuilt_after_fork(
+                    built
+                ) if rebuild_after_fork else nullcontext():
+                    yield built
+
+    def compile(self) -> CompiledProvider:
+        self._check_no_thread_scope("Compiled provider")
+        return CompiledProvider.from_plan(
+            self.build_plan(), self._container.data.copy(), self._sync_scope_builder()
+        )
+
+    def _sync_scope_builder(self) -> _SyncScopeBuilder:
+        return _SyncScopeBuilder(self._factories.select_scope(Scope.request))
+
+    def _thread_local_resolver(
+        self, container: _PrivateContainer
+    ) -> ContextManager[Optional[_ThreadLocalResolver]]:
+        factories = self._factories.select_scope(Scope.thread)
+        if not factories:
+            return nullcontext()
+        return _ThreadLocalResolver(factories, container)
 
     @contextmanager
-    def _sync_solve_factory(self) -> Iterator[Provider]:
-        service_type, factory = self._find_factory_to_solve()
-        with self._container.solve_sync_factory(factory) as new_service:
-            yield cast(
-                Provider, self._clone_with_new_service(service_type, new_service)
+    def _build_lazy(
+        self, tracer: Optional[Tracer], thread_safe: bool
+    ) -> Iterator[Container]:
+        self._include_imported_lazy_factories()
+        container = self._copy_container(tracer)
+        lock: ContextManager = nullcontext()
+        if thread_safe:
+            lock = threading.Lock()
+        with _SyncSerialTeardown() as teardown, self._thread_local_resolver(
+            container
+        ) as threads:
+            yield Container(
+                container,
+                _SyncLazyResolver(
+                    self._factories.select_scope(Scope.app),
+                    container,
+                    teardown,
+                    lock,
+                    self._imported_factories_getter(),
+                ),
+                self._sync_scope_builder(),
+                _threads=threads,
             )
 
     @overload
@@ -214,6 +674,23 @@ class Provider(_BaseProvider[_SyncFactoryGroup, _SyncFactory]):
         ...
 
     def __or__(self, other: Provider | AsyncProvider):
-        if isinstance(other, Provider):
-            return self._merge_self(other)
-        return self._to_async_provider()._merge_self(other._to_async_provider())
+        return Provider.merge(self, other)
+
+    @overload
+    @classmethod
+    def merge(cls, *providers: Provider) -> Provider:
+        ...
+
+    @overload
+    @classmethod
+    def merge(cls, *providers: Provider | AsyncProvider) -> Provider | AsyncProvider:
+        ...
+
+    @classmethod
+    def merge(cls, *providers: Provider | AsyncProvider):
+        """Merge providers at once, later ones override earlier ones.
+
+        Costs one pass over all services, while ``p1 | p2 | ... | pk``
+        copies the merged services on every ``|``.
+        """
+        return cls._merge(*providers)
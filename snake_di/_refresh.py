@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, Type, Union
+
+from snake_di._container import _PrivateContainer
+from snake_di._factory import _AsyncFactory, _Offload, _SyncFactory
+from snake_di._factory_group import _FactoryType
+from snake_di._teardown import _ExitSlot
+from snake_di._threads import _ThreadLocalResolver
+from snake_di._types import Service, _Empty
+
+
+@dataclass
+class _BaseRefresher(Generic[_FactoryType]):
+    """Rebuild a service and its dependents inside a built container.
+
+    ``slots`` are in build order, so services are rebuilt in that order
+    and torn down in the reverse one. A replacement factory may only depend
+    on services built before the one it replaces, which keeps the container
+    teardown order valid.
+    """
+
+    factories: dict[Type[Service], _FactoryType]
+    container: _PrivateContainer
+    dependents: dict[Type[Service], tuple[Type[Service], ...]]
+    slots: dict[Type[Service], _ExitSlot]
+
+    def _prepare(
+        self,
+        service_type: Type[Service],
+        factory: Optional[_FactoryType],
+        value: Union[Service, _Empty],
+    ) -> list[Type[Service]]:
+        if factory is not None and value is not _Empty.empty:
+            raise ValueError("Refresh with either a factory or a value")
+        if service_type not in self.container.data:
+            raise ValueError(f"{service_type} is not built")
+        if value is not _Empty.empty:
+            self.factories.pop(service_type, None)
+        elif factory is not None:
+            self._replace_factory(factory)
+        elif service_type not in self.factories:
+            raise ValueError(f"{service_type} is not built by a factory")
+
+        return self._with_dependents({service_type})
+
+    def _with_dependents(
+        self, service_types: set[Type[Service]]
+    ) -> list[Type[Service]]:
+        refreshed = set(service_types)
+        to_visit = list(service_types)
+        while to_visit:
+            for dependent in self.dependents.get(to_visit.pop(), ()):
+                if dependent not in refreshed:
+                    refreshed.add(dependent)
+                    to_visit.append(dependent)
+        return [built for built in self.slots if built in refreshed]
+
+    def _discard_after_fork(self) -> list[Type[Service]]:
+        """Forget not fork safe services and their dependents without exiting them.
+
+        Their exits belong to the parent process, which still uses them.
+        """
+        discarded = self._with_dependents(
+            {
+                service_type
+                for service_type, factory in self.factories.items()
+                if not factory.fork_safe
+            }
+        )
+        for built in discarded:
+            del self.container.data[built]
+            self.slots[built].context_manager = None
+        return discarded
+
+    def _replace_factory(self, factory: _FactoryType):
+        service_type = factory.service_type
+        if service_type not in self.slots:
+            raise ValueError(f"{service_type} is not built by a factory")
+        built_before = list(self.slots)[: list(self.slots).index(service_type)]
+        for dependency in factory.dependencies:
+            if dependency in self.slots and dependency not in built_before:
+                raise ValueError(
+                    f"{service_type} factory can not depend on {dependency}"
+                    f" built after it"
+                )
+            if dependency not in self.container.data:
+                raise ValueError(f"{service_type} dependency {dependency} is not built")
+
+        replaced = self.factories.get(service_type)
+        if replaced is not None:
+            factory.fork_safe = replaced.fork_safe
+        for dependency in replaced.dependencies if replaced is not None else ():
+            self.dependents[dependency] = tuple(
+                dependent
+                for dependent in self.dependents.get(dependency, ())
+                if dependent is not service_type
+            )
+        for dependency in factory.dependencies:
+            self.dependents[dependency] = self.dependents.get(dependency, ()) + (
+                service_type,
+            )
+        self.factories[service_type] = factory
+
+    def _set_value(self, service_type: Type[Service], value: Union[Service, _Empty]):
+        if value is not _Empty.empty:
+            self.container.data[service_type] = value
+
+
+@dataclass
+class _SyncRefresher(_BaseRefresher[_SyncFactory]):
+    threads: Optional[_ThreadLocalResolver] = None
+
+    def refresh(
+        self,
+        service_type: Type[Service],
+        factory: Optional[Callable] = None,
+        value: Union[Service, _Empty] = _Empty.empty,
+    ):
+        refreshed = self._prepare(
+            service_type,
+            None
+            if factory is None
+            else _SyncFactory.from_callable(factory, service_type),
+            value,
+        )
+        error: Optional[BaseException] = None
+        if self.threads is not None:
+            try:
+                self.threads.drop_dependents(refreshed)
+            except BaseException as exit_error:
+                error = exit_error
+        for built in reversed(refreshed):
+            del self.container.data[built]
+            try:
+                self.slots[built].__exit__(None, None, None)
+            except BaseException as exit_error:
+                error = error or exit_error
+        if error is not None:
+            raise error
+
+        self._set_value(service_type, value)
+        self._build(refreshed)
+
+    async def arefresh(
+        self,
+        service_type: Type[Service],
+        factory: Optional[Callable] = None,
+        value: Union[Service, _Empty] = _Empty.empty,
+    ):
+        self.refresh(service_type, factory, value)
+
+    def after_fork(self):
+        discarded = self._discard_after_fork()
+        if self.threads is not None:
+            # thread-local exits belong to the parent process too
+            self.threads.drop_dependents(discarded, exit_services=False)
+        self._build(discarded)
+
+    async def aafter_fork(self):
+        self.after_fork()
+
+    def _build(self, refreshed: list[Type[Service]]):
+        for built in refreshed:
+            if built in self.factories:
+                context_manager = self.container.solve_sync_factory(
+                    self.factories[built]
+                )
+                service = type(context_manager).__enter__(context_manager)
+                self.slots[built].context_manager = context_manager
+                self.container.data[built] = service
+
+
+@dataclass
+class _AsyncRefresher(_BaseRefresher[_AsyncFactory]):
+    offload: _Offload = _Offload()
+
+    def refresh(
+        self,
+        service_type: Type[Service],
+        factory: Optional[Callable] = None,
+        value: Union[Service, _Empty] = _Empty.empty,
+    ):
+        raise RuntimeError("Async provider container, use `await container.arefresh()`")
+
+    def after_fork(self):
+        raise RuntimeError(
+            "Async provider container, use `await container.aafter_fork()`"
+        )
+
+    async def arefresh(
+        self,
+        service_type: Type[Service],
+        factory: Optional[Callable] = None,
+        value: Union[Service, _Empty] = _Empty.empty,
+    ):
+        refreshed = self._prepare(
+            service_type,
+            None
+            if factory is None
+            else _AsyncFactory.from_callable(factory, service_type),
+            value,
+        )
+        error: Optional[BaseException] = None
+        for built in reversed(refreshed):
+            del self.container.data[built]
+            try:
+                await self.slots[built].__aexit__(None, None, None)
+            except BaseException as exit_error:
+                error = error or exit_error
+        if error is not None:
+            raise error
+
+        self._set_value(service_type, value)
+        await self._abuild(refreshed)
+
+    async def aafter_fork(self):
+        await self._abuild(self._discard_after_fork())
+
+    async def _abuild(self, refreshed: list[Type[Service]]):
+        for built in refreshed:
+            if built in self.factories:
+                context_manager = self.container.solve_async_factory(
+                    self.factories[built], self.offload
+                )
+                service = await type(context_manager).__aenter__(context_manager)
+                self.slots[built].context_manager = context_manager
+                self.container.data[built] = service
+
+
+_Refresher = Union[_SyncRefresher, _AsyncRefresher]
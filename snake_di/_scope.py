@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Generic, Iterator, Optional, Type, Union
+
+from snake_di._async_build import solve_plan_serially
+from snake_di._build_plan import BuildPlan, _external_dependencies
+from snake_di._container import Container, _PrivateContainer
+from snake_di._factory import _AsyncFactory, _Offload, _SyncFactory
+from snake_di._factory_group import _FactoryType
+from snake_di._sync_build import solve_sync_plan_serially
+from snake_di._teardown import _SerialTeardown, _SyncSerialTeardown
+from snake_di._types import Service
+
+
+@dataclass
+class _BaseScopeBuilder(Generic[_FactoryType]):
+    factories: dict[Type[Service], _FactoryType]
+    external_dependencies: set[Type[Service]] = field(init=False)
+    _plan: Optional[BuildPlan[_FactoryType]] = field(default=None, init=False)
+
+    def __post_init__(self):
+        self.external_dependencies = _external_dependencies(self.factories)
+
+    def _child_container(
+        self, parent: _PrivateContainer
+    ) -> tuple[_PrivateContainer, BuildPlan[_FactoryType]]:
+        if self._plan is None:
+            self._plan = BuildPlan.from_factories(self.factories, parent)
+        return parent.new_child(), self._plan
+
+
+@dataclass
+class _SyncScopeBuilder(_BaseScopeBuilder[_SyncFactory]):
+    @contextmanager
+    def scope(self, parent: Container) -> Iterator[Container]:
+        child, plan = self._child_container(parent._private)
+        with _SyncSerialTeardown() as teardown:
+            solve_sync_plan_serially(teardown, child, plan)
+            yield Container(child, _threads=parent._threads)
+
+    @asynccontextmanager
+    async def scope_async(self, parent: Container) -> AsyncIterator[Container]:
+        with self.scope(parent) as container:
+            yield container
+
+
+@dataclass
+class _AsyncScopeBuilder(_BaseScopeBuilder[_AsyncFactory]):
+    offload: _Offload = _Offload()
+
+    @contextmanager
+    def scope(self, parent: Container) -> Iterator[Container]:
+        raise RuntimeError("Async provider scope, use `container.scope_async()`")
+
+    @asynccontextmanager
+    async def scope_async(self, parent: Container) -> AsyncIterator[Container]:
+        child, plan = self._child_container(parent._private)
+        async with _SerialTeardown() as teardown:
+            await solve_plan_serially(teardown, child, plan, self.offload)
+            yield Container(child, _threads=parent._threads)
+
+
+_ScopeBuilder = Union[_SyncScopeBuilder, _AsyncScopeBuilder]
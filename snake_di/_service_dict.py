@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import UserDict
-from typing import TYPE_CHECKING, Generic, Type, TypeVar
+from typing import TYPE_CHECKING, Generic, MutableMapping, Type, TypeVar
 
 from typing_extensions import Self
 
@@ -16,30 +16,14 @@ else:
 
 
 class ServiceDict(Generic[ServiceDictValue], Base):
-    def is_empty(self) -> bool:
-        return not self.data
-
-    def merge(
-        self, other: ServiceDict[ServiceDictValue]
+    @classmethod
+    def from_data(
+        cls, data: MutableMapping[Type[Service], ServiceDictValue]
     ) -> Self:  # type: ignore[valid-type]
-        new_data = {}
-        new_data.update(self.data)
-        new_data.update(other.data)
         # noinspection PyArgumentList
-        return type(self)(new_data)
-
-    def remove_keys_from(self, other: ServiceDict) -> Self:  # type: ignore[valid-type]
-        for key in other.keys():
-            self.pop(key, None)  # type: ignore[arg-type]
-        return self
-
-    def copy_data_with_removed(
-        self, remove_service_type: Type[Service]
-    ) -> dict[Type[Service], ServiceDictValue]:
-        new_data = self.data.copy()
-        del new_data[remove_service_type]
-        return new_data
+        service_dict = cls()  # type: ignore[var-annotated]
+        service_dict.data = data  # type: ignore[assignment]
+        return service_dict
 
     def copy(self) -> Self:  # type: ignore[valid-type]
-        # noinspection PyArgumentList
-        return type(self)(self.data.copy())
+        return self.from_data(self.data.copy())
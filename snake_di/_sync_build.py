@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import ContextManager, Optional, Tuple, Union
+
+from snake_di._build_plan import BuildPlan
+from snake_di._container import _PrivateContainer
+from snake_di._factory import _SyncFactory
+from snake_di._teardown import _SlottedTeardown, _SyncTeardown
+from snake_di._types import Service
+
+_Entered = Tuple[ContextManager[Service], Service]
+
+
+def _enter_factory(container: _PrivateContainer, factory: _SyncFactory) -> _Entered:
+    context_manager = container.solve_sync_factory(factory)
+    service = type(context_manager).__enter__(context_manager)
+    return context_manager, service
+
+
+def solve_sync_plan_serially(
+    teardown: Union[_SyncTeardown, _SlottedTeardown],
+    container: _PrivateContainer,
+    plan: BuildPlan[_SyncFactory],
+):
+    for factory in plan.factories:
+        context_manager, service = _enter_factory(container, factory)
+        teardown.push_service_exit(factory.service_type, context_manager)
+        container.data[factory.service_type] = service
+
+
+def solve_sync_plan_in_threads(
+    teardown: Union[_SyncTeardown, _SlottedTeardown],
+    container: _PrivateContainer,
+    plan: BuildPlan[_SyncFactory],
+    max_workers: Optional[int] = None,
+):
+    """Enter every factory of the plan in a thread pool once its dependencies are built.
+
+    If any factory fails, factories not started yet are cancelled, the ones
+    already running are awaited and the error is raised, leaving the teardown to
+    exit the built services.
+    """
+    factories = {factory.service_type: factory for factory in plan.factories}
+    waiting_for = plan.count_planned_dependencies()
+    ready = deque(
+        factory for factory in plan.factories if not waiting_for[factory.service_type]
+    )
+    running: dict[Future[_Entered], _SyncFactory] = {}
+
+    def register(factory: _SyncFactory, entered: _Entered):
+        context_manager, service = entered
+        teardown.push_service_exit(factory.service_type, context_manager)
+        container.data[factory.service_type] = service
+        for dependent in plan.dependents.get(factory.service_type, ()):
+            waiting_for[dependent] -= 1
+            if not waiting_for[dependent]:
+                ready.append(factories[dependent])
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        try:
+            while ready or running:
+                while ready:
+                    factory = ready.popleft()
+                    future = executor.submit(_enter_factory, container, factory)
+                    running[future] = factory
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                error: Optional[BaseException] = None
+                for future in done:
+                    factory = running.pop(future)
+                    try:
+                        entered = future.result()
+                    except BaseException as future_error:
+                        error = error or future_error
+                    else:
+                        register(factory, entered)
+                if error is not None:
+                    raise error
+        finally:
+            for future in running:
+                future.cancel()
+            wait(running)
+            for future, factory in running.items():
+                if not future.cancelled() and future.exception() is None:
+                    teardown.push_service_exit(factory.service_type, future.result()[0])
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass, field
+from typing import Any, AsyncContextManager, ContextManager, Optional, Type, Union
+
+from snake_di._exceptions import TeardownTimeoutError
+from snake_di._types import Service
+
+
+class _SerialTeardown(AsyncExitStack):
+    def push_service_exit(
+        self, service_type: Type[Service], context_manager: AsyncContextManager
+    ):
+        self.push_async_exit(context_manager)
+
+
+@dataclass
+class _ConcurrentTeardown:
+    """Exit services concurrently, each only after all its dependents exited.
+
+    A teardown that exceeds ``factory_timeout`` is cancelled and its
+    dependencies are closed anyway. Once ``timeout`` expires, every
+    teardown still running or waiting is cancelled or skipped. Timed out
+    service types are reported with ``TeardownTimeoutError``. Requires asyncio.
+    """
+
+    dependents: dict[Type[Service], tuple[Type[Service], ...]]
+    factory_timeout: Optional[float] = None
+    timeout: Optional[float] = None
+    _exits: dict[Type[Service], AsyncContextManager] = field(
+        default_factory=dict, init=False
+    )
+
+    def push_service_exit(
+        self, service_type: Type[Service], context_manager: AsyncContextManager
+    ):
+        self._exits[service_type] = context_manager
+
+    async def __aenter__(self) -> _ConcurrentTeardown:
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> bool:
+        waiting_for, dependencies = _count_dependents(self._exits, self.dependents)
+
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+        ready = [
+            service_type for service_type, count in waiting_for.items() if not count
+        ]
+        running: dict[asyncio.Future, Type[Service]] = {}
+        exited: set[Type[Service]] = set()
+        timed_out: list[Type[Service]] = []
+        errors: list[BaseException] = []
+        suppress = exc_type is not None and bool(self._exits)
+        try:
+            while ready or running:
+                for service_type in ready:
+                    exit_ = self._exit_service(service_type, exc_type, exc, traceback)
+                    running[asyncio.ensure_future(exit_)] = service_type
+                ready = []
+
+                remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait(
+                    running, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+
+                for task in done:
+                    service_type = running.pop(task)
+                    exited.add(service_type)
+                    try:
+                        suppress = bool(task.result()) and suppress
+                    except asyncio.TimeoutError:
+                        timed_out.append(service_type)
+                        suppress = False
+                    except BaseException as error:
+                        errors.append(error)
+                        suppress = False
+                    for dependency in dependencies.get(service_type, ()):
+                        waiting_for[dependency] -= 1
+                        if not waiting_for[dependency]:
+                            ready.append(dependency)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        timed_out += [
+            service_type for service_type in self._exits if service_type not in exited
+        ]
+        if errors:
+            _raise_with_context(errors[0], exc)
+        if timed_out:
+            _raise_with_context(TeardownTimeoutError(timed_out), exc)
+        return suppress
+
+    async def _exit_service(
+        self, service_type: Type[Service], exc_type, exc, traceback
+    ) -> Optional[bool]:
+        context_manager = self._exits[service_type]
+        exit_ = type(context_manager).__aexit__(
+            context_manager, exc_type, exc, traceback
+        )
+        if self.factory_timeout is None:
+            return await exit_
+        return await asyncio.wait_for(exit_, self.factory_timeout)
+
+
+class _SyncSerialTeardown(ExitStack):
+    def push_service_exit(
+        self, service_type: Type[Service], context_manager: ContextManager
+    ):
+        self.push(context_manager)
+
+
+@dataclass
+class _ThreadedTeardown:
+    """Exit services in a thread pool, each only after all its dependents exited."""
+
+    dependents: dict[Type[Service], tuple[Type[Service], ...]]
+    max_workers: Optional[int] = None
+    _exits: dict[Type[Service], ContextManager] = field(
+        default_factory=dict, init=False
+    )
+
+    def push_service_exit(
+        self, service_type: Type[Service], context_manager: ContextManager
+    ):
+        self._exits[service_type] = context_manager
+
+    def __enter__(self) -> _ThreadedTeardown:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        waiting_for, dependencies = _count_dependents(self._exits, self.dependents)
+        ready = [
+            service_type for service_type, count in waiting_for.items() if not count
+        ]
+        running: dict[Future, Type[Service]] = {}
+        errors: list[BaseException] = []
+        suppress = exc_type is not None and bool(self._exits)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            while ready or running:
+                for service_type in ready:
+                    context_manager = self._exits[service_type]
+                    future = executor.submit(
+                        type(context_manager).__exit__,
+                        context_manager,
+                        exc_type,
+                        exc,
+                        traceback,
+                    )
+                    running[future] = service_type
+                ready = []
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    service_type = running.pop(future)
+                    try:
+                        suppress = bool(future.result()) and suppress
+                    except BaseException as error:
+                        errors.append(error)
+                        suppress = False
+                    for dependency in dependencies.get(service_type, ()):
+                        waiting_for[dependency] -= 1
+                        if not waiting_for[dependency]:
+                            ready.append(dependency)
+
+        if errors:
+            _raise_with_context(errors[0], exc)
+        return suppress
+
+
+_Teardown = Union[_SerialTeardown, _ConcurrentTeardown]
+_SyncTeardown = Union[_SyncSerialTeardown, _ThreadedTeardown]
+
+
+@dataclass
+class _ExitSlot:
+    """Exit of a built service, replaced when the service is refreshed.
+
+    An emptied slot exits nothing, so a service torn down by a refresh is
+    not exited again with the container.
+    """
+
+    context_manager: Any
+
+    def __enter__(self) -> _ExitSlot:
+        return self  # pragma: no cover
+
+    def __exit__(self, exc_type, exc, traceback) -> Optional[bool]:
+        context_manager, self.context_manager = self.context_manager, None
+        if context_manager is None:
+            return False
+        return type(context_manager).__exit__(context_manager, exc_type, exc, traceback)
+
+    async def __aenter__(self) -> _ExitSlot:
+        return self  # pragma: no cover
+
+    async def __aexit__(self, exc_type, exc, traceback) -> Optional[bool]:
+        context_manager, self.context_manager = self.context_manager, None
+        if context_manager is None:
+            return False
+        return await type(context_manager).__aexit__(
+            context_manager, exc_type, exc, traceback
+        )
+
+
+@dataclass
+class _SlottedTeardown:
+    """Push every service exit through an ``_ExitSlot`` of ``slots``."""
+
+    teardown: Union[_Teardown, _SyncTeardown]
+    slots: dict[Type[Service], _ExitSlot] = field(default_factory=dict, init=False)
+
+    def push_service_exit(self, service_type: Type[Service], context_manager: Any):
+        slot = self.slots[service_type] = _ExitSlot(context_manager)
+        self.teardown.push_service_exit(service_type, slot)
+
+
+def _count_dependents(
+    exits: dict[Type[Service], Any],
+    dependents: dict[Type[Service], tuple[Type[Service], ...]],
+) -> tuple[dict[Type[Service], int], dict[Type[Service], list[Type[Service]]]]:
+    waiting_for = {service_type: 0 for service_type in exits}
+    dependencies: dict[Type[Service], list[Type[Service]]] = {}
+    for service_type in exits:
+        for dependent in dependents.get(service_type, ()):
+            if dependent in exits:
+                waiting_for[service_type] += 1
+                dependencies.setdefault(dependent, []).append(service_type)
+    return waiting_for, dependencies
+
+
+def _raise_with_context(error: BaseException, context: Optional[BaseException]):
+    if context is not None and error is not context:
+        error.__context__ = context
+    raise error
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Type
+
+from snake_di._build_plan import BuildPlan, _external_dependencies
+from snake_di._container import _PrivateContainer
+from snake_di._factory import _SyncFactory
+from snake_di._teardown import _ExitSlot, _SyncSerialTeardown
+from snake_di._types import Service, _Empty
+
+if TYPE_CHECKING:
+    from snake_di._container import Container  # pragma: no cover
+
+
+@dataclass
+class _ThreadLocalResolver:
+    """Build ``Scope.thread`` services once per thread, on first access.
+
+    Every thread builds into its own container chained to the app services,
+    so built services are read without a lock. Exits of all threads are
+    collected under a lock and run when the container closes, including
+    exits of threads that already ended. Services depending on refreshed
+    app services are dropped in every thread and built again on next access.
+    """
+
+    factories: dict[Type[Service], _SyncFactory]
+    parent: _PrivateContainer
+    external_dependencies: set[Type[Service]] = field(init=False)
+    _local: threading.local = field(default_factory=threading.local, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _teardown: _SyncSerialTeardown = field(
+        default_factory=_SyncSerialTeardown, init=False
+    )
+    _threads: list[tuple[_PrivateContainer, dict[Type[Service], _ExitSlot]]] = field(
+        default_factory=list, init=False
+    )
+
+    def __post_init__(self):
+        self.external_dependencies = _external_dependencies(self.factories)
+
+    def __enter__(self) -> _ThreadLocalResolver:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        with self._lock:
+            return self._teardown.__exit__(exc_type, exc, traceback)
+
+    def get(self, service_type: Type[Service], parent: Container) -> Service:
+        container: Optional[_PrivateContainer] = getattr(self._local, "container", None)
+        if container is None:
+            container = self._local.container = self.parent.new_child()
+            self._local.slots = {}
+            with self._lock:
+                self._threads.append((container, self._local.slots))
+        service = container.data.get(service_type, _Empty.empty)
+        if service is _Empty.empty:
+            self._resolve(service_type, container, self._local.slots, parent)
+            service = container.data[service_type]
+        return service
+
+    def _resolve(
+        self,
+        service_type: Type[Service],
+        container: _PrivateContainer,
+        slots: dict[Type[Service], _ExitSlot],
+        parent: Container,
+    ):
+        if parent._lazy is not None:
+            for dependency in self.external_dependencies:
+                parent.get(dependency)
+        plan = BuildPlan.from_factories(self.factories, container, only=[service_type])
+        for factory in plan.factories:
+            context_manager = container.solve_sync_factory(factory)
+            service = type(context_manager).__enter__(context_manager)
+            with self._lock:
+                slot = slots[factory.service_type] = _ExitSlot(context_manager)
+                self._teardown.push_service_exit(factory.service_type, slot)
+                container.data[factory.service_type] = service
+
+    def drop_dependents(
+        self, service_types: list[Type[Service]], exit_services: bool = True
+    ):
+        """Drop services built from ``service_types`` in every thread.
+
+        Dropped services are exited in reverse build order, unless
+        ``exit_services`` is false, and built again on next access.
+        """
+        dropped = set(service_types)
+        while True:
+            dependents = {
+                service_type
+                for service_type, factory in self.factories.items()
+                if service_type not in dropped
+                and not dropped.isdisjoint(factory.dependencies)
+            }
+            if not dependents:
+                break
+            dropped |= dependents
+
+        error: Optional[BaseException] = None
+        with self._lock:
+            for container, slots in self._threads:
+                for built in reversed([built for built in slots if built in dropped]):
+                    del container.data[built]
+                    slot = slots.pop(built)
+                    if not exit_services:
+                        slot.context_manager = None
+                        continue
+                    try:
+                        slot.__exit__(None, None, None)
+                    except BaseException as exit_error:
+                        error = error or exit_error
+        if error is not None:
+            raise error
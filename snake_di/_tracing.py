@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    IO,
+    Any,
+    AsyncContextManager,
+    Callable,
+    ContextManager,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from snake_di._container import _PrivateContainer
+from snake_di._factory import _AsyncFactory, _BaseFactory, _Offload, _SyncFactory
+from snake_di._types import Service, TService
+
+
+class TraceEventKind(Enum):
+    factory_start = "factory_start"
+    factory_end = "factory_end"
+    teardown_start = "teardown_start"
+    teardown_end = "teardown_end"
+
+
+@dataclass(frozen=True)
+class TraceEvent:
+    kind: TraceEventKind
+    service_type: Type[Service]
+    dependencies: Tuple[Type[Service], ...]
+    timestamp: float  # time.perf_counter(), seconds
+    thread_id: int
+    error: Optional[BaseException] = None
+
+
+Tracer = Callable[[TraceEvent], None]
+
+
+def _emit(
+    tracer: Tracer,
+    kind: TraceEventKind,
+    factory: _BaseFactory,
+    error: Optional[BaseException] = None,
+):
+    tracer(
+        TraceEvent(
+            kind,
+            factory.service_type,
+            tuple(factory.dependencies),
+            time.perf_counter(),
+            threading.get_ident(),
+            error,
+        )
+    )
+
+
+@dataclass
+class _TracedContextManager:
+    context_manager: ContextManager
+    factory: _BaseFactory
+    tracer: Tracer
+
+    def __enter__(self) -> Service:
+        _emit(self.tracer, TraceEventKind.factory_start, self.factory)
+        try:
+            service = type(self.context_manager).__enter__(self.context_manager)
+        except BaseException as error:
+            _emit(self.tracer, TraceEventKind.factory_end, self.factory, error)
+            raise
+        _emit(self.tracer, TraceEventKind.factory_end, self.factory)
+        return service
+
+    def __exit__(self, exc_type, exc, traceback) -> Optional[bool]:
+        _emit(self.tracer, TraceEventKind.teardown_start, self.factory)
+        try:
+            suppress = type(self.context_manager).__exit__(
+                self.context_manager, exc_type, exc, traceback
+            )
+        except BaseException as error:
+            _emit(self.tracer, TraceEventKind.teardown_end, self.factory, error)
+            raise
+        _emit(self.tracer, TraceEventKind.teardown_end, self.factory)
+        return suppress
+
+
+@dataclass
+class _TracedAsyncContextManager:
+    context_manager: AsyncContextManager
+    factory: _BaseFactory
+    tracer: Tracer
+
+    async def __aenter__(self) -> Service:
+        _emit(self.tracer, TraceEventKind.factory_start, self.factory)
+        try:
+            service = await type(self.context_manager).__aenter__(self.context_manager)
+        except BaseException as error:
+            _emit(self.tracer, TraceEventKind.factory_end, self.factory, error)
+            raise
+        _emit(self.tracer, TraceEventKind.factory_end, self.factory)
+        return service
+
+    async def __aexit__(self, exc_type, exc, traceback) -> Optional[bool]:
+        _emit(self.tracer, TraceEventKind.teardown_start, self.factory)
+        try:
+            suppress = await type(self.context_manager).__aexit__(
+                self.context_manager, exc_type, exc, traceback
+            )
+        except BaseException as error:
+            _emit(self.tracer, TraceEventKind.teardown_end, self.factory, error)
+            raise
+        _emit(self.tracer, TraceEventKind.teardown_end, self.factory)
+        return suppress
+
+
+class _TracedContainer(_PrivateContainer):
+    """Container wrapping every solved factory to report its events to a tracer.
+
+    Builds without a tracer use a plain ``_PrivateContainer``, so they pay
+    nothing for tracing.
+    """
+
+    tracer: Tracer
+
+    @classmethod
+    def traced(cls, container: _PrivateContainer, tracer: Tracer) -> _TracedContainer:
+        traced = cls.from_data(container.data)
+        traced.tracer = tracer
+        return traced
+
+    def solve_async_factory(
+        self, factory: _AsyncFactory[TService], offload: _Offload = _Offload()
+    ) -> AsyncContextManager[TService]:
+        return _TracedAsyncContextManager(
+            super().solve_async_factory(factory, offload), factory, self.tracer
+        )
+
+    def solve_sync_factory(
+        self, factory: _SyncFactory[TService]
+    ) -> ContextManager[TService]:
+        return _TracedContextManager(
+            super().solve_sync_factory(factory), factory, self.tracer
+        )
+
+    def new_child(self) -> _PrivateContainer:
+        return _TracedContainer.traced(super().new_child(), self.tracer)
+
+
+_CHROME_PHASES = {
+    TraceEventKind.factory_start: ("build", "b"),
+    TraceEventKind.factory_end: ("build", "e"),
+    TraceEventKind.teardown_start: ("teardown", "b"),
+    TraceEventKind.teardown_end: ("teardown", "e"),
+}
+
+
+def _type_name(service_type: Type[Service]) -> str:
+    return getattr(service_type, "__qualname__", repr(service_type))
+
+
+@dataclass
+class ChromeTrace:
+    """Tracer collecting events into Chrome ``trace_event`` JSON.
+
+    Every build and teardown is exported as an async slice, so factories
+    built concurrently get their own track in Perfetto or ``chrome://tracing``.
+    """
+
+    events: list[TraceEvent] = field(default_factory=list)
+
+    def __call__(self, event: TraceEvent):
+        self.events.append(event)
+
+    def to_dict(self) -> dict[str, Any]:
+        start = self.events[0].timestamp if self.events else 0.0
+        open_ids: dict[tuple[str, Type[Service]], int] = {}
+        trace_events = []
+        for index, event in enumerate(self.events):
+            category, phase = _CHROME_PHASES[event.kind]
+            key = (category, event.service_type)
+            args: dict[str, Any] = {}
+            if phase == "b":
+                open_ids[key] = index
+                args["dependencies"] = [_type_name(dep) for dep in event.dependencies]
+            if event.error is not None:
+                args["error"] = repr(event.error)
+            trace_events.append(
+                {
+                    "name": _type_name(event.service_type),
+                    "cat": category,
+                    "ph": phase,
+                    "id": open_ids.pop(key, index) if phase == "e" else index,
+                    "ts": (event.timestamp - start) * 1_000_000,
+                    "pid": os.getpid(),
+                    "tid": event.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def dump(self, file: IO[str]):
+        json.dump(self.to_dict(), file)
@@ -7,7 +7,14 @@ Service: TypeAlias = Any
 ContainerDict = Dict[Type[Service], Service]
 
 TService = TypeVar("TService")
+TResult = TypeVar("TResult")
 
 
 class _Empty(Enum):
     empty = auto()
+
+
+class Scope(Enum):
+    app = auto()
+    request = auto()
+    thread = auto()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, Optional, Type
+
+from snake_di._container import _PrivateContainer
+from snake_di._exceptions import DependencyGraphError
+from snake_di._factory import _BaseFactory
+from snake_di._tracing import _type_name
+from snake_di._types import Scope, Service
+
+
+@dataclass(frozen=True)
+class GraphValidation:
+    """Missing services with the services requiring them and dependency cycles.
+
+    A service requested directly with ``only`` is missing with no requiring
+    services. Every cycle is a path ending with the service it starts with.
+    """
+
+    missing: dict[Type[Service], tuple[Type[Service], ...]]
+    cycles: tuple[tuple[Type[Service], ...], ...]
+
+    @classmethod
+    def from_factories(
+        cls,
+        factories: Mapping[Type[Service], _BaseFactory],
+        container: _PrivateContainer,
+        only: Optional[Iterable[Type[Service]]] = None,
+    ) -> GraphValidation:
+        roots = list(factories if only is None else only)
+        missing: dict[Type[Service], list[Type[Service]]] = {
+            service_type: []
+            for service_type in roots
+            if service_type not in factories and service_type not in container.data
+        }
+        cycles: list[tuple[Type[Service], ...]] = []
+
+        # Iterative depth first search, a dependency already on the path
+        # closes a cycle
+        path: dict[Type[Service], int] = {}
+        visited: set[Type[Service]] = set()
+        for root in roots:
+            if root not in factories or root in visited:
+                continue
+            visited.add(root)
+            path[root] = 0
+            stack: list[tuple[Type[Service], Iterator[Type[Service]]]] = [
+                (root, iter(factories[root].dependencies))
+            ]
+            while stack:
+                service_type, dependencies = stack[-1]
+                for dependency in dependencies:
+                    if not _is_factory_dependency(factories, service_type, dependency):
+                        if dependency not in container.data:
+                            missing.setdefault(dependency, []).append(service_type)
+                    elif dependency in path:
+                        cycle = islice(path, path[dependency], None)
+                        cycles.append((*cycle, dependency))
+                    elif dependency not in visited:
+                        visited.add(dependency)
+                        path[dependency] = len(path)
+                        stack.append(
+                            (dependency, iter(factories[dependency].dependencies))
+                        )
+                        break
+                else:
+                    stack.pop()
+                    del path[service_type]
+
+        return cls(
+            {
+                service_type: tuple(requiring)
+                for service_type, requiring in missing.items()
+            },
+            tuple(cycles),
+        )
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.missing and not self.cycles
+
+    def raise_if_invalid(self):
+        if not self.is_valid:
+            raise DependencyGraphError(self)
+
+    def report(self) -> str:
+        lines = ["Can not solve the dependency graph:"]
+        for service_type, requiring in self.missing.items():
+            line = f"  {_type_name(service_type)} is missing"
+            if requiring:
+                line += f", required by {', '.join(map(_type_name, requiring))}"
+            lines.append(line)
+        for cycle in self.cycles:
+            lines.append(f"  cycle {' -> '.join(map(_type_name, cycle))}")
+        return "\n".join(lines)
+
+
+def _is_factory_dependency(
+    factories: Mapping[Type[Service], _BaseFactory],
+    service_type: Type[Service],
+    dependency: Type[Service],
+) -> bool:
+    # services can depend on app services and services of their own scope
+    factory = factories.get(dependency)
+    return factory is not None and (
+        factory.scope is Scope.app or factories[service_type].scope is factory.scope
+    )
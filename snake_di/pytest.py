@@ -1,20 +1,61 @@
 import functools
 import inspect
-from typing import Callable
+from contextlib import AsyncExitStack, ExitStack, contextmanager
+from typing import Callable, ContextManager, Dict, FrozenSet, Iterator, Optional, Type
 
-from snake_di import AsyncProvider, Provider
+import pytest
+
+from snake_di import AsyncProvider, Container, Provider
 from snake_di._provider import _BaseProvider
+from snake_di._types import Service
+
+_SCOPES = ("session", "package", "module", "class", "function")
+_containers_key = pytest.StashKey[Dict[int, Container]]()
+
 
+def pytest_provide(provider: Provider, scope: str = "function"):
+    """Inject provider services into the decorated test.
+
+    Only the services the test asks for and their dependencies are built.
+    With ``scope`` other than ``"function"`` app services are built once per
+    pytest scope and torn down when the scope ends, while ``Scope.request``
+    factories are still built for every test.
+    """
+    if scope not in _SCOPES:
+        raise ValueError(f"scope must be one of {_SCOPES}, got {scope!r}")
 
-def pytest_provide(provider: Provider):
     def decorate(initial_test: Callable):
-        @functools.wraps(initial_test)
-        def new_test_func(*args, **kwargs):
-            with provider.build() as container:
-                return container.partial_solve(initial_test)(*args, **kwargs)
+        injector = provider.injector(initial_test)
+        targets, needs_scope = provider._app_targets(injector.parameters.values())
+        requests_fixture = "request" in inspect.signature(initial_test).parameters
+
+        def test_container(kwargs: dict) -> ContextManager[Container]:
+            request = None
+            if scope != "function":
+                request = (
+                    kwargs["request"] if requests_fixture else kwargs.pop("request")
+                )
+            return _test_container(provider, scope, request, targets, needs_scope)
+
+        if inspect.iscoroutinefunction(initial_test):
+
+            @functools.wraps(initial_test)
+            async def new_async_test_func(*args, **kwargs):
+                with test_container(kwargs) as container:
+                    return await injector.call(container, *args, **kwargs)
+
+            new_test_func: Callable = new_async_test_func
+        else:
+
+            @functools.wraps(initial_test)
+            def new_sync_test_func(*args, **kwargs):
+                with test_container(kwargs) as container:
+                    return injector.call(container, *args, **kwargs)
+
+            new_test_func = new_sync_test_func
 
         new_test_func.__signature__ = _fix_signature(  # type: ignore[attr-defined]
-            provider, initial_test
+            provider, initial_test, with_request=scope != "function"
         )
         _inherit_pytest_mark(new_test_func, initial_test)
         return new_test_func
@@ -24,10 +65,18 @@ def pytest_provide(provider: Provider):
 
 def pytest_provide_async(provider: AsyncProvider):
     def decorate(initial_test: Callable):
+        injector = provider.injector(initial_test)
+        targets, needs_scope = provider._app_targets(injector.parameters.values())
+
         @functools.wraps(initial_test)
         async def new_test_func(*args, **kwargs):
-            async with provider.build_async() as container:
-                return await container.partial_solve(initial_test)(*args, **kwargs)
+            async with AsyncExitStack() as stack:
+                container = await stack.enter_async_context(
+                    provider.build_async(only=targets)
+                )
+                if needs_scope:
+                    container = await stack.enter_async_context(container.scope_async())
+                return await injector.call(container, *args, **kwargs)
 
         new_test_func.__signature__ = _fix_signature(  # type: ignore[attr-defined]
             provider, initial_test
@@ -38,10 +87,57 @@ def pytest_provide_async(provider: AsyncProvider):
     return decorate
 
 
-def _fix_signature(provider: _BaseProvider, initial_test: Callable):
+@contextmanager
+def _test_container(
+    provider: Provider,
+    scope: str,
+    request: Optional[pytest.FixtureRequest],
+    targets: FrozenSet[Type[Service]],
+    needs_scope: bool,
+) -> Iterator[Container]:
+    with ExitStack() as stack:
+        if scope == "function":
+            container = stack.enter_context(provider.build(only=targets))
+        else:
+            assert request is not None
+            container = _scoped_container(provider, _scope_node(request, scope))
+        if needs_scope:
+            container = stack.enter_context(container.scope())
+        yield container
+
+
+def _scope_node(request: pytest.FixtureRequest, scope: str) -> pytest.Collector:
+    if scope == "session":
+        return request.session
+    node_types = {"package": pytest.Package, "class": pytest.Class}
+    node = None
+    if scope in node_types:
+        node = request.node.getparent(node_types[scope])
+    return node or request.node.getparent(pytest.Module)
+
+
+def _scoped_container(provider: Provider, node: pytest.Collector) -> Container:
+    containers: Dict[int, Container] = node.stash.setdefault(_containers_key, {})
+    container = containers.get(id(provider))
+    if container is None:
+        stack = ExitStack()
+        container = containers[id(provider)] = stack.enter_context(
+            provider.build(lazy=True)
+        )
+        node.addfinalizer(stack.close)
+    return container
+
+
+def _fix_signature(
+    provider: _BaseProvider, initial_test: Callable, with_request: bool = False
+):
     initial_sig = inspect.signature(initial_test)
     parameters = list(initial_sig.parameters.values())
     new_parameters = [param for param in parameters if param.annotation not in provider]
+    if with_request and "request" not in initial_sig.parameters:
+        new_parameters.append(
+            inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY)
+        )
     return initial_sig.replace(parameters=new_parameters)
 
 
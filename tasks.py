@@ -20,6 +20,11 @@ def coverage_report(c):
     c.run("coverage report -m --fail-under=100")
 
 
+@task
+def benchmark(c, output="benchmark-results.json"):
+    c.run(f"python -m benchmarks.run --output {output}")
+
+
 @task
 def compile_requirements(c):
     env = 'CUSTOM_COMPILE_COMMAND="invoke compile-requirements"'
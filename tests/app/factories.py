@@ -1,13 +1,30 @@
-from typing import AsyncIterator, Iterator
+import asyncio
+import inspect
+import sys
+import threading
+import time
+from typing import AsyncIterator, Callable, Iterator, Optional
 
-from snake_di import AsyncProvider, Provider
+from snake_di import AsyncProvider, Provider, Scope
 from tests.app.services import (
     AsyncDatabase,
     AsyncDatabaseEngine,
+    Client,
+    Concurrency,
+    Connection,
+    Connections,
     Database,
     DatabaseEngine,
+    Events,
+    Notifier,
+    Queue,
+    Redis,
+    Session,
     Settings,
+    TeardownDelays,
     UserManager,
+    Vocabularies,
+    Vocabulary,
 )
 
 provider = Provider()
@@ -46,3 +63,172 @@ async def provide_user_manager(
 ) -> UserManager:
     await async_db.find()
     return UserManager(sync_db, async_db)
+
+
+fork_unsafe_provider = Provider.merge(provider)
+
+
+@fork_unsafe_provider.include_factory(service_type=DatabaseEngine, fork_safe=False)
+def provide_fork_unsafe_engine(settings: Settings) -> Iterator[DatabaseEngine]:
+    with DatabaseEngine.open(settings.db_uri) as engine:
+        yield engine
+
+
+thread_provider = Provider.merge(provider)
+
+
+@thread_provider.include_factory(service_type=Client, scope=Scope.thread)
+def provide_client(engine: DatabaseEngine) -> Iterator[Client]:
+    client = Client(engine)
+    yield client
+    client.is_opened = False
+
+
+thread_provider.include_factory(Session, service_type=Session, scope=Scope.thread)
+
+
+def provide_connection(
+    settings: Settings, connections: Connections
+) -> Iterator[Connection]:
+    with Connection.open(settings.db_uri) as connection:
+        connections.append(connection)
+        yield connection
+
+
+def provide_vocabulary(path: str, vocabularies: Vocabularies) -> Iterator[Vocabulary]:
+    with Vocabulary.open(path) as vocabulary:
+        vocabularies.append(vocabulary)
+        yield vocabulary
+
+
+invalid_provider = Provider()
+
+
+@invalid_provider.include_factory
+def provide_unsolvable_int(_: str, __: float) -> int:
+    return 1  # pragma: no cover
+
+
+@invalid_provider.include_factory
+def provide_cyclic_str(_: int) -> str:
+    return "str"  # pragma: no cover
+
+
+@invalid_provider.include_factory
+def provide_cyclic_bytes(_: float, __: bytes) -> bytes:
+    return b""  # pragma: no cover
+
+
+@invalid_provider.include_factory
+def provide_solvable_settings(events: Events) -> Settings:
+    events.append("settings")
+    return Settings("db_uri")
+
+
+barrier_provider = Provider()
+
+
+@barrier_provider.include_factory(service_type=Redis)
+def provide_redis(barrier: threading.Barrier, events: Events) -> Iterator[Redis]:
+    barrier.wait()
+    yield Redis()
+    events.append("redis start")
+    barrier.wait()
+    events.append("redis end")
+
+
+@barrier_provider.include_factory(service_type=Queue)
+def provide_queue(barrier: threading.Barrier, events: Events) -> Iterator[Queue]:
+    barrier.wait()
+    yield Queue()
+    events.append("queue start")
+    barrier.wait()
+    events.append("queue end")
+
+
+@barrier_provider.include_factory(service_type=Notifier)
+def provide_notifier(redis: Redis, queue: Queue, events: Events) -> Iterator[Notifier]:
+    yield Notifier(redis, queue)
+    events.append("notifier start")
+    time.sleep(0.01)
+    events.append("notifier end")
+
+
+teardown_provider = AsyncProvider()
+
+
+@teardown_provider.include_factory(service_type=Redis)
+async def provide_async_redis(
+    events: Events, delays: TeardownDelays
+) -> AsyncIterator[Redis]:
+    yield Redis()
+    events.append("redis start")
+    await asyncio.sleep(delays.get("redis", 0))
+    events.append("redis end")
+
+
+@teardown_provider.include_factory(service_type=Queue)
+async def provide_async_queue(
+    events: Events, delays: TeardownDelays
+) -> AsyncIterator[Queue]:
+    yield Queue()
+    events.append("queue start")
+    await asyncio.sleep(delays.get("queue", 0))
+    events.append("queue end")
+
+
+@teardown_provider.include_factory(service_type=Notifier)
+async def provide_async_notifier(
+    redis: Redis, queue: Queue, events: Events, delays: TeardownDelays
+) -> AsyncIterator[Notifier]:
+    yield Notifier(redis, queue)
+    events.append("notifier start")
+    await asyncio.sleep(delays.get("notifier", 0))
+    events.append("notifier end")
+
+
+independent_provider = AsyncProvider()
+
+
+async def provide_independent_service(concurrency: Concurrency) -> object:
+    concurrency.active += 1
+    concurrency.max_active = max(concurrency.max_active, concurrency.active)
+    await asyncio.sleep(0.01)
+    concurrency.active -= 1
+    return object()
+
+
+for index in range(4):
+    independent_provider.include_factory(
+        provide_independent_service, service_type=type(f"Service{index}", (), {})
+    )
+
+
+CHAIN_LENGTH = sys.getrecursionlimit() * 2
+chain_provider = Provider()
+
+
+def make_chain_link(index: int, previous: Optional[type]) -> Callable:
+    def provide_link(events: Events, *_: object) -> Iterator[int]:
+        events.append(f"enter {index}")
+        yield index
+        events.append(f"exit {index}")
+
+    parameters = [
+        inspect.Parameter(name, inspect.Parameter.POSITIONAL_ONLY, annotation=type_)
+        for name, type_ in (("events", Events), ("previous", previous))
+        if type_ is not None
+    ]
+    provide_link.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        parameters
+    )
+    return provide_link
+
+
+previous_link: Optional[type] = None
+for index in range(CHAIN_LENGTH):
+    link = type(f"Link{index}", (), {})
+    chain_provider.include_factory(
+        make_chain_link(index, previous_link), service_type=link
+    )
+    previous_link = link
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from tests.app.services import Settings
+
+
+@dataclass
+class Engine:
+    db_uri: str
+    is_opened: bool = False
+
+
+def provide_engine(settings: Settings) -> Iterator[Engine]:
+    engine = Engine(settings.db_uri, True)
+    yield engine
+    engine.is_opened = False
+
+
+async def provide_async_engine(settings: Settings) -> Engine:
+    return Engine(settings.db_uri, True)
@@ -1,6 +1,7 @@
+import threading
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
-from typing import AsyncIterator, Iterator
+from typing import AsyncIterator, Dict, Iterator, List
 
 
 @dataclass
@@ -71,3 +72,79 @@ class UserManager:
         assert type(self.sync_db) is Database
         assert type(self.async_db) is AsyncDatabase
         return "user"
+
+
+@dataclass
+class Connection:
+    db_uri: str
+    is_opened: bool = False
+
+    @classmethod
+    @contextmanager
+    def open(cls, db_uri: str) -> Iterator["Connection"]:
+        connection = cls(db_uri)
+        connection.is_opened = True
+        yield connection
+        connection.is_opened = False
+
+
+class Connections(List[Connection]):
+    ...
+
+
+@dataclass
+class Vocabulary:
+    path: str
+    is_opened: bool = False
+
+    @classmethod
+    @contextmanager
+    def open(cls, path: str) -> Iterator["Vocabulary"]:
+        vocabulary = cls(path)
+        vocabulary.is_opened = True
+        yield vocabulary
+        vocabulary.is_opened = False
+
+
+class Vocabularies(List[Vocabulary]):
+    ...
+
+
+class Client:
+    def __init__(self, engine: DatabaseEngine):
+        self.engine = engine
+        self.thread = threading.get_ident()
+        self.is_opened = True
+
+
+@dataclass
+class Session:
+    client: Client
+
+
+class Events(List[str]):
+    ...
+
+
+class TeardownDelays(Dict[str, float]):
+    ...
+
+
+@dataclass
+class Concurrency:
+    active: int = 0
+    max_active: int = 0
+
+
+class Redis:
+    ...
+
+
+class Queue:
+    ...
+
+
+@dataclass
+class Notifier:
+    redis: Redis
+    queue: Queue
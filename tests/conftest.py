@@ -1,5 +1,7 @@
 import pytest
 
+pytest_plugins = ["pytester"]
+
 SYNC_FIXTURE_VALUE = object()
 ASYNC_FIXTURE_VALUE = object()
 
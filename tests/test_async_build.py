@@ -0,0 +1,272 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, Provider, TeardownTimeoutError
+from tests.app.factories import (
+    async_provider,
+    independent_provider,
+    provider,
+    teardown_provider,
+)
+from tests.app.services import (
+    Concurrency,
+    Events,
+    Notifier,
+    Queue,
+    Redis,
+    TeardownDelays,
+    UserManager,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    # concurrent builds and teardowns require asyncio
+    return "asyncio"
+
+
+any_backend = pytest.mark.parametrize("anyio_backend", ["asyncio", "trio"])
+
+
+async def test_concurrent_build():
+    async with (provider | async_provider).build_async(concurrent=True) as container:
+        assert await container[UserManager].create_user() == "user"
+
+
+async def test_independent_factories_overlap():
+    concurrency = Concurrency()
+    provider_ = independent_provider | Provider.from_dict({Concurrency: concurrency})
+    async with provider_.build_async(concurrent=True) as container:
+        assert len(container.keys()) == 5
+    assert concurrency.max_active == 4
+
+
+async def test_max_concurrency():
+    concurrency = Concurrency()
+    provider_ = independent_provider | Provider.from_dict({Concurrency: concurrency})
+    async with provider_.build_async(concurrent=True, max_concurrency=2):
+        ...
+    assert concurrency.max_active == 2
+
+    with pytest.raises(ValueError):
+        async with AsyncProvider().build_async(concurrent=True, max_concurrency=0):
+            ...
+
+
+async def test_fail_fast():
+    events = []
+
+    @AsyncProvider.from_factory(service_type=int)
+    async def provide_int() -> AsyncIterator[int]:
+        try:
+            yield 1
+        finally:
+            events.append("int teardown")
+
+    @provide_int.include_factory
+    async def provide_str() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("str cancelled")
+            raise
+        return "str"  # pragma: no cover
+
+    @provide_int.include_factory(service_type=bytes)
+    async def provide_bytes_ignoring_cancel() -> AsyncIterator[bytes]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("bytes cancelled")
+        try:
+            yield b"bytes"
+        finally:
+            events.append("bytes teardown")
+
+    @provide_int.include_factory
+    async def provide_float(_: int) -> float:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        async with provide_int.build_async(concurrent=True):
+            ...  # pragma: no cover
+    assert sorted(events) == [
+        "bytes cancelled",
+        "bytes teardown",
+        "int teardown",
+        "str cancelled",
+    ]
+
+
+async def test_concurrent_teardown():
+    events = Events()
+    delays = TeardownDelays(queue=0.01, redis=0.01)
+    provider_ = teardown_provider | Provider.from_dict(
+        {Events: events, TeardownDelays: delays}
+    )
+    async with provider_.build_async(concurrent_teardown=True):
+        ...
+    assert events[:2] == ["notifier start", "notifier end"]
+    assert sorted(events[2:4]) == ["queue start", "redis start"]
+    assert sorted(events[4:]) == ["queue end", "redis end"]
+
+
+async def test_factory_teardown_timeout():
+    events = Events()
+    provider_ = teardown_provider | Provider.from_dict(
+        {Events: events, TeardownDelays: TeardownDelays(notifier=10)}
+    )
+    with pytest.raises(TeardownTimeoutError) as error_info:
+        async with provider_.build_async(
+            concurrent_teardown=True, factory_teardown_timeout=0.01
+        ):
+            ...
+    assert error_info.value.service_types == [Notifier]
+    assert "notifier end" not in events
+    assert {"queue end", "redis end"} < set(events)
+
+
+async def test_teardown_timeout():
+    events = Events()
+    provider_ = teardown_provider | Provider.from_dict(
+        {Events: events, TeardownDelays: TeardownDelays(notifier=10)}
+    )
+    with pytest.raises(TeardownTimeoutError) as error_info:
+        async with provider_.build_async(
+            concurrent_teardown=True, teardown_timeout=0.01
+        ):
+            ...
+    assert set(error_info.value.service_types) == {Notifier, Queue, Redis}
+    assert events == ["notifier start"]
+
+
+async def test_teardown_timeout_requires_concurrent_teardown():
+    with pytest.raises(ValueError):
+        async with AsyncProvider().build_async(teardown_timeout=1):
+            ...  # pragma: no cover
+
+
+async def test_concurrent_teardown_errors():
+    @AsyncProvider.from_factory(service_type=int)
+    async def provide_int() -> AsyncIterator[int]:
+        try:
+            yield 1
+        finally:
+            raise KeyError
+
+    with pytest.raises(KeyError) as error_info:
+        async with provide_int.build_async(concurrent_teardown=True):
+            raise ValueError
+    assert type(error_info.value.__context__) is ValueError
+
+    @AsyncProvider.from_factory(service_type=int)
+    async def provide_suppressing_int() -> AsyncIterator[int]:
+        try:
+            yield 1
+        except ValueError:
+            pass
+
+    async with provide_suppressing_int.build_async(concurrent_teardown=True):
+        raise ValueError
+
+
+@pytest.mark.parametrize("anyio_backend", ["trio"])
+async def test_concurrent_build_requires_asyncio():
+    with pytest.raises(RuntimeError):
+        async with async_provider.build_async(concurrent=True):
+            ...  # pragma: no cover
+
+
+@pytest.mark.parametrize("anyio_backend", ["trio"])
+async def test_concurrent_teardown_requires_asyncio():
+    with pytest.raises(RuntimeError):
+        async with async_provider.build_async(concurrent_teardown=True):
+            ...  # pragma: no cover
+
+
+@any_backend
+async def test_blocking_factories():
+    main_thread = threading.get_ident()
+    threads = {}
+
+    @Provider.from_factory(blocking=True)
+    def provide_int() -> int:
+        threads["int"] = threading.get_ident()
+        return 1
+
+    @provide_int.include_factory(service_type=str, blocking=True)
+    def provide_str(_: int) -> Iterator[str]:
+        threads["str enter"] = threading.get_ident()
+        yield "str"
+        threads["str exit"] = threading.get_ident()
+
+    @provide_int.include_factory
+    def provide_float() -> float:
+        threads["float"] = threading.get_ident()
+        return 1.0
+
+    async with provide_int._to_async_provider().build_async() as container:
+        assert container[str] == "str"
+    assert threads.pop("float") == main_thread
+    assert main_thread not in threads.values()
+
+    threads.clear()
+    async with provide_int._to_async_provider().compile().build_async() as container:
+        assert container[str] == "str"
+    assert threads.pop("float") == main_thread
+    assert main_thread not in threads.values()
+
+
+async def test_offload_sync_with_executor():
+    @AsyncProvider.from_factory
+    def provide_thread_name() -> str:
+        return threading.current_thread().name
+
+    with ThreadPoolExecutor(thread_name_prefix="blocking") as executor:
+        async with provide_thread_name.build_async(
+            offload_sync=True, executor=executor
+        ) as container:
+            assert container[str].startswith("blocking")
+
+
+@pytest.mark.parametrize("anyio_backend", ["trio"])
+async def test_offload_executor_requires_asyncio():
+    @AsyncProvider.from_factory(blocking=True)
+    def provide_int() -> int:
+        return 1  # pragma: no cover
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(RuntimeError):
+            async with provide_int.build_async(executor=executor):
+                ...  # pragma: no cover
+
+
+@any_backend
+async def test_blocking_factory_teardown_errors():
+    @AsyncProvider.from_factory(service_type=int, blocking=True)
+    def provide_int() -> Iterator[int]:
+        try:
+            yield 1
+        except KeyError:
+            pass
+
+    async with provide_int.build_async():
+        raise KeyError
+
+    with pytest.raises(ValueError):
+        async with provide_int.build_async():
+            raise ValueError
+
+
+def test_async_factory_can_not_be_blocking():
+    with pytest.raises(TypeError):
+
+        @AsyncProvider.from_factory(blocking=True)
+        async def provide_int() -> int:
+            return 1  # pragma: no cover
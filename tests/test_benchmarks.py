@@ -0,0 +1,27 @@
+import json
+
+import pytest
+
+from benchmarks.graphs import SHAPES, make_provider
+from benchmarks.run import main
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_graph_shapes(shape: str):
+    provider = make_provider(shape, 20)
+    assert len(provider.build_plan()) == 20
+    with provider.build() as container:
+        assert len(container.keys()) == 20
+
+
+def test_benchmark_results(tmp_path):
+    output = tmp_path / "results.json"
+    main(["--sizes", "5", "--repeat", "1", "--output", str(output)])
+    report = json.loads(output.read_text())
+    assert [result["shape"] for result in report["results"]] == list(SHAPES)
+    assert report["results"][0]["build_seconds"] > 0
+    assert report["results"][0]["merge_seconds"] > 0
+    assert report["results"][0]["resolve_seconds"] > 0
+
+    main(["--sizes", "5", "--max-merge-size", "1", "--output", str(output)])
+    assert "merge_seconds" not in json.loads(output.read_text())["results"][0]
@@ -0,0 +1,64 @@
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, Provider
+from tests.app.factories import CHAIN_LENGTH, chain_provider
+from tests.app.services import Events
+
+pytestmark = pytest.mark.anyio
+
+
+def test_deep_chain_without_recursion():
+    events = Events()
+    provider_ = chain_provider | Provider.from_dict({Events: events})
+    with provider_.build() as container:
+        assert len(container.keys()) == CHAIN_LENGTH + 1
+    assert events[:CHAIN_LENGTH] == [f"enter {i}" for i in range(CHAIN_LENGTH)]
+    assert events[CHAIN_LENGTH:] == [f"exit {i}" for i in reversed(range(CHAIN_LENGTH))]
+
+
+async def test_deep_chain_without_recursion_async():
+    events = Events()
+    provider_ = chain_provider | Provider.from_dict({Events: events})
+    async with provider_._to_async_provider().build_async():
+        ...
+    assert events[CHAIN_LENGTH:] == [f"exit {i}" for i in reversed(range(CHAIN_LENGTH))]
+
+
+def test_factory_exception_tears_down_built_services():
+    events = []
+
+    @Provider.from_factory(service_type=int)
+    def provide_int() -> Iterator[int]:
+        events.append("int enter")
+        try:
+            yield 1
+        finally:
+            events.append("int exit")
+
+    @provide_int.include_factory
+    def provide_str(_: int) -> str:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        with provide_int.build():
+            ...
+    assert events == ["int enter", "int exit"]
+
+
+async def test_body_exception_reaches_factories():
+    caught = []
+
+    @AsyncProvider.from_factory(service_type=int)
+    async def provide_int() -> AsyncIterator[int]:
+        try:
+            yield 1
+        except ValueError as error:
+            caught.append(error)
+            raise
+
+    with pytest.raises(ValueError):
+        async with provide_int.build_async():
+            raise ValueError
+    assert len(caught) == 1
@@ -0,0 +1,127 @@
+import pytest
+
+from snake_di import Provider
+from tests.app.factories import async_provider, provider
+from tests.app.services import (
+    AsyncDatabase,
+    AsyncDatabaseEngine,
+    Database,
+    DatabaseEngine,
+    Settings,
+    UserManager,
+)
+
+
+def test_build_plan_order():
+    plan = (provider | async_provider).build_plan()
+    order = [factory.service_type for factory in plan.factories]
+    assert len(plan) == 6
+    assert order.index(Settings) < order.index(DatabaseEngine)
+    assert order.index(DatabaseEngine) < order.index(Database)
+    assert order.index(AsyncDatabaseEngine) < order.index(AsyncDatabase)
+    assert order.index(Database) < order.index(UserManager)
+    assert order.index(AsyncDatabase) < order.index(UserManager)
+
+
+def test_build_plan_skips_container_services():
+    provider_ = provider | Provider.from_dict({Settings: Settings("other")})
+    order = [factory.service_type for factory in provider_.build_plan().factories]
+    assert order == [DatabaseEngine, Database]
+
+
+def test_build_plan_cached():
+    provider_ = provider.copy()
+    plan = provider_.build_plan()
+    assert provider_.build_plan() is plan
+
+    @provider_.include_factory
+    def provide_int() -> int:
+        return 1
+
+    assert provider_.build_plan() is not plan
+    assert len(provider_.build_plan()) == len(plan) + 1
+
+
+def test_build_plan_unsolvable():
+    calls = []
+
+    @Provider.from_factory
+    def provide_int() -> int:
+        calls.append(int)
+        return 1
+
+    @provide_int.include_factory
+    def provide_str(_: float) -> str:
+        return "str"
+
+    with pytest.raises(RuntimeError):
+        provide_int.build_plan()
+
+    with pytest.raises(RuntimeError):
+        with provide_int.build():
+            ...
+    assert calls == []
+
+
+def test_build_plan_cycle():
+    @Provider.from_factory
+    def provide_int(_: str) -> int:
+        return 1
+
+    @provide_int.include_factory
+    def provide_str(_: int) -> str:
+        return "str"
+
+    with pytest.raises(RuntimeError):
+        provide_int.build_plan()
+
+
+def test_selective_build():
+    with provider.build(only=[Database]) as container:
+        assert container.keys() == {Settings, DatabaseEngine, Database}
+
+    with provider.build(only=[Settings]) as container:
+        assert container.keys() == {Settings}
+
+    provider_ = provider | Provider.from_dict({Settings: Settings("other")})
+    with provider_.build(only=[Settings]) as container:
+        assert container.keys() == {Settings}
+
+
+@pytest.mark.anyio
+async def test_selective_build_async():
+    async with (provider | async_provider).build_async(
+        only=[AsyncDatabase]
+    ) as container:
+        assert container.keys() == {Settings, AsyncDatabaseEngine, AsyncDatabase}
+
+
+def test_selective_build_plan_cached():
+    plan = provider.build_plan(only=[Database, Settings])
+    assert provider.build_plan(only=(Settings, Database)) is plan
+    assert provider.build_plan() is not plan
+
+
+def test_selective_build_unsolvable():
+    calls = []
+
+    @Provider.from_factory
+    def provide_int() -> int:
+        calls.append(int)
+        return 1
+
+    @provide_int.include_factory
+    def provide_str(_: float) -> str:
+        return "str"  # pragma: no cover
+
+    with provide_int.build(only=[int]) as container:
+        assert container[int] == 1
+
+    calls.clear()
+    with pytest.raises(RuntimeError):
+        with provide_int.build(only=[int, str]):
+            ...  # pragma: no cover
+    with pytest.raises(RuntimeError):
+        with provide_int.build(only=[bytes]):
+            ...  # pragma: no cover
+    assert calls == []
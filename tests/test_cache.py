@@ -0,0 +1,178 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import ContextManager, Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, FactoryCache, Provider
+from tests.app.factories import provide_vocabulary
+from tests.app.services import Vocabularies, Vocabulary
+
+path_provider = Provider.from_dict({str: "vocab.txt"})
+
+
+def test_cached_across_builds():
+    vocabularies = Vocabularies()
+    cache = FactoryCache()
+    provider_ = Provider.from_dict({str: "vocab.txt", Vocabularies: vocabularies})
+    provider_.include_factory(provide_vocabulary, service_type=Vocabulary, cache=cache)
+    with provider_.build() as container:
+        vocabulary = container[Vocabulary]
+    with Provider.merge(provider_).build() as container:
+        assert container[Vocabulary] is vocabulary
+    assert vocabularies == [vocabulary]
+    assert len(cache) == 1
+    assert vocabulary.is_opened
+
+    with (provider_ | Provider.from_dict({str: "other.txt"})).build() as container:
+        assert container[Vocabulary].path == "other.txt"
+    assert len(cache) == 2
+
+    cache.invalidate("vocab.txt", vocabularies)
+    assert not vocabulary.is_opened
+    assert len(cache) == 1
+    cache.invalidate("missing.txt", vocabularies)
+
+    cache.clear()
+    assert not any(vocabulary.is_opened for vocabulary in vocabularies)
+    assert len(cache) == 0
+
+
+def test_lru_and_ttl_eviction():
+    vocabularies = Vocabularies()
+    evicted: list = []
+    cache = FactoryCache(max_size=2, on_evict=evicted.append)
+    provider_ = Provider.from_dict({Vocabularies: vocabularies})
+    provider_.include_factory(provide_vocabulary, service_type=Vocabulary, cache=cache)
+    for path in ["a", "b", "a", "c"]:
+        with (provider_ | Provider.from_dict({str: path})).build():
+            pass
+    assert [vocabulary.path for vocabulary in vocabularies] == ["a", "b", "c"]
+    assert evicted == [vocabularies[1]]
+    assert not vocabularies[1].is_opened
+    assert vocabularies[0].is_opened and vocabularies[2].is_opened
+
+    vocabularies = Vocabularies()
+    cache = FactoryCache(ttl=0.01)
+    provider_ = Provider.from_dict({str: "vocab.txt", Vocabularies: vocabularies})
+    provider_.include_factory(provide_vocabulary, service_type=Vocabulary, cache=cache)
+    with provider_.build():
+        pass
+    time.sleep(0.02)
+    with provider_.build() as container:
+        assert container[Vocabulary] is vocabularies[1]
+    assert not vocabularies[0].is_opened
+    time.sleep(0.02)
+    cache.evict_expired()
+    assert not vocabularies[1].is_opened
+    assert len(cache) == 0
+
+
+def test_unhashable_dependencies_by_identity():
+    provider_ = Provider.from_dict({list: [1, 2]})
+    calls: list = []
+
+    @provider_.include_factory(cache=FactoryCache(max_size=None))
+    def provide_sum(numbers: list) -> int:
+        calls.append(numbers)
+        return sum(numbers)
+
+    numbers = [1, 2]
+    for _ in range(2):
+        with (provider_ | Provider.from_dict({list: numbers})).build() as container:
+            assert container[int] == 3
+    with (provider_ | Provider.from_dict({list: [1, 2]})).build():
+        pass
+    assert len(calls) == 2
+
+
+def test_eviction_errors():
+    provider_ = Provider()
+
+    def fail(value: str):
+        raise ValueError("on_evict failed")
+
+    cache = FactoryCache(on_evict=fail)
+
+    @provider_.include_factory(service_type=str, cache=cache)
+    def provide_str() -> Iterator[str]:
+        yield "value"
+        raise KeyError("teardown failed")
+
+    with provider_.build():
+        pass
+    with pytest.raises(ValueError):
+        cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        FactoryCache(max_size=0)
+
+    async def provide_async_str() -> str:
+        return ""  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        AsyncProvider().include_factory(provide_async_str, cache=FactoryCache())
+
+
+def test_cache_shared_by_factories():
+    cache = FactoryCache()
+    provider_ = Provider.merge(path_provider)
+
+    @provider_.include_factory(cache=cache)
+    def provide_length(path: str) -> int:
+        return len(path)
+
+    @provider_.include_factory(cache=cache)
+    def provide_upper(path: str) -> bytes:
+        return path.upper().encode()
+
+    with provider_.build() as container:
+        assert container[int] == 9
+        assert container[bytes] == b"VOCAB.TXT"
+    assert len(cache) == 2
+    cache.invalidate("vocab.txt")
+    assert len(cache) == 0
+
+
+def test_factory_building_through_same_cache():
+    cache = FactoryCache()
+    inner_provider = Provider.from_dict(
+        {str: "vocab.txt", Vocabularies: Vocabularies()}
+    )
+    inner_provider.include_factory(
+        provide_vocabulary, service_type=Vocabulary, cache=cache
+    )
+    provider_ = Provider.merge(path_provider)
+
+    @provider_.include_factory(cache=cache)
+    def provide_path_length(path: str) -> int:
+        with inner_provider.build() as container:
+            return len(container[Vocabulary].path)
+
+    with provider_.build() as container:
+        assert container[int] == 9
+    assert len(cache) == 2
+
+
+def test_concurrent_builds_of_an_entry():
+    cache = FactoryCache()
+    started, release = threading.Event(), threading.Event()
+    calls: list = []
+
+    def build(path: str) -> ContextManager[str]:
+        calls.append(path)
+        started.set()
+        release.wait()
+        return nullcontext(path)
+
+    with ThreadPoolExecutor(2) as executor:
+        first = executor.submit(cache.get, build, build, ("a",))
+        started.wait()
+        second = executor.submit(cache.get, build, build, ("a",))
+        time.sleep(0.02)  # let the second thread wait for the first build
+        release.set()
+        assert first.result() == second.result() == "a"
+    assert calls == ["a"]
@@ -0,0 +1,99 @@
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, Provider, Scope
+from tests.app.factories import async_provider, provider
+from tests.app.services import (
+    AsyncDatabase,
+    Database,
+    DatabaseEngine,
+    Settings,
+    UserManager,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_compiled_build():
+    compiled = provider.compile()
+    source = compiled.source
+    assert "stack.enter_context(" in source
+
+    with compiled.build() as container:
+        assert container.keys() == {Settings, DatabaseEngine, Database}
+        assert container[Database].find() == "db_uri"
+        engine = container[DatabaseEngine]
+        assert engine.is_opened
+    assert not engine.is_opened
+
+    with compiled.build() as other:
+        assert other[DatabaseEngine] is not engine
+
+
+def test_compiled_build_teardown():
+    events: list[str] = []
+
+    @Provider.from_factory(service_type=int)
+    def provide_int() -> Iterator[int]:
+        events.append("enter int")
+        try:
+            yield 1
+        finally:
+            events.append("exit int")
+
+    @provide_int.include_factory(service_type=str)
+    def provide_str(number: int) -> Iterator[str]:
+        events.append("enter str")
+        yield str(number)
+        events.append("exit str")
+
+    @provide_int.include_factory
+    def provide_float(number: int, string: str) -> float:
+        raise ValueError(number, string)
+
+    with pytest.raises(ValueError):
+        with provide_int.compile().build():
+            ...  # pragma: no cover
+    assert events == ["enter int", "enter str", "exit int"]
+
+
+def test_compiled_build_with_initial_services():
+    provider_ = provider | Provider.from_dict({Settings: Settings("other_uri")})
+    with provider_.compile().build() as container:
+        assert container[Database].find() == "other_uri"
+
+
+def test_compiled_build_scope():
+    @Provider.from_factory(service_type=str, scope=Scope.request)
+    def provide_str(settings: Settings) -> Iterator[str]:
+        yield settings.db_uri
+
+    with (provider | provide_str).compile().build() as container:
+        with container.scope() as request:
+            assert request[str] == "db_uri"
+
+
+async def test_compiled_build_async():
+    @AsyncProvider.from_factory(service_type=str)
+    def provide_str(settings: Settings) -> Iterator[str]:
+        yield settings.db_uri
+
+    @provide_str.include_factory
+    async def provide_float() -> float:
+        return 1.0
+
+    @provide_str.include_factory(service_type=int, scope=Scope.request)
+    async def provide_int(number: float) -> AsyncIterator[int]:
+        yield int(number)
+
+    compiled = (provider | async_provider | provide_str).compile()
+    source = compiled.source
+    assert "await stack.enter_async_context(" in source
+
+    async with compiled.build_async() as container:
+        assert await container[UserManager].create_user() == "user"
+        assert await container[AsyncDatabase].find() == "db_uri"
+        assert container[str] == "db_uri"
+        async with container.scope_async() as request:
+            assert request[int] == 1
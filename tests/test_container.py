@@ -0,0 +1,46 @@
+from typing import Optional
+
+import pytest
+
+from snake_di import Provider
+from tests.app.factories import provider
+from tests.app.services import Database, DatabaseEngine, Settings
+
+
+def test_services_equal_to_none():
+    none_provider = Provider.from_dict({str: None})
+
+    @none_provider.include_factory(service_type=int)
+    def provide_optional(_: str) -> Optional[int]:
+        return None
+
+    with none_provider.build() as container:
+        assert container[int] is None
+        assert container[str] is None
+        assert container.resolve(int, str) == (None, None)
+    with none_provider.build(lazy=True) as container:
+        assert container[int] is None
+
+
+def test_resolve():
+    with provider.build() as container:
+        settings, database = container.resolve(Settings, Database)
+        assert settings is container[Settings]
+        assert database is container[Database]
+        assert container.resolve() == ()
+        assert container.resolve(Settings) == (settings,)
+        with pytest.raises(KeyError):
+            container.resolve(Settings, int)
+
+    with provider.build(lazy=True) as container:
+        engine, settings = container.resolve(DatabaseEngine, Settings)
+        assert engine.db_uri == settings.db_uri
+        assert container.keys() == {Settings, DatabaseEngine}
+
+
+def test_missing_service():
+    with provider.build() as container:
+        with pytest.raises(KeyError) as error:
+            container[int]
+        assert error.value.args == (int,)
+        assert container.get(int) is None
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from snake_di import ChromeTrace, Provider, StartupAnalysis, factory_durations
+from snake_di.__main__ import main
+from tests.app.factories import async_provider, provider
+from tests.app.services import Database, DatabaseEngine, Settings
+
+app_provider = provider | async_provider
+diamond = Provider()
+
+
+@diamond.include_factory
+def provide_int() -> int:
+    return 1
+
+
+@diamond.include_factory
+def provide_str(number: int) -> str:
+    return str(number)
+
+
+@diamond.include_factory
+def provide_bytes(number: int) -> bytes:
+    return bytes(number)
+
+
+@diamond.include_factory
+def provide_float(string: str, data: bytes) -> float:
+    return 1.0
+
+
+def test_critical_path():
+    analysis = diamond.analyze_startup({int: 1.0, str: 2.0, bytes: 5.0, float: 1.0})
+    assert analysis.critical_path == (int, bytes, float)
+    assert analysis.minimum_startup == 7.0
+    assert analysis.serial_startup == 9.0
+    assert analysis.earliest_start == {int: 0.0, str: 1.0, bytes: 1.0, float: 6.0}
+    assert analysis.slack == {int: 0.0, str: 3.0, bytes: 0.0, float: 0.0}
+    header, *rows = analysis.report().splitlines()[4:]
+    assert header.startswith("factory  ")
+    assert {len(row.rstrip(" *")) for row in rows} == {len(header)}
+
+    selected = diamond.analyze_startup({int: 1.0, str: 2.0}, only=[str])
+    assert selected.critical_path == (int, str)
+    assert selected.minimum_startup == 3.0
+
+    with pytest.raises(ValueError):
+        diamond.analyze_startup({int: 1.0})
+
+
+def test_empty_plan():
+    analysis = Provider().analyze_startup({})
+    assert analysis == StartupAnalysis({}, {}, {}, (), 0.0, 0.0)
+    assert analysis.report().startswith("Critical path: \n")
+
+
+def test_analyze_traced_build():
+    trace = ChromeTrace()
+    with provider.build(tracer=trace):
+        ...
+    durations = factory_durations(trace.events)
+    assert durations.keys() == {Settings, DatabaseEngine, Database}
+
+    analysis = provider.analyze_startup(durations)
+    assert analysis.critical_path == (Settings, DatabaseEngine, Database)
+    assert set(analysis.slack.values()) == {0.0}
+
+    report = analysis.report()
+    assert "Settings -> DatabaseEngine -> Database" in report
+    assert report.splitlines()[-1].startswith("Database ")
+    assert report.endswith("*")
+
+
+def test_main(capsys, tmp_path):
+    trace_file = tmp_path / "trace.json"
+    main(["tests.app.factories:provider", "--trace", str(trace_file)])
+    assert "Settings -> DatabaseEngine -> Database" in capsys.readouterr().out
+    assert len(json.loads(trace_file.read_text())["traceEvents"]) == 12
+
+    main(["tests.test_critical_path:diamond"])
+    assert "-> float" in capsys.readouterr().out
+
+    main(["tests.test_critical_path:app_provider"])
+    assert "UserManager" in capsys.readouterr().out
+
+    with pytest.raises(TypeError):
+        main(["tests.app.services:Settings"])
+
+
+def test_main_default_attribute(capsys):
+    with pytest.raises(AttributeError):
+        main(["tests.app.services"])
@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from snake_di._fork import _after_fork_in_child, _open_containers
+from tests.app.factories import async_provider, fork_unsafe_provider, provider
+from tests.app.services import (
+    AsyncDatabase,
+    AsyncDatabaseEngine,
+    Database,
+    DatabaseEngine,
+    Settings,
+    UserManager,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_after_fork():
+    with fork_unsafe_provider.build() as container:
+        settings, engine = container[Settings], container[DatabaseEngine]
+        database = container[Database]
+        container.after_fork()
+        assert engine.is_opened
+        assert container[Settings] is settings
+        assert container[DatabaseEngine] is not engine
+        assert container[Database] is not database
+        assert container[Database].engine is container[DatabaseEngine]
+        new_engine = container[DatabaseEngine]
+    assert not new_engine.is_opened
+    assert engine.is_opened
+
+
+def test_refreshed_factory_keeps_fork_safety():
+    with fork_unsafe_provider.build() as container:
+
+        def provide_replica(settings: Settings) -> DatabaseEngine:
+            return DatabaseEngine(settings.db_uri + "_replica", True)
+
+        container.refresh(DatabaseEngine, provide_replica)
+        replica = container[DatabaseEngine]
+        container.after_fork()
+        assert container[DatabaseEngine] is not replica
+        assert container[Database].find() == "db_uri_replica"
+
+
+def test_rebuilt_after_fork_hook():
+    with fork_unsafe_provider.build(rebuild_after_fork=True) as container:
+        engine = container[DatabaseEngine]
+        _after_fork_in_child()
+        assert container[DatabaseEngine] is not engine
+    assert container not in _open_containers.values()
+
+    with pytest.raises(ValueError):
+        with provider.build(lazy=True, rebuild_after_fork=True):
+            ...  # pragma: no cover
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_process():  # pragma: no cover
+    read_fd, write_fd = os.pipe()
+    with fork_unsafe_provider.build(rebuild_after_fork=True) as container:
+        engine, settings = container[DatabaseEngine], container[Settings]
+        pid = os.fork()
+        if pid == 0:
+            is_rebuilt = (
+                container[DatabaseEngine] is not engine
+                and container[Settings] is settings
+                and engine.is_opened
+            )
+            os.write(write_fd, b"1" if is_rebuilt else b"0")
+            os._exit(0)
+        os.close(write_fd)
+        assert os.read(read_fd, 1) == b"1"
+        os.waitpid(pid, 0)
+        os.close(read_fd)
+        assert container[DatabaseEngine] is engine
+    assert not engine.is_opened
+
+
+async def test_aafter_fork():
+    fork_provider = provider | async_provider
+
+    @fork_provider.include_factory(service_type=AsyncDatabaseEngine, fork_safe=False)
+    async def provide_async_engine(settings: Settings):
+        yield AsyncDatabaseEngine(settings.db_uri, True)
+
+    async with fork_provider.build_async() as container:
+        database, user_manager = container[Database], container[UserManager]
+        with pytest.raises(RuntimeError):
+            container.after_fork()
+        await container.aafter_fork()
+        assert container[Database] is database
+        assert container[UserManager] is not user_manager
+        assert await container[AsyncDatabase].find() == "db_uri"
+
+    with fork_unsafe_provider.build() as container:
+        engine = container[DatabaseEngine]
+        await container.aafter_fork()
+        assert container[DatabaseEngine] is not engine
@@ -0,0 +1,74 @@
+import inspect
+
+import pytest
+
+from snake_di import Injector, Provider
+from tests.app.factories import async_provider, provider
+from tests.app.services import Database, Settings, UserManager
+
+pytestmark = pytest.mark.anyio
+
+
+def find(database: Database, settings: Settings, suffix: str = "") -> str:
+    assert database.find() == settings.db_uri
+    return settings.db_uri + suffix
+
+
+def test_container_inject():
+    with provider.build() as container:
+        injected = container.inject(find)
+        assert injected() == "db_uri"
+        assert injected(suffix="!") == "db_uri!"
+        assert injected(settings=Settings("db_uri")) == "db_uri"
+
+
+def test_container_inject_lazy():
+    with provider.build(lazy=True) as container:
+        assert container.inject(find)() == "db_uri"
+
+
+async def test_container_inject_async():
+    async def create_user(user_manager: UserManager, name: str) -> str:
+        return await user_manager.create_user() + name
+
+    async with (provider | async_provider).build_async() as container:
+        injected = container.inject(create_user)
+        assert inspect.iscoroutinefunction(injected)
+        assert await injected(name="!") == "user!"
+
+
+def test_injector_inspects_once():
+    assert Injector.from_callable(find).parameters == {
+        "database": Database,
+        "settings": Settings,
+        "suffix": str,
+    }
+    assert Injector.from_callable(find).parameters is (
+        Injector.from_callable(find).parameters
+    )
+
+    class NotWeakReferencable:
+        __slots__ = ()
+
+        def __call__(self, settings: Settings):
+            ...  # pragma: no cover
+
+    assert Injector.from_callable(NotWeakReferencable()).parameters == {
+        "settings": Settings
+    }
+
+
+def test_provider_injector():
+    provider_ = Provider.merge(provider)
+    injector = provider_.injector(find)
+    assert injector.parameters == {"database": Database, "settings": Settings}
+    assert provider_.injector(find) is injector
+
+    @provider_.include_factory
+    def provide_suffix() -> str:
+        return "?"
+
+    assert provider_.injector(find) is not injector
+    with provider_.build() as container:
+        assert provider_.injector(find).call(container) == "db_uri?"
+        assert injector.call(container) == "db_uri"
@@ -0,0 +1,141 @@
+from functools import partial
+from typing import Awaitable, Callable, Iterator
+
+import anyio
+import pytest
+
+from snake_di import AsyncProvider, Provider
+from tests.app.factories import async_provider, provider
+from tests.app.services import (
+    AsyncDatabase,
+    AsyncDatabaseEngine,
+    Database,
+    DatabaseEngine,
+    Settings,
+    UserManager,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def gather(*calls: Callable[[], Awaitable]) -> list:
+    results: list = [None] * len(calls)
+
+    async def run(index: int, call: Callable[[], Awaitable]):
+        try:
+            results[index] = await call()
+        except Exception as error:
+            results[index] = error
+
+    async with anyio.create_task_group() as task_group:
+        for index, call in enumerate(calls):
+            task_group.start_soon(run, index, call)
+    return results
+
+
+def test_lazy_build():
+    with provider.build(lazy=True) as container:
+        assert container.keys() == set()
+        assert container.get(int) is None
+        assert container[Database].find() == "db_uri"
+        assert container.keys() == {Settings, DatabaseEngine, Database}
+        engine = container[DatabaseEngine]
+    assert engine.is_opened is False
+
+
+def test_lazy_teardown_order():
+    events: list = []
+
+    @Provider.from_factory(service_type=int)
+    def provide_int() -> Iterator[int]:
+        yield 1
+        events.append(int)
+
+    @provide_int.include_factory(service_type=str)
+    def provide_str(_: int) -> Iterator[str]:
+        yield "str"
+        events.append(str)  # pragma: no cover
+
+    @provide_int.include_factory(service_type=float)
+    def provide_float(_: int) -> Iterator[float]:
+        yield 1.0
+        events.append(float)
+
+    with provide_int.build(lazy=True) as container:
+        assert container[float] == 1.0
+    assert events == [float, int]
+
+
+def test_lazy_build_options():
+    with pytest.raises(ValueError):
+        with provider.build(lazy=True, only=[Settings]):
+            ...  # pragma: no cover
+
+
+async def test_lazy_build_async():
+    async with (provider | async_provider).build_async(lazy=True) as container:
+        with pytest.raises(RuntimeError):
+            _ = container[UserManager]
+        user_manager = await container.aget(UserManager)
+        assert user_manager is container[UserManager]
+        assert await container.aget(int) is None
+        assert container.keys() == {
+            Settings,
+            DatabaseEngine,
+            AsyncDatabaseEngine,
+            Database,
+            AsyncDatabase,
+            UserManager,
+        }
+
+    with pytest.raises(ValueError):
+        async with async_provider.build_async(lazy=True, concurrent=True):
+            ...  # pragma: no cover
+
+
+async def test_sync_lazy_container_aget():
+    with provider.build(lazy=True) as container:
+        assert await container.aget(Settings) == Settings("db_uri")
+
+
+async def test_lazy_single_flight():
+    constructions = []
+
+    @AsyncProvider.from_factory
+    async def provide_int() -> int:
+        constructions.append(int)
+        await anyio.sleep(0.01)
+        return 1
+
+    @provide_int.include_factory
+    async def provide_str(number: int) -> str:
+        return str(number)
+
+    async with provide_int.build_async(lazy=True) as container:
+        results = await gather(
+            partial(container.aget, int),
+            partial(container.aget, str),
+            partial(container.aget, int),
+        )
+    assert results == [1, "1", 1]
+    assert constructions == [int]
+
+
+async def test_lazy_failed_construction_is_retried():
+    attempts = []
+
+    @AsyncProvider.from_factory
+    async def provide_int() -> int:
+        attempts.append(int)
+        await anyio.sleep(0.01)
+        if len(attempts) == 1:
+            raise ValueError
+        return 1
+
+    async with provide_int.build_async(lazy=True) as container:
+        results = await gather(
+            partial(container.aget, int), partial(container.aget, int)
+        )
+    # either task may start first, the other one retries after it fails
+    assert sorted(map(repr, results)) == ["1", "ValueError()"]
+    assert len(attempts) == 2
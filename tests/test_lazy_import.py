@@ -0,0 +1,132 @@
+import sys
+
+import pytest
+
+from snake_di import AsyncProvider, Provider
+from tests.app.factories import provider
+from tests.app.services import Database, Settings
+
+pytestmark = pytest.mark.anyio
+
+LAZY_MODULE = "tests.app.lazy_factories"
+LAZY_ENGINE = f"{LAZY_MODULE}:Engine"
+
+
+@pytest.fixture(autouse=True)
+def unimport_lazy_module(monkeypatch):
+    monkeypatch.delitem(sys.modules, LAZY_MODULE, raising=False)
+
+
+@pytest.fixture
+def lazy_provider():
+    # each test imports the lazy module again, so it needs a new provider
+    return provider.copy().include_lazy(
+        f"{LAZY_MODULE}:provide_engine", service_type=LAZY_ENGINE
+    )
+
+
+@pytest.fixture
+def async_lazy_provider():
+    return (provider | AsyncProvider()).include_lazy(
+        f"{LAZY_MODULE}:provide_async_engine", service_type=LAZY_ENGINE
+    )
+
+
+def test_imported_only_when_built(lazy_provider):
+    with lazy_provider.build(only=[Database]) as container:
+        assert container[Database].find() == "db_uri"
+    with lazy_provider.build(lazy=True) as container:
+        assert container[Settings].db_uri == "db_uri"
+    assert LAZY_MODULE not in sys.modules
+
+    with lazy_provider.build() as container:
+        from tests.app.lazy_factories import Engine
+
+        engine = container[Engine]
+        assert engine.is_opened
+    assert not engine.is_opened
+
+
+def test_resolved_once_imported(lazy_provider):
+    merged = lazy_provider | Provider.from_dict({str: "value"})
+    assert LAZY_MODULE not in sys.modules
+    assert "_lazy_factories" not in repr(lazy_provider)
+    assert lazy_provider == provider
+
+    from tests.app.lazy_factories import Engine
+
+    assert Engine in merged
+    assert Engine in lazy_provider.copy()
+    with merged.build(only=[Engine]) as container:
+        assert container[Engine].db_uri == "db_uri"
+
+    @merged.include_factory
+    def provide_settings() -> Settings:
+        return Settings("other")
+
+    with merged.build(lazy=True) as container:
+        assert container[Engine].db_uri == "other"
+
+
+def test_lazy_factory_with_type():
+    from tests.app.lazy_factories import Engine
+
+    lazy_provider = provider.copy().include_lazy(
+        f"{LAZY_MODULE}:provide_engine", service_type=Engine
+    )
+    del sys.modules[LAZY_MODULE]
+    lazy_provider.validate()
+    assert LAZY_MODULE in sys.modules
+
+
+async def test_lazy_async_factory(async_lazy_provider):
+    async with async_lazy_provider.build_async() as container:
+        from tests.app.lazy_factories import Engine
+
+        assert container[Engine].is_opened
+
+    blocking_provider = (provider | AsyncProvider()).include_lazy(
+        f"{LAZY_MODULE}:provide_async_engine",
+        service_type=LAZY_ENGINE,
+        blocking=True,
+    )
+    with pytest.raises(TypeError):
+        async with blocking_provider.build_async():
+            ...  # pragma: no cover
+
+
+def test_invalid_path():
+    with pytest.raises(ValueError):
+        Provider().include_lazy("tests.app.lazy_factories", service_type=Settings)
+    with pytest.raises(ValueError):
+        Provider().include_lazy(f"{LAZY_MODULE}:provide_engine", service_type=":Engine")
+
+
+def test_imported_during_lazy_build(lazy_provider):
+    with lazy_provider.build(lazy=True) as container:
+        assert container[Settings].db_uri == "db_uri"
+        assert LAZY_MODULE not in sys.modules
+        from tests.app.lazy_factories import Engine
+
+        engine = container[Engine]
+        assert engine.is_opened
+    assert not engine.is_opened
+
+
+async def test_imported_during_lazy_async_build(async_lazy_provider):
+    async with async_lazy_provider.build_async(lazy=True) as container:
+        assert await container.aget(int) is None
+        from tests.app.lazy_factories import Engine
+
+        await container.aget(Engine)
+        assert container[Engine].is_opened
+
+
+async def test_compiled_lazy_factories(lazy_provider, async_lazy_provider):
+    with lazy_provider.compile().build() as container:
+        from tests.app.lazy_factories import Engine
+
+        assert container[Engine].is_opened
+
+    async with async_lazy_provider.compile().build_async() as container:
+        assert container[Engine].is_opened
@@ -0,0 +1,90 @@
+import pytest
+
+from benchmarks.graphs import make_providers
+from snake_di import AsyncProvider, Provider, Scope
+from tests.app.factories import async_provider, provider
+from tests.app.services import Database, DatabaseEngine, Settings, UserManager
+
+
+def test_merge():
+    other_settings = Provider.from_dict({Settings: Settings("other_uri")})
+    merged = Provider.merge(provider, other_settings, Provider())
+    assert type(merged) is Provider
+    assert merged == provider | other_settings | Provider()
+    assert Settings not in merged._factories
+
+    restored = Provider.merge(merged, provider)
+    assert restored == provider
+    assert Settings not in restored._container
+
+    providers = make_providers("fan", 100)
+    assert Provider.merge(*providers) == providers[0].merge(*providers)
+    assert len(Provider.merge(*providers)._factories) == 100
+    assert Provider.merge() == Provider()
+
+
+def test_merge_async():
+    merged = Provider.merge(provider, async_provider)
+    assert type(merged) is AsyncProvider
+    assert type(AsyncProvider.merge(provider)) is AsyncProvider
+    assert merged == provider | async_provider
+
+    # sync factories are converted to async ones only once
+    assert (
+        merged._factories[Database]
+        is (provider | async_provider)._factories[Database]
+        is provider._factories[Database].to_async_factory()
+    )
+    assert merged._factories[UserManager] is async_provider._factories[UserManager]
+
+
+def test_include_factory_updates_build_plan():
+    provider_ = Provider.merge(provider)
+    plan = provider_.build_plan()
+    selected_plan = provider_.build_plan(only=[Settings])
+
+    @provider_.include_factory
+    def provide_str(database: Database) -> str:
+        return database.find()
+
+    assert provider_.build_plan().factories == plan.factories + (
+        provider_._factories[str],
+    )
+    assert provider_.build_plan().dependents[Database] == (str,)
+    assert provider_.build_plan(only=[Settings]) is selected_plan
+    with provider_.build() as container:
+        assert container[str] == "db_uri"
+
+    @provider_.include_factory(scope=Scope.request)
+    def provide_bytes(string: str) -> bytes:
+        return string.encode()  # pragma: no cover
+
+    assert provider_.build_plan(only=[Settings]) is selected_plan
+
+    @provider_.include_factory
+    def provide_other_str(engine: DatabaseEngine) -> str:
+        return "other"
+
+    assert provider_.build_plan(only=[Settings]) is not selected_plan
+    assert provider_.build_plan().dependents[DatabaseEngine] == (Database, str)
+
+
+def test_include_unsolvable_factory_drops_build_plan():
+    provider_ = provider.copy()
+    provider_.build_plan()
+
+    @provider_.include_factory
+    def provide_str(number: int) -> str:
+        return str(number)  # pragma: no cover
+
+    with pytest.raises(RuntimeError):
+        provider_.build_plan()
+
+    provider_ = Provider.from_dict({Settings: Settings("db_uri")})
+    provider_.build_plan()
+
+    @provider_.include_factory
+    def provide_settings() -> Settings:
+        return Settings("db_uri")  # pragma: no cover
+
+    assert provider_.build_plan().factories == (provider_._factories[Settings],)
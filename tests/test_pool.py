@@ -0,0 +1,311 @@
+import asyncio
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, Pool, PoolOptions, Provider
+from tests.app.factories import provide_connection, provider
+from tests.app.services import Connection, Connections, Settings
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_checkout_reuses_instances():
+    connections = Connections()
+    provider_ = provider | Provider.from_dict({Connections: connections})
+    pooled = Provider.from_factory(
+        provide_connection, service_type=Connection, pool=PoolOptions(max_size=2)
+    )
+    with (provider_ | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        assert pool.stats().created == 0
+        assert connections == []
+        with pool.checkout() as first, pool.checkout() as second:
+            assert first is not second
+            assert first.db_uri == "db_uri"
+        with pool.checkout() as third:
+            assert third is first  # the most recently returned one
+        stats = pool.stats()
+        assert (stats.size, stats.idle, stats.in_use) == (2, 2, 0)
+        assert (stats.created, stats.closed, stats.checkouts) == (2, 0, 3)
+    assert connections == [first, second]
+    assert not any(connection.is_opened for connection in connections)
+    assert pool.stats().closed == 2
+    with pytest.raises(RuntimeError):
+        with pool.checkout():
+            pass  # pragma: no cover
+
+
+def test_pool_dependency_and_prewarm():
+    connections = Connections()
+    provider_ = provider | Provider.from_dict({Connections: connections})
+    pooled = Provider.from_factory(
+        provide_connection,
+        service_type=Connection,
+        pool=PoolOptions(max_size=3, prewarm=2),
+    )
+
+    @pooled.include_factory
+    def provide_bytes(pool: Pool[Connection]) -> bytes:
+        with pool.checkout() as connection:
+            return connection.db_uri.encode()
+
+    with (provider_ | pooled).build() as container:
+        assert container[bytes] == b"db_uri"
+        assert container[Pool[Connection]].stats().size == 2
+        assert container[Pool[Connection]].stats().created == 2
+        assert len(connections) == 2
+
+
+def test_checkout_waits_for_returned_instance():
+    provider_ = provider | Provider.from_dict({Connections: Connections()})
+    pooled = Provider.from_factory(
+        provide_connection,
+        service_type=Connection,
+        pool=PoolOptions(max_size=1, checkout_timeout=0.01),
+    )
+    with (provider_ | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        borrowed: list = []
+
+        def borrow():
+            with pool.checkout(timeout=5) as connection:
+                borrowed.append(connection)
+
+        with pool.checkout() as connection:
+            with pytest.raises(TimeoutError):
+                with pool.checkout():
+                    pass  # pragma: no cover
+            thread = threading.Thread(target=borrow)
+            thread.start()
+            while not pool.stats().waiters:
+                time.sleep(0.001)
+        thread.join()
+        assert borrowed == [connection]
+        stats = pool.stats()
+        assert (stats.waiters, stats.checkouts) == (0, 2)
+        assert stats.wait_time >= stats.max_wait_time > 0
+
+
+def test_expired_and_unhealthy_instances_are_replaced():
+    connections = Connections()
+    provider_ = provider | Provider.from_dict({Connections: connections})
+    options = PoolOptions(max_size=2, idle_timeout=0.01, max_lifetime=60)
+    pooled = Provider.from_factory(
+        provide_connection, service_type=Connection, pool=options
+    )
+    with (provider_ | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        with pool.checkout():
+            pass
+        time.sleep(0.02)
+        with pool.checkout() as connection:
+            assert connection is connections[1]
+        assert not connections[0].is_opened
+
+        time.sleep(0.02)
+        pool.evict_idle()
+        assert not connections[1].is_opened
+        assert pool.stats().size == 0
+
+    options = PoolOptions(max_size=1, max_lifetime=0.0)
+    pooled = Provider.from_factory(
+        provide_connection, service_type=Connection, pool=options
+    )
+    with (provider_ | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        with pool.checkout() as connection:
+            pass
+        assert not connection.is_opened
+        assert pool.stats().size == 0
+
+    connections = Connections()
+    provider_ = provider | Provider.from_dict({Connections: connections})
+    options = PoolOptions(max_size=1, health_check=lambda connection: connection.db_uri)
+    pooled = Provider.from_factory(
+        provide_connection, service_type=Connection, pool=options
+    )
+    with (provider_ | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        with pool.checkout() as connection:
+            connection.db_uri = ""
+        with pool.checkout() as connection:
+            assert connection is connections[1]
+        assert not connections[0].is_opened
+
+
+def test_failing_instances():
+    calls: list = []
+    provider_ = Provider()
+
+    @provider_.include_factory(pool=PoolOptions(max_size=2, prewarm=2))
+    def provide_str() -> str:
+        calls.append(None)
+        if len(calls) == 2:
+            raise ValueError("can not connect")
+        return "connection"
+
+    with pytest.raises(ValueError):
+        with provider_.build():
+            pass  # pragma: no cover
+
+    provider_ = Provider()
+
+    @provider_.include_factory(service_type=str, pool=PoolOptions(max_size=1))
+    def provide_failing_teardown() -> Iterator[str]:
+        yield "connection"
+        raise ValueError("can not disconnect")
+
+    with pytest.raises(ValueError):
+        with provider_.build() as container:
+            pool = container[Pool[str]]
+            with pool.checkout():
+                pass
+    assert pool.stats().closed == 1
+
+
+def test_pool_options_validation():
+    with pytest.raises(ValueError):
+        PoolOptions(max_size=0)
+    with pytest.raises(ValueError):
+        PoolOptions(max_size=1, prewarm=2)
+
+    async def provide_str() -> str:
+        return ""  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        AsyncProvider().include_factory(provide_str, pool=PoolOptions(max_size=1))
+
+
+@pytest.mark.anyio
+async def test_async_checkout():
+    connections = Connections()
+    provider_ = provider | Provider.from_dict({Connections: connections})
+    pooled = Provider.from_factory(
+        provide_connection, service_type=Connection, pool=PoolOptions(max_size=1)
+    )
+    async with (provider_ | pooled | AsyncProvider()).build_async() as container:
+        pool = container[Pool[Connection]]
+        async with pool.acheckout() as connection:
+            assert connection is connections[0]
+
+        checkout = pool.checkout()
+        checkout.__enter__()
+        asyncio.get_running_loop().call_later(0.01, checkout.__exit__, None, None, None)
+        async with pool.acheckout(timeout=5) as connection:
+            assert connection is connections[0]
+        assert pool.stats().checkouts == 3
+
+
+@pytest.mark.anyio
+async def test_cancelled_async_checkout():
+    provider_ = provider | Provider.from_dict({Connections: Connections()})
+    pooled = Provider.from_factory(
+        provide_connection, service_type=Connection, pool=PoolOptions(max_size=1)
+    )
+    with (provider_ | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        with pool.checkout():
+
+            async def wait_for_checkout():
+                async with pool.acheckout(timeout=5):
+                    ...  # pragma: no cover
+
+            waiter = asyncio.ensure_future(wait_for_checkout())
+            await asyncio.sleep(0.02)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        await asyncio.sleep(0.02)
+        with pool.checkout(timeout=0.2):
+            assert pool.stats().in_use == 1
+        assert pool.stats().in_use == 0
+
+        with pool.checkout():
+            waiter = asyncio.ensure_future(wait_for_checkout())
+            await asyncio.sleep(0.02)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0.01)
+            pool.close()
+        await asyncio.sleep(0.02)
+        assert pool.stats().in_use == 0
+
+
+@pytest.mark.anyio
+async def test_cancelled_async_return():
+    closing, release = threading.Event(), threading.Event()
+
+    @Provider.from_factory(
+        service_type=str, pool=PoolOptions(max_size=1, max_lifetime=0.0)
+    )
+    def provide_str() -> Iterator[str]:
+        yield "connection"
+        closing.set()
+        release.wait(timeout=5)
+
+    with provide_str.build() as container:
+        pool = container[Pool[str]]
+
+        async def use_connection():
+            async with pool.acheckout():
+                pass
+
+        user = asyncio.ensure_future(use_connection())
+        while not closing.is_set():
+            await asyncio.sleep(0.001)
+        user.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await user
+        assert pool.stats().closed == 0
+        release.set()
+        await asyncio.sleep(0.02)
+        assert pool.stats().closed == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio", "trio"])
+async def test_async_checkout_in_thread():
+    threads: list = []
+
+    def is_healthy(connection: Connection) -> bool:
+        threads.append(threading.get_ident())
+        return connection.is_opened
+
+    def provide_connection_in_thread(settings: Settings) -> Iterator[Connection]:
+        threads.append(threading.get_ident())
+        with Connection.open(settings.db_uri) as connection:
+            yield connection
+        threads.append(threading.get_ident())
+
+    options = PoolOptions(max_size=1, health_check=is_healthy)
+    pooled = Provider.from_factory(
+        provide_connection_in_thread, service_type=Connection, pool=options
+    )
+    with (provider | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        async with pool.acheckout() as first:
+            pass
+        async with pool.acheckout() as connection:
+            assert connection is first
+        assert len(threads) == 2  # created, then health checked
+        assert threading.get_ident() not in threads
+
+    threads.clear()
+    options = PoolOptions(max_size=1, max_lifetime=0.0)
+    pooled = Provider.from_factory(
+        provide_connection_in_thread, service_type=Connection, pool=options
+    )
+    with (provider | pooled).build() as container:
+        pool = container[Pool[Connection]]
+        async with pool.acheckout() as connection:
+            pass
+        assert not connection.is_opened
+        assert len(threads) == 2  # created, then closed
+        assert threading.get_ident() not in threads
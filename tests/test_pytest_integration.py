@@ -1,8 +1,16 @@
 import pytest
 
+from snake_di import Provider, Scope
 from snake_di.pytest import pytest_provide, pytest_provide_async
-from tests.app.factories import async_provider, provider
-from tests.app.services import Settings, UserManager
+from tests.app.factories import async_provider, provider, thread_provider
+from tests.app.services import (
+    AsyncDatabase,
+    Client,
+    Database,
+    DatabaseEngine,
+    Settings,
+    UserManager,
+)
 from tests.conftest import ASYNC_FIXTURE_VALUE, SYNC_FIXTURE_VALUE
 
 
@@ -22,3 +30,111 @@ async def test_provide_by_type_async(user_manager: UserManager, async_fixture):
 @pytest.mark.anyio
 async def test_mark():
     assert test_provide_by_type_async.pytestmark == test_mark.pytestmark
+
+
+@Provider.from_factory
+def provide_broken_engine(settings: Settings) -> DatabaseEngine:
+    raise RuntimeError("must not be built")
+
+
+@Provider.from_factory(service_type=str, scope=Scope.request)
+def provide_request_uri(settings: Settings) -> str:
+    return settings.db_uri
+
+
+@pytest_provide(provider | provide_broken_engine | provide_request_uri)
+def test_provide_only_needed(settings: Settings, uri: str):
+    assert settings.db_uri == uri == "db_uri"
+
+
+@pytest_provide_async(async_provider | provider | provide_broken_engine)
+@pytest.mark.anyio
+async def test_provide_only_needed_async(settings: Settings):
+    assert settings.db_uri == "db_uri"
+
+
+@pytest_provide_async(
+    provider | async_provider | provide_broken_engine | provide_request_uri
+)
+@pytest.mark.anyio
+async def test_provide_request_scope_async(uri: str, async_db: AsyncDatabase):
+    assert await async_db.find() == uri
+
+
+@pytest_provide(thread_provider)
+def test_provide_thread_scope(client: Client, database: Database):
+    assert client.engine is database.engine
+    assert client.is_opened
+
+
+SCOPED_CONFTEST = """
+from typing import Iterator
+
+from snake_di import Provider, Scope
+
+provider = Provider()
+
+
+@provider.include_factory(service_type=int)
+def provide_engine() -> Iterator[int]:
+    print("build engine")
+    yield 1
+    print("teardown engine")
+
+
+@provider.include_factory(service_type=list, scope=Scope.request)
+def provide_session(engine: int) -> list:
+    return [engine]
+"""
+
+SCOPED_TESTS = """
+import pytest
+
+from conftest import provider
+from snake_di.pytest import pytest_provide
+
+
+@pytest_provide(provider, scope="{scope}")
+def test_first(engine: int, session: list):
+    session.append("first")
+    print("test", session)
+
+
+class TestClass:
+    @pytest_provide(provider, scope="{scope}")
+    def test_second(self, session: list, request):
+        assert request.node.name == "test_second"
+        print("test", session)
+
+
+@pytest_provide(provider, scope="{scope}")
+@pytest.mark.anyio
+async def test_async(session: list):
+    print("test", session)
+"""
+
+
+@pytest.mark.parametrize(
+    "scope, builds",
+    [("session", 1), ("package", 1), ("module", 2), ("class", 4), ("function", 6)],
+)
+def test_provide_scope(pytester: pytest.Pytester, scope: str, builds: int):
+    pytester.makeconftest(SCOPED_CONFTEST)
+    tests = SCOPED_TESTS.format(scope=scope)
+    package = pytester.mkpydir("package")
+    (package / "test_one.py").write_text(tests)
+    (package / "test_two.py").write_text(tests)
+    result = pytester.runpytest("-s", "-p", "anyio", "-k", "not trio")
+    result.assert_outcomes(passed=6)
+
+    output = result.stdout.str()
+    assert output.count("build engine") == builds
+    assert output.count("teardown engine") == builds
+    assert output.count("test [1, 'first']") == 2
+    assert output.count("test [1]") == 4
+    assert output.rindex("teardown engine") > output.rindex("test [1]")
+
+
+def test_provide_unknown_scope():
+    with pytest.raises(ValueError):
+        pytest_provide(provider, scope="request")
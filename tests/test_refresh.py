@@ -0,0 +1,201 @@
+from typing import Iterator
+
+import pytest
+
+from snake_di import Provider
+from tests.app.factories import async_provider, provider
+from tests.app.services import (
+    AsyncDatabase,
+    AsyncDatabaseEngine,
+    Database,
+    DatabaseEngine,
+    Settings,
+    UserManager,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_refresh():
+    with (provider | Provider.from_dict({str: "unrelated"})).build(
+        parallel_teardown=True
+    ) as container:
+        settings, engine = container[Settings], container[DatabaseEngine]
+        container.refresh(DatabaseEngine)
+        assert not engine.is_opened
+        assert container[Settings] is settings
+        assert container[DatabaseEngine] is not engine
+        assert container[Database].engine is container[DatabaseEngine]
+        assert container[Database].find() == "db_uri"
+        engine = container[DatabaseEngine]
+    assert not engine.is_opened
+
+
+def test_refresh_with_value_or_factory():
+    with provider.build() as container:
+        engine = container[DatabaseEngine]
+        container.refresh(Settings, value=Settings("other_uri"))
+        assert not engine.is_opened
+        assert container[Database].find() == "other_uri"
+        with pytest.raises(ValueError):
+            container.refresh(Settings)
+
+        container.refresh(DatabaseEngine)
+        assert container[Database].find() == "other_uri"
+
+        def provide_engine(settings: Settings) -> Iterator[DatabaseEngine]:
+            with DatabaseEngine.open(settings.db_uri + "_replica") as engine:
+                yield engine
+
+        container.refresh(DatabaseEngine, provide_engine)
+        assert container[Database].find() == "other_uri_replica"
+        engine = container[DatabaseEngine]
+
+        container.refresh(Settings, lambda: Settings("uri"))
+        assert container[Database].find() == "uri_replica"
+        container.refresh(DatabaseEngine, value=DatabaseEngine("test", True))
+        assert container[Database].find() == "test"
+        assert not engine.is_opened
+    assert container[DatabaseEngine].is_opened
+
+
+@pytest.mark.parametrize("parallel_teardown", [False, True])
+def test_refresh_provided_value(parallel_teardown: bool):
+    provided_settings = Provider.from_dict({Settings: Settings("db_uri")})
+    with (provider | provided_settings).build(
+        parallel_teardown=parallel_teardown
+    ) as container:
+        engine, database = container[DatabaseEngine], container[Database]
+        container.refresh(Settings, value=Settings("other_uri"))
+        assert not engine.is_opened
+        assert container[Database] is not database
+        assert container[Database].find() == "other_uri"
+        engine = container[DatabaseEngine]
+    assert not engine.is_opened
+
+
+async def test_arefresh_provided_value():
+    provided_settings = Provider.from_dict({Settings: Settings("db_uri")})
+    async with (
+        provider | async_provider | provided_settings
+    ).build_async() as container:
+        engine = container[AsyncDatabaseEngine]
+        await container.arefresh(Settings, value=Settings("other_uri"))
+        assert not engine.is_opened
+        assert await container[UserManager].async_db.find() == "other_uri"
+        assert container[Database].find() == "other_uri"
+
+
+def test_refresh_errors():
+    with (provider | Provider.from_dict({str: "value"})).build() as container:
+        with pytest.raises(ValueError):
+            container.refresh(Settings, lambda: Settings(""), Settings(""))
+        with pytest.raises(ValueError):
+            container.refresh(int)
+        with pytest.raises(ValueError):
+            container.refresh(str)
+        with pytest.raises(ValueError):
+            container.refresh(str, lambda: "other")
+
+        def provide_settings_from_database(database: Database) -> Settings:
+            return Settings(database.find())  # pragma: no cover
+
+        def provide_settings_from_int(number: int) -> Settings:
+            return Settings(str(number))  # pragma: no cover
+
+        with pytest.raises(ValueError):
+            container.refresh(Settings, provide_settings_from_database)
+        with pytest.raises(ValueError):
+            container.refresh(Settings, provide_settings_from_int)
+        container.refresh(str, value="other")
+        assert container[str] == "other"
+
+    with provider.build(lazy=True) as container:
+        with pytest.raises(RuntimeError):
+            container.refresh(Settings)
+
+
+def test_refresh_teardown_error():
+    refreshed_provider = Provider()
+
+    @refreshed_provider.include_factory(service_type=str)
+    def provide_str() -> Iterator[str]:
+        yield "value"
+        raise KeyError("teardown failed")
+
+    with refreshed_provider.build() as container:
+        with pytest.raises(KeyError):
+            container.refresh(str)
+        assert str not in container.keys()
+
+
+async def test_arefresh():
+    async with (provider | async_provider).build_async() as container:
+        engine, database = container[AsyncDatabaseEngine], container[Database]
+        user_manager = container[UserManager]
+        await container.arefresh(AsyncDatabaseEngine)
+        assert not engine.is_opened
+        assert container[Database] is database
+        assert container[UserManager] is not user_manager
+        assert await container[UserManager].async_db.find() == "db_uri"
+
+        with pytest.raises(RuntimeError):
+            container.refresh(AsyncDatabaseEngine)
+
+        async def failing_teardown(settings: Settings):
+            yield AsyncDatabaseEngine(settings.db_uri, True)
+            raise KeyError("teardown failed")
+
+        await container.arefresh(AsyncDatabaseEngine, failing_teardown)
+        assert await container[AsyncDatabase].find() == "db_uri"
+        with pytest.raises(KeyError):
+            await container.arefresh(AsyncDatabaseEngine)
+
+    with provider.build() as container:
+        await container.arefresh(Settings, value=Settings("other_uri"))
+        assert container[Database].find() == "other_uri"
+
+
+def test_refresh_factory_depending_on_value():
+    refreshed_provider = Provider.from_dict({Settings: Settings("db_uri")})
+
+    @refreshed_provider.include_factory
+    def provide_length(settings: Settings) -> int:
+        return len(settings.db_uri)
+
+    def provide_other_length(settings: Settings) -> int:
+        return len(settings.db_uri) + 1
+
+    with refreshed_provider.build() as container:
+        container.refresh(int, provide_other_length)
+        assert container[int] == 7
+
+
+@pytest.mark.parametrize("parallel_teardown", [False, True])
+def test_refreshed_factory_teardown_order(parallel_teardown: bool):
+    closed: list = []
+    refreshed_provider = Provider()
+
+    def closing(name: str) -> Iterator[str]:
+        yield name
+        closed.append(name)
+
+    @refreshed_provider.include_factory(service_type=int)
+    def provide_a() -> Iterator[str]:
+        yield from closing("A")
+
+    @refreshed_provider.include_factory(service_type=float)
+    def provide_b() -> Iterator[str]:
+        yield from closing("B")
+
+    @refreshed_provider.include_factory(service_type=str)
+    def provide_c(_: int) -> Iterator[str]:
+        yield from closing("C")
+
+    def provide_c2(_: int, __: float) -> Iterator[str]:
+        yield from closing("C2")
+
+    with refreshed_provider.build(parallel_teardown=parallel_teardown) as container:
+        container.refresh(str, provide_c2)
+    assert closed.index("C2") < closed.index("B")
+    assert closed.index("C2") < closed.index("A")
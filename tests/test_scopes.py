@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, DependencyGraphError, Provider, Scope
+from tests.app.factories import async_provider, provider
+from tests.app.services import AsyncDatabase, Database, DatabaseEngine, Settings
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class Session:
+    database: Database
+    is_closed: bool = False
+
+
+@dataclass
+class UnitOfWork:
+    session: Session
+
+
+request_provider = Provider()
+
+
+@request_provider.include_factory(service_type=Session, scope=Scope.request)
+def provide_session(database: Database) -> Iterator[Session]:
+    session = Session(database)
+    yield session
+    session.is_closed = True
+
+
+request_provider.include_factory(
+    UnitOfWork, service_type=UnitOfWork, scope=Scope.request
+)
+
+
+def test_request_scope():
+    with (provider | request_provider).build() as container:
+        assert container.keys() == {Settings, DatabaseEngine, Database}
+
+        with container.scope() as request:
+            assert request.keys() == container.keys() | {Session, UnitOfWork}
+            assert request[Session].database is container[Database]
+            assert request[UnitOfWork].session is request[Session]
+            session = request[Session]
+        assert session.is_closed
+        assert Session not in container.keys()
+
+        with container.scope() as other_request:
+            assert other_request[Session] is not session
+
+        with pytest.raises(RuntimeError):
+            with other_request.scope():
+                ...  # pragma: no cover
+
+
+def test_request_scope_lazy_parent():
+    with (provider | request_provider).build(lazy=True) as container:
+        with container.scope() as request:
+            assert request[UnitOfWork].session.database.find() == "db_uri"
+        assert container.keys() == {Settings, DatabaseEngine, Database}
+
+
+def test_app_factory_can_not_depend_on_request_scope():
+    @Provider.from_factory
+    def provide_str(_: Session) -> str:
+        return "str"  # pragma: no cover
+
+    with pytest.raises(RuntimeError):
+        with (provider | request_provider | provide_str).build():
+            ...  # pragma: no cover
+
+
+def test_validate_request_scope():
+    (provider | request_provider).validate()
+
+    @Provider.from_factory(scope=Scope.request)
+    def provide_str(_: Session, __: float) -> str:
+        return "str"  # pragma: no cover
+
+    @provide_str.include_factory
+    def provide_bytes(_: Session) -> bytes:
+        return b""  # pragma: no cover
+
+    with pytest.raises(DependencyGraphError) as error:
+        (provider | request_provider | provide_str).validate()
+    assert error.value.validation.missing == {float: (str,), Session: (bytes,)}
+
+
+async def test_request_scope_async():
+    @AsyncProvider.from_factory(service_type=str, scope=Scope.request)
+    async def provide_str(database: AsyncDatabase) -> AsyncIterator[str]:
+        yield await database.find()
+
+    async with (provider | async_provider | request_provider | provide_str).build_async(
+        lazy=True
+    ) as container:
+        async with container.scope_async() as request:
+            assert request[str] == "db_uri"
+            assert request[UnitOfWork].session.database is container[Database]
+
+        with pytest.raises(RuntimeError):
+            with container.scope():
+                ...  # pragma: no cover
+
+
+async def test_sync_request_scope_async():
+    with (provider | request_provider).build() as container:
+        async with container.scope_async() as request:
+            assert type(request[UnitOfWork]) is UnitOfWork
@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from snake_di import Provider
+from tests.app.factories import barrier_provider, provider
+from tests.app.services import Database, Events
+
+
+def test_parallel_build():
+    with provider.build(parallel=2) as container:
+        assert container[Database].find() == "db_uri"
+
+
+def test_parallel_build_and_teardown():
+    events = Events()
+    barrier = threading.Barrier(2, timeout=1)
+    provider_ = barrier_provider | Provider.from_dict(
+        {threading.Barrier: barrier, Events: events}
+    )
+    with provider_.build(parallel=2, parallel_teardown=True) as container:
+        assert len(container.keys()) == 5
+    assert events[:2] == ["notifier start", "notifier end"]
+    assert sorted(events[2:4]) == ["queue start", "redis start"]
+
+
+def test_parallel_build_limit():
+    barrier = threading.Barrier(2, timeout=0.05)
+    provider_ = barrier_provider | Provider.from_dict(
+        {threading.Barrier: barrier, Events: Events()}
+    )
+    with pytest.raises(threading.BrokenBarrierError):
+        with provider_.build(parallel=1):
+            ...  # pragma: no cover
+
+    with pytest.raises(ValueError):
+        with provider.build(parallel=0):
+            ...  # pragma: no cover
+
+
+def test_parallel_build_fail_fast():
+    events = []
+    float_started = threading.Event()
+
+    @Provider.from_factory(service_type=int)
+    def provide_int() -> Iterator[int]:
+        try:
+            yield 1
+        finally:
+            events.append("int teardown")
+
+    @provide_int.include_factory
+    def provide_str(_: int) -> str:
+        float_started.wait(timeout=1)
+        raise ValueError
+
+    @provide_int.include_factory(service_type=float)
+    def provide_float(_: int) -> Iterator[float]:
+        float_started.set()
+        time.sleep(0.05)
+        try:
+            yield 1.0
+        finally:
+            events.append("float teardown")
+
+    @provide_int.include_factory
+    def provide_bytes(_: str) -> bytes:
+        events.append("bytes")  # pragma: no cover
+        return b"bytes"  # pragma: no cover
+
+    with pytest.raises(ValueError):
+        with provide_int.build(parallel=2):
+            ...  # pragma: no cover
+    assert events == ["float teardown", "int teardown"]
+
+
+def test_parallel_teardown_errors():
+    @Provider.from_factory(service_type=int)
+    def provide_int() -> Iterator[int]:
+        try:
+            yield 1
+        finally:
+            raise KeyError
+
+    with pytest.raises(KeyError) as error_info:
+        with provide_int.build(parallel_teardown=True):
+            raise ValueError
+    assert type(error_info.value.__context__) is ValueError
+
+    @Provider.from_factory(service_type=int)
+    def provide_suppressing_int() -> Iterator[int]:
+        try:
+            yield 1
+        except ValueError:
+            pass
+
+    with provide_suppressing_int.build(parallel_teardown=True):
+        raise ValueError
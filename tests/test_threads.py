@@ -0,0 +1,131 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, DependencyGraphError, Provider, Scope
+from tests.app.factories import fork_unsafe_provider, thread_provider
+from tests.app.services import Client, Database, DatabaseEngine, Session, Settings
+
+pytestmark = pytest.mark.anyio
+
+THREADS = 32
+LOOKUPS = 200
+
+
+def lookup_many(container) -> Client:
+    barrier.wait()
+    client = container[Client]
+    for _ in range(LOOKUPS):
+        assert container[Client] is client
+        assert container[Session].client is client
+        assert client.engine is container[DatabaseEngine]
+        assert container[Database].find() == "db_uri"
+    return client
+
+
+barrier = threading.Barrier(THREADS)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_thread_local_services_stress(lazy: bool):
+    with thread_provider.build(lazy=lazy, thread_safe=True) as container:
+        with ThreadPoolExecutor(THREADS) as executor:
+            clients = list(executor.map(lookup_many, [container] * THREADS))
+        assert len({id(client) for client in clients}) == THREADS
+        assert len({client.thread for client in clients}) == THREADS
+        assert len({id(client.engine) for client in clients}) == 1
+        assert all(client.is_opened for client in clients)
+    assert not any(client.is_opened for client in clients)
+    assert not clients[0].engine.is_opened
+
+
+def test_thread_local_services_injection():
+    with thread_provider.build() as container:
+
+        @container.inject
+        def handle(session: Session, settings: Settings) -> str:
+            return f"{settings.db_uri}:{session.client.thread}"
+
+        assert handle() == f"db_uri:{threading.get_ident()}"
+        with container.scope() as scope_container:
+            assert scope_container[Client] is container[Client]
+
+
+async def test_thread_local_services_aget():
+    with thread_provider.build() as container:
+        assert await container.aget(Client) is container[Client]
+    with pytest.raises(ValueError):
+        async with (thread_provider | AsyncProvider()).build_async():
+            ...  # pragma: no cover
+
+
+def test_thread_scope_selective_build():
+    with thread_provider.build(only=[Session]) as container:
+        assert container[Session].client.engine.is_opened
+        assert Database not in container.keys()
+
+
+def test_thread_local_services_refresh():
+    with thread_provider.build() as container, ThreadPoolExecutor(1) as executor:
+
+        def get_client() -> Client:
+            return container[Client]
+
+        client, session = container[Client], container[Session]
+        worker_client = executor.submit(get_client).result()
+        container.refresh(Database)
+        assert container[Client] is client
+
+        engine = container[DatabaseEngine]
+        container.refresh(DatabaseEngine)
+        assert not engine.is_opened
+        assert not client.is_opened and not worker_client.is_opened
+        assert container[Client] is not client
+        assert container[Client].engine is container[DatabaseEngine]
+        assert container[Session].client is container[Client]
+        assert container[Session] is not session
+        new_worker_client = executor.submit(get_client).result()
+        assert new_worker_client.engine is container[DatabaseEngine]
+        client = container[Client]
+    assert not client.is_opened and not new_worker_client.is_opened
+
+
+def test_thread_local_services_refresh_errors():
+    @Provider.from_factory(service_type=str, scope=Scope.thread)
+    def provide_name(client: Client) -> Iterator[str]:
+        yield "name"
+        raise KeyError("teardown failed")
+
+    with (thread_provider | provide_name).build() as container:
+        assert container[str] == "name"
+        engine = container[DatabaseEngine]
+        with pytest.raises(KeyError):
+            container.refresh(DatabaseEngine)
+        assert not engine.is_opened
+
+
+def test_thread_local_services_after_fork():
+    with (thread_provider | fork_unsafe_provider).build() as container:
+        client = container[Client]
+        container.after_fork()
+        assert client.is_opened
+        assert container[Client] is not client
+        assert container[Client].engine is container[DatabaseEngine]
+
+
+def test_thread_scope_dependencies():
+    @Provider.from_factory
+    def provide_str(client: Client) -> str:
+        return ""  # pragma: no cover
+
+    with pytest.raises(DependencyGraphError):
+        (thread_provider | provide_str).validate()
+
+
+def test_thread_scope_unsupported():
+    with pytest.raises(ValueError):
+        thread_provider.compile()
+    with pytest.raises(ValueError):
+        (thread_provider | AsyncProvider()).compile()
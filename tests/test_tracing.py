@@ -0,0 +1,155 @@
+import io
+import json
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from snake_di import AsyncProvider, ChromeTrace, Provider, TraceEvent, TraceEventKind
+from tests.app.factories import async_provider, provider
+from tests.app.services import Database, DatabaseEngine, Settings, UserManager
+
+pytestmark = pytest.mark.anyio
+
+
+def test_build_events():
+    events: list[TraceEvent] = []
+    with provider.build(tracer=events.append):
+        assert [(event.kind, event.service_type) for event in events] == [
+            (TraceEventKind.factory_start, Settings),
+            (TraceEventKind.factory_end, Settings),
+            (TraceEventKind.factory_start, DatabaseEngine),
+            (TraceEventKind.factory_end, DatabaseEngine),
+            (TraceEventKind.factory_start, Database),
+            (TraceEventKind.factory_end, Database),
+        ]
+        del events[:]
+
+    assert [(event.kind, event.service_type) for event in events] == [
+        (TraceEventKind.teardown_start, Database),
+        (TraceEventKind.teardown_end, Database),
+        (TraceEventKind.teardown_start, DatabaseEngine),
+        (TraceEventKind.teardown_end, DatabaseEngine),
+        (TraceEventKind.teardown_start, Settings),
+        (TraceEventKind.teardown_end, Settings),
+    ]
+    assert events[2].dependencies == (Settings,)
+    assert all(event.error is None for event in events)
+    timestamps = [event.timestamp for event in events]
+    assert timestamps == sorted(timestamps)
+
+
+def test_error_events():
+    events: list[TraceEvent] = []
+
+    @Provider.from_factory(service_type=int)
+    def provide_int() -> Iterator[int]:
+        try:
+            yield 1
+        finally:
+            raise KeyError
+
+    @provide_int.include_factory
+    def provide_str(number: int) -> str:
+        raise ValueError(number)
+
+    with pytest.raises(KeyError):
+        with provide_int.build(tracer=events.append):
+            ...  # pragma: no cover
+
+    assert [(event.kind, event.service_type) for event in events] == [
+        (TraceEventKind.factory_start, int),
+        (TraceEventKind.factory_end, int),
+        (TraceEventKind.factory_start, str),
+        (TraceEventKind.factory_end, str),
+        (TraceEventKind.teardown_start, int),
+        (TraceEventKind.teardown_end, int),
+    ]
+    assert isinstance(events[3].error, ValueError)
+    assert isinstance(events[5].error, KeyError)
+
+
+def test_lazy_build_and_scope_events():
+    events: list[TraceEvent] = []
+    with provider.build(lazy=True, tracer=events.append) as container:
+        assert not events
+        container[Settings]
+        assert [event.service_type for event in events] == [Settings, Settings]
+        with container.scope():
+            ...
+        assert container[Database]
+    assert {event.service_type for event in events} == {
+        Settings,
+        DatabaseEngine,
+        Database,
+    }
+
+
+async def test_async_build_events():
+    trace = ChromeTrace()
+    async with (provider | async_provider).build_async(tracer=trace):
+        ...
+    built = [
+        event.service_type
+        for event in trace.events
+        if event.kind is TraceEventKind.factory_end
+    ]
+    assert len(built) == 6
+    assert built[-1] is UserManager
+    assert len(trace.events) == 24
+
+
+async def test_async_error_events():
+    events: list[TraceEvent] = []
+
+    @AsyncProvider.from_factory(service_type=int)
+    async def provide_int() -> AsyncIterator[int]:
+        try:
+            yield 1
+        finally:
+            raise KeyError
+
+    @provide_int.include_factory
+    async def provide_str(number: int) -> str:
+        raise ValueError(number)
+
+    with pytest.raises(KeyError):
+        async with provide_int.build_async(tracer=events.append):
+            ...  # pragma: no cover
+
+    assert [event.kind for event in events] == [
+        TraceEventKind.factory_start,
+        TraceEventKind.factory_end,
+        TraceEventKind.factory_start,
+        TraceEventKind.factory_end,
+        TraceEventKind.teardown_start,
+        TraceEventKind.teardown_end,
+    ]
+    assert isinstance(events[3].error, ValueError)
+    assert isinstance(events[5].error, KeyError)
+
+
+def test_chrome_trace_export():
+    trace = ChromeTrace()
+    with provider.build(parallel=2, tracer=trace):
+        ...
+
+    file = io.StringIO()
+    trace.dump(file)
+    exported = json.loads(file.getvalue())
+    assert exported == json.loads(trace.to_json())
+
+    trace_events = exported["traceEvents"]
+    assert len(trace_events) == 12
+    assert trace_events[0]["ts"] == 0
+    begin, end = [event for event in trace_events if event["name"] == "Database"][:2]
+    assert (begin["cat"], begin["ph"]) == ("build", "b")
+    assert (end["cat"], end["ph"]) == ("build", "e")
+    assert begin["id"] == end["id"]
+    assert end["ts"] >= begin["ts"]
+    assert begin["args"] == {"dependencies": ["DatabaseEngine"]}
+
+    trace.events[1] = TraceEvent(
+        TraceEventKind.factory_end, Settings, (), 0.0, 0, ValueError()
+    )
+    assert trace.to_dict()["traceEvents"][1]["args"] == {"error": "ValueError()"}
+    assert ChromeTrace().to_dict()["traceEvents"] == []
@@ -0,0 +1,51 @@
+import pytest
+
+from snake_di import DependencyGraphError, Provider
+from tests.app.factories import invalid_provider
+from tests.app.services import Database, Events, Settings
+
+
+def test_validate():
+    events = Events()
+    provider_ = invalid_provider | Provider.from_dict({Events: events})
+    with pytest.raises(DependencyGraphError) as error:
+        provider_.validate()
+    validation = error.value.validation
+    assert validation.missing == {float: (int, bytes)}
+    assert validation.cycles == ((int, str, int), (bytes, bytes))
+    assert str(error.value) == (
+        "Can not solve the dependency graph:\n"
+        "  float is missing, required by int, bytes\n"
+        "  cycle int -> str -> int\n"
+        "  cycle bytes -> bytes"
+    )
+
+    with pytest.raises(DependencyGraphError) as other_error:
+        with provider_.build():
+            ...  # pragma: no cover
+    assert other_error.value.validation is validation
+    assert events == []
+
+    with provider_.build(only=[Settings]) as container:
+        assert container[Settings].db_uri == "db_uri"
+    assert events == ["settings"]
+
+
+def test_validate_selective_build():
+    with pytest.raises(DependencyGraphError) as error:
+        invalid_provider.build_plan(only=[str, Database])
+    assert error.value.validation.missing == {Database: (), float: (int,)}
+    assert error.value.validation.cycles == ((str, int, str),)
+
+
+def test_validation_cached_until_provider_changes():
+    provider_ = invalid_provider | Provider.from_dict({Events: Events()})
+    with pytest.raises(DependencyGraphError) as error:
+        provider_.validate()
+    validation = error.value.validation
+
+    provider_.include_factory(lambda: 1.0, service_type=float)
+    with pytest.raises(DependencyGraphError) as error:
+        provider_.validate()
+    assert error.value.validation is not validation
+    assert error.value.validation.missing == {}